@@ -0,0 +1,54 @@
+# benchmarks/bench_batch_export.py
+"""
+Export en lot (un PDF par catégorie et par mois) : un seul processus contre le pool complet.
+
+    python -m benchmarks.bench_batch_export --categories 40 --rows-per-pdf 400
+"""
+import argparse
+import os
+import random
+import tempfile
+import time as timer
+from datetime import date
+
+from db.repository import TrainingRepository
+from exporter.batch_exporter import batch_export, format_summary
+from models.training import Training
+
+
+def fill(repository, categories, rows_per_pdf, year, month, seed=42):
+    rng = random.Random(seed)
+    trainings = []
+    for category in categories:
+        for i in range(rows_per_pdf):
+            start = rng.randrange(12 * 60, 21 * 60, 30)
+            trainings.append(Training.from_db_row((None, category, "entraînement collectif",
+                                                   date(year, month, 1 + i % 28).toordinal(), start, start + 60)))
+    repository.add_many(trainings)
+
+
+def run(category_count, rows_per_pdf, workers):
+    categories = [f"Équipe {i:02}" for i in range(category_count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        repository = TrainingRepository(db_path)
+        fill(repository, categories, rows_per_pdf, 2025, 3)
+        repository.close()
+        runs = (("1 processus", 1), (f"{workers or os.cpu_count()} processus", workers))
+        for i, (label, max_workers) in enumerate(runs):
+            out = os.path.join(tmp, f"run_{i}")
+            os.mkdir(out)
+            t0 = timer.perf_counter()
+            results = batch_export(db_path, categories, [(2025, 3)], out, max_workers=max_workers)
+            wall = timer.perf_counter() - t0
+            print(f"{label:<14} {wall:>7.2f} s")
+        print(format_summary(results, wall).splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=40)
+    parser.add_argument("--rows-per-pdf", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=None, help="taille du pool (par défaut : nombre de cœurs)")
+    args = parser.parse_args()
+    run(args.categories, args.rows_per_pdf, args.workers)
@@ -0,0 +1,47 @@
+# benchmarks/bench_batch_memory.py
+"""
+Mémoire occupée par un historique chargé en liste de Training ou en TrainingBatch.
+
+    python -m benchmarks.bench_batch_memory --rows 1000000
+"""
+import argparse
+import time as timer
+import tracemalloc
+
+from benchmarks import synthetic
+from models.training import Training
+from models.training_batch import TrainingBatch
+
+def generate_rows(count):
+    for i, category, description, day, start, end in synthetic.generate_rows(count):
+        # Comme avec SQLite, chaque ligne reçoit sa propre chaîne (join réutilise les descriptions d'un mot)
+        yield (i, category, description.encode().decode(), day, start, end)
+
+
+def measure(label, build, count):
+    tracemalloc.start()
+    t0 = timer.perf_counter()
+    result = build()
+    elapsed = timer.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} {current / 1e6:>10.1f} Mo  ({current / count:>6.0f} o/séance, {elapsed:.2f} s)")
+    return result
+
+
+def run(count, list_count):
+    measure(f"list[Training] x {list_count}",
+            lambda: [Training.from_db_row(row) for row in generate_rows(list_count)], list_count)
+    batch = measure(f"TrainingBatch x {count}", lambda: TrainingBatch.from_rows(generate_rows(count)), count)
+    t0 = timer.perf_counter()
+    batch.filter_keyword("match")
+    print(f"filtre sur le batch : {(timer.perf_counter() - t0) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--list-rows", type=int, default=100_000,
+                        help="taille de la liste de Training mesurée (la mémoire croît linéairement)")
+    args = parser.parse_args()
+    run(args.rows, args.list_rows)
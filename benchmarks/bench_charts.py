@@ -0,0 +1,101 @@
+# benchmarks/bench_charts.py
+"""
+Coût de matplotlib au lancement et à l'ouverture du popup de statistiques.
+
+- lancement : import de ui.weekly_view dans un processus neuf, avec les imports
+  matplotlib d'avant (pyplot + backend Tk au chargement du module) et sans (ui/charts.py) ;
+- popup : camembert construit avec plt.subplots (une figure par ouverture, jamais fermée)
+  ou avec la figure persistante de ui/charts.py, première ouverture puis suivantes ;
+- mémoire : figures ouvertes et mémoire Python après N ouvertures.
+
+Le rendu passe par le backend Agg (pas d'écran nécessaire) ; FigureCanvasTkAgg
+fait le même rendu Agg avant de copier l'image dans le widget.
+
+    python -m benchmarks.bench_charts --runs 5 --opens 50
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import textwrap
+
+COUNTS = {"U11": 12, "U13": 9, "U15": 14, "U17": 7, "Seniors F": 10, "Loisirs": 3}
+
+IMPORT_BEFORE = """
+import time; t0 = time.perf_counter()
+import ui.weekly_view
+import matplotlib.pyplot, matplotlib.backends.backend_tkagg
+print(time.perf_counter() - t0)
+"""
+IMPORT_AFTER = """
+import time; t0 = time.perf_counter()
+import ui.weekly_view
+print(time.perf_counter() - t0)
+"""
+# Ouvertures successives du popup : durée de chacune puis mémoire retenue
+POPUP_BEFORE = """
+import time, tracemalloc
+import matplotlib; matplotlib.use("Agg")
+t0 = time.perf_counter()
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import_time = time.perf_counter() - t0
+tracemalloc.start()
+times = []
+for _ in range({opens}):
+    t0 = time.perf_counter()
+    fig, ax = plt.subplots(figsize=(3.2, 2.5), dpi=100)
+    ax.pie(list({counts}.values()), labels=list({counts}), autopct='%1.0f%%', startangle=90)
+    ax.set_title("Répartition par catégorie")
+    fig.patch.set_facecolor('#f4f6fa')
+    FigureCanvasAgg(fig).draw()
+    times.append(time.perf_counter() - t0)
+print(import_time, times[0], sum(times[1:]) / max(1, len(times) - 1), len(plt.get_fignums()),
+      tracemalloc.get_traced_memory()[0])
+"""
+POPUP_AFTER = """
+import time, tracemalloc
+import matplotlib; matplotlib.use("Agg")
+from ui import charts
+t0 = time.perf_counter()
+import matplotlib.figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import_time = time.perf_counter() - t0
+tracemalloc.start()
+times = []
+for _ in range({opens}):
+    t0 = time.perf_counter()
+    fig = charts.category_pie({counts})
+    FigureCanvasAgg(fig).draw()
+    charts.detach(fig)
+    times.append(time.perf_counter() - t0)
+print(import_time, times[0], sum(times[1:]) / max(1, len(times) - 1), len(charts._charts),
+      tracemalloc.get_traced_memory()[0])
+"""
+
+
+def run_snippet(code):
+    out = subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True, check=True)
+    return [float(value) for value in out.stdout.split()]
+
+
+def run(runs, opens):
+    print("Lancement (import de ui.weekly_view, processus neuf)")
+    for label, code in (("avant (pyplot au chargement)", IMPORT_BEFORE), ("après (matplotlib paresseux)", IMPORT_AFTER)):
+        times = [run_snippet(code)[0] * 1000 for _ in range(runs)]
+        print(f"  {label:<32} médiane {statistics.median(times):>7.0f} ms")
+
+    print(f"\nPopup de statistiques ({opens} ouvertures)")
+    print(f"  {'':<10} {'1re ouverture':>14} {'suivantes':>10} {'figures':>8} {'mémoire':>10}")
+    for label, code in (("avant", POPUP_BEFORE), ("après", POPUP_AFTER)):
+        import_time, first, others, figures, memory = run_snippet(code.format(opens=opens, counts=COUNTS))
+        print(f"  {label:<10} {(import_time + first) * 1000:>11.0f} ms {others * 1000:>7.1f} ms "
+              f"{int(figures):>8} {memory / 1e6:>7.1f} Mo")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="lancements mesurés (médiane)")
+    parser.add_argument("--opens", type=int, default=50, help="ouvertures successives du popup")
+    args = parser.parse_args()
+    run(args.runs, args.opens)
@@ -0,0 +1,77 @@
+# benchmarks/bench_hydration.py
+"""
+Micro-benchmark de l'hydratation des lignes SQLite en objets Training.
+
+- avant : Training(...) validé par pydantic + datetime.strptime sur les heures texte
+- validé : Training(...) validé par pydantic, heures lues en minutes
+- confiance : row factory + Training.from_db_row (model_construct, table minute -> time)
+
+    python -m benchmarks.bench_hydration --rows 50000
+"""
+import argparse
+import sqlite3
+import time as timer
+from datetime import datetime, date, time
+
+from benchmarks.synthetic import generate_rows
+from db.repository import SELECT_COLUMNS, training_row_factory
+from models.training import Training
+
+
+def build(count):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE old (id INTEGER PRIMARY KEY, category TEXT, description TEXT, date TEXT, start_time TEXT, end_time TEXT)")
+    conn.execute("CREATE TABLE trainings (id INTEGER PRIMARY KEY, category TEXT, description TEXT, day INTEGER, start_min INTEGER, end_min INTEGER)")
+    for row in generate_rows(count):
+        i, category, description, day, start, end = row
+        conn.execute("INSERT INTO old VALUES (?, ?, ?, ?, ?, ?)",
+                     (i, category, description, date.fromordinal(day).isoformat(),
+                      f"{start // 60:02}:{start % 60:02}", f"{end // 60:02}:{end % 60:02}"))
+        conn.execute("INSERT INTO trainings VALUES (?, ?, ?, ?, ?, ?)", row)
+    return conn
+
+
+def before(conn):
+    rows = conn.execute("SELECT * FROM old").fetchall()
+    return [Training(id=row[0], category=row[1], description=row[2],
+                     date=date.fromisoformat(row[3]),
+                     start_time=datetime.strptime(row[4], "%H:%M").time(),
+                     end_time=datetime.strptime(row[5], "%H:%M").time()) for row in rows]
+
+
+def validated(conn):
+    rows = conn.execute(SELECT_COLUMNS).fetchall()
+    return [Training(id=row[0], category=row[1], description=row[2],
+                     date=date.fromordinal(row[3]),
+                     start_time=time(row[4] // 60, row[4] % 60),
+                     end_time=time(row[5] // 60, row[5] % 60)) for row in rows]
+
+
+def trusted(conn):
+    cur = conn.cursor()
+    cur.row_factory = training_row_factory
+    return cur.execute(SELECT_COLUMNS).fetchall()
+
+
+def run(count, repeat):
+    conn = build(count)
+    reference = None
+    for label, func in (("avant (strptime + validation)", before),
+                        ("validé (minutes + validation)", validated),
+                        ("confiance (row factory)", trusted)):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = timer.perf_counter()
+            result = func(conn)
+            best = min(best, timer.perf_counter() - t0)
+        assert len(result) == count
+        reference = reference or best
+        print(f"{label:<32} {count / best:>12,.0f} lignes/s  (x{reference / best:.1f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,97 @@
+# benchmarks/bench_pdf_export.py
+"""
+Export PDF de 5 000 séances : ancien rendu (tout redessiné à la main, sans mesure du texte)
+contre le rendu à base de formulaires XObject et de découpage mémorisé.
+
+    python -m benchmarks.bench_pdf_export --rows 5000
+"""
+import argparse
+import os
+import tempfile
+import time as timer
+
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+
+from benchmarks.synthetic import generate_rows
+from exporter.pdf_exporter import render_trainings_pdf
+from models.training import Training
+
+def legacy_render(trainings, filename):
+    # Rendu d'origine : en-têtes redessinés, drawString("") pour les lignes de suite, aucun découpage
+    c = canvas.Canvas(filename, pagesize=A4)
+    width, height = A4
+    margin = 40
+    y = height - margin
+    c.setFillColorRGB(0.18, 0.32, 0.52)
+    c.roundRect(margin-10, y-20, width-2*margin+20, 40, 10, fill=1, stroke=0)
+    c.setFillColor(colors.white)
+    c.setFont("Helvetica-Bold", 18)
+    c.drawCentredString(width / 2, y, "Planning des Entraînements")
+    y -= 40
+    c.setFillColorRGB(0.95, 0.95, 0.98)
+    c.roundRect(margin-5, y-35, width-2*margin+10, 32, 8, fill=1, stroke=0)
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica", 11)
+    c.drawString(margin, y-18, "Période")
+    c.drawRightString(width-margin, y-18, f"Nombre de séances : {len(trainings)}")
+    y -= 45
+    c.setFillColorRGB(0.85, 0.89, 0.98)
+    c.roundRect(margin-2, y-18, width-2*margin+4, 22, 5, fill=1, stroke=0)
+    c.setFillColor(colors.HexColor("#2d3a4a"))
+    c.setFont("Helvetica-Bold", 12)
+    for x, label in ((0, "Date"), (80, "Heure"), (170, "Catégorie"), (300, "Description")):
+        c.drawString(margin + x, y-5, label)
+    y -= 25
+    c.setFont("Helvetica", 10)
+    c.setFillColor(colors.black)
+    row_height = 14
+    for t in trainings:
+        desc_lines = t.description.splitlines() if t.description else [""]
+        nb_lines = max(1, len(desc_lines))
+        total_height = nb_lines * row_height + 2
+        if y - total_height < margin + 40:
+            c.showPage()
+            y = height - margin - 60
+        c.setFillColor(colors.HexColor("#f7f7f9"))
+        c.roundRect(margin-2, y-total_height+row_height, width-2*margin+4, total_height, 3, fill=1, stroke=0)
+        c.setFillColor(colors.black)
+        y_line = y + 2
+        c.drawString(margin, y_line, t.date.strftime('%d/%m/%Y'))
+        c.drawString(margin + 80, y_line, f"{t.start_time.strftime('%H:%M')} – {t.end_time.strftime('%H:%M')}")
+        c.drawString(margin + 170, y_line, t.category)
+        first = True
+        for line in desc_lines:
+            c.drawString(margin + 300, y_line, line)
+            if first:
+                first = False
+            else:
+                c.drawString(margin, y_line, "")
+                c.drawString(margin + 80, y_line, "")
+                c.drawString(margin + 170, y_line, "")
+            y_line -= row_height
+        y -= total_height + 2
+    c.save()
+
+
+def run(count, repeat):
+    trainings = [Training.from_db_row(row) for row in generate_rows(count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, render in (("ancien rendu", lambda f: legacy_render(trainings, f)),
+                              ("formulaires + découpage", lambda f: render_trainings_pdf(trainings, f, "Période", count))):
+            filename = os.path.join(tmp, "out.pdf")
+            best = float("inf")
+            for _ in range(repeat):
+                t0 = timer.perf_counter()
+                render(filename)
+                best = min(best, timer.perf_counter() - t0)
+            print(f"{label:<26} {best * 1000:>8.0f} ms  {os.path.getsize(filename) / 1024:>8.0f} Ko")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
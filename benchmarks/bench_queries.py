@@ -0,0 +1,80 @@
+# benchmarks/bench_queries.py
+"""
+Mesure le temps des requêtes semaine / mois quand le nombre de séances augmente.
+
+Compare l'ancien schéma (dates en texte, sans index) au schéma migré
+(jours / minutes en entiers + index composites).
+
+    python -m benchmarks.bench_queries --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time as timer
+from datetime import date, timedelta
+
+from benchmarks.synthetic import REFERENCE_DAY, generate_rows
+from db.migrations import apply_migrations
+
+OLD_WEEK = "SELECT * FROM trainings WHERE date BETWEEN ? AND ?"
+OLD_MONTH = "SELECT * FROM trainings WHERE category=? AND date BETWEEN ? AND ? ORDER BY date, start_time"
+NEW_WEEK = ("SELECT id, category, description, day, start_min, end_min FROM trainings "
+            "WHERE day BETWEEN ? AND ? ORDER BY day, start_min")
+NEW_MONTH = ("SELECT id, category, description, day, start_min, end_min FROM trainings "
+             "WHERE category = ? AND day BETWEEN ? AND ? ORDER BY day, start_min")
+
+
+def old_rows(count):
+    # Ancien schéma : dates et heures en texte
+    for _, category, description, day, start, end in generate_rows(count):
+        yield (category, description, date.fromordinal(day).isoformat(),
+               f"{start // 60:02}:{start % 60:02}", f"{end // 60:02}:{end % 60:02}")
+
+
+def build_database(path, count):
+    conn = sqlite3.connect(path)
+    conn.execute('''CREATE TABLE trainings (
+        id INTEGER PRIMARY KEY, category TEXT, description TEXT,
+        date TEXT, start_time TEXT, end_time TEXT)''')
+    conn.executemany("INSERT INTO trainings (category, description, date, start_time, end_time) VALUES (?, ?, ?, ?, ?)",
+                     old_rows(count))
+    conn.commit()
+    return conn
+
+
+def best_of(conn, sql, params, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = timer.perf_counter()
+        conn.execute(sql, params).fetchall()
+        best = min(best, timer.perf_counter() - t0)
+    return best * 1000
+
+
+def run(sizes, repeat):
+    print(f"{'séances':>10} | {'semaine avant':>14} | {'semaine après':>14} | {'mois avant':>11} | {'mois après':>11}  (ms)")
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = build_database(os.path.join(tmp, "bench.db"), count)
+            # Semaine / mois de référence : même densité quelle que soit la taille de l'historique
+            week_start = REFERENCE_DAY - timedelta(days=REFERENCE_DAY.weekday())
+            week_end = week_start + timedelta(days=6)
+            month_start = REFERENCE_DAY.replace(day=1)
+            month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+            old_week = best_of(conn, OLD_WEEK, (week_start.isoformat(), week_end.isoformat()), repeat)
+            old_month = best_of(conn, OLD_MONTH, ("U15", month_start.isoformat(), month_end.isoformat()), repeat)
+            apply_migrations(conn)
+            new_week = best_of(conn, NEW_WEEK, (week_start.toordinal(), week_end.toordinal()), repeat)
+            new_month = best_of(conn, NEW_MONTH, ("U15", month_start.toordinal(), month_end.toordinal()), repeat)
+            conn.close()
+        print(f"{count:>10} | {old_week:>14.3f} | {new_week:>14.3f} | {old_month:>11.3f} | {new_month:>11.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,88 @@
+# benchmarks/bench_startup.py
+"""
+Temps jusqu'au premier affichage, vérifié contre un budget.
+
+Lance plusieurs fois `main.py --profile-startup --quit-after-startup` dans un processus neuf
+(sur une copie de trainings.db), retient la médiane de chaque phase et échoue (code 1)
+si le total dépasse le budget. Sans écran (pas de Tk), seules les phases
+imports + base de données sont mesurées, contre le même budget.
+
+    python -m benchmarks.bench_startup --runs 5 --budget-ms 1000
+"""
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time as timer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASE_LINE = re.compile(r"^\s+(.+?)\s+([\d.]+) ms$")
+
+# Phases sans Tk, mesurées comme dans main.py
+HEADLESS_SNIPPET = """
+from utils.startup_profile import startup_profile
+startup_profile.enabled = True
+with startup_profile.phase("imports"):
+    from ui.weekly_view import WeeklyPlanner
+    from ui.charts import release_charts
+    from db.database import get_repository
+with startup_profile.phase("base de données (ouverture, schéma)"):
+    get_repository()
+print(startup_profile.report())
+"""
+
+
+def run_once(workdir, headless):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    command = ([sys.executable, "-c", HEADLESS_SNIPPET] if headless else
+               [sys.executable, os.path.join(ROOT, "main.py"), "--profile-startup", "--quit-after-startup"])
+    t0 = timer.perf_counter()
+    out = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+    wall = timer.perf_counter() - t0
+    if out.returncode != 0:
+        return None, out.stderr
+    phases = {}
+    for line in out.stdout.splitlines():
+        match = PHASE_LINE.match(line)
+        if match:
+            phases[match.group(1)] = float(match.group(2))
+    phases["processus complet (avec l'interpréteur)"] = wall * 1000
+    return phases, ""
+
+
+def run(runs, budget_ms):
+    with tempfile.TemporaryDirectory() as workdir:
+        if os.path.exists(os.path.join(ROOT, "trainings.db")):
+            shutil.copy(os.path.join(ROOT, "trainings.db"), workdir)
+        headless = False
+        samples = []
+        for _ in range(runs):
+            phases, error = run_once(workdir, headless)
+            if phases is None and not headless and "TclError" in error:
+                print("Pas d'affichage disponible : mesure des phases sans Tk uniquement.\n")
+                headless = True
+                phases, error = run_once(workdir, headless)
+            if phases is None:
+                print(error)
+                return 2
+            samples.append(phases)
+
+    print(f"{'phase':<44} {'médiane':>10}")
+    for name in samples[0]:
+        print(f"{name:<44} {statistics.median(s[name] for s in samples):>7.1f} ms")
+    total = statistics.median(s["total jusqu’au premier affichage"] for s in samples)
+    verdict = "OK" if total <= budget_ms else "DÉPASSÉ"
+    print(f"\nbudget {budget_ms:.0f} ms : {total:.0f} ms -> {verdict}")
+    return 0 if total <= budget_ms else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    args = parser.parse_args()
+    sys.exit(run(args.runs, args.budget_ms))
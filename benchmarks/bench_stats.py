@@ -0,0 +1,76 @@
+# benchmarks/bench_stats.py
+"""
+Temps de calcul des statistiques sur un mois, une saison, un an et tout l'historique :
+chargement des séances puis comptage en Python (ancienne méthode du popup),
+totaux lus dans daily_stats (agrégats par jour et catégorie) et carte de chaleur
+jour x heure, seul calcul qui relit les séances.
+
+    python -m benchmarks.bench_stats --per-day 40 --years 5
+"""
+import argparse
+import os
+import tempfile
+import time as timer
+from collections import Counter
+from datetime import date
+
+from benchmarks.synthetic import LAST_DAY, REFERENCE_DAY, first_day, generate_trainings
+from db.repository import TrainingRepository
+from stats import training_stats
+
+
+def timed(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = timer.perf_counter()
+        func()
+        best = min(best, timer.perf_counter() - t0)
+    return best * 1000
+
+
+def python_stats(repo, start, end):
+    # Ancienne méthode : toutes les séances remontent, puis comptage ligne par ligne
+    batch = repo.get_batch(start, end)
+    per_category = Counter(batch.categories[code] for code in batch.category_codes)
+    per_week = Counter(date.fromordinal(day).isocalendar()[1] for day in batch.days)
+    return per_category, per_week
+
+
+def aggregate_stats(repo, start, end):
+    training_stats.summary(start, end, repository=repo)
+    training_stats.by_category(start, end, repository=repo)
+    training_stats.by_iso_week(start, end, repository=repo)
+
+
+def run(per_day, years):
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = TrainingRepository(os.path.join(tmp, "bench.db"))
+        total = per_day * 365 * years
+        repo.add_many(generate_trainings(total, per_day))
+        periods = [
+            ("mois", training_stats.month_period(REFERENCE_DAY)),
+            ("saison", training_stats.season_period(REFERENCE_DAY)),
+            ("année", training_stats.year_period(REFERENCE_DAY)),
+            ("historique", (first_day(total, per_day), LAST_DAY)),
+        ]
+        print(f"{'période':<12} {'séances':>10} {'Python (ms)':>12} {'agrégats (ms)':>14} {'carte (ms)':>11}")
+        for label, (start, end) in periods:
+            count = repo.count_range(start, end)
+            heatmap = timed(lambda: training_stats.weekday_hour_heatmap(start, end, repository=repo))
+            print(f"{label:<12} {count:>10} {timed(lambda: python_stats(repo, start, end)):>12.1f} "
+                  f"{timed(lambda: aggregate_stats(repo, start, end)):>14.1f} {heatmap:>11.1f}")
+
+        start, end = periods[2][1]
+        print()
+        for name in ("summary", "by_category", "by_iso_week", "by_month", "weekday_hour_heatmap", "weekly_trend"):
+            func = getattr(training_stats, name)
+            print(f"{name:<22} {timed(lambda: func(start, end, repository=repo)):>8.2f} ms (année)")
+        repo.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-day", type=int, default=40, help="séances par jour")
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+    run(args.per_day, args.years)
@@ -0,0 +1,64 @@
+# benchmarks/bench_writes.py
+"""
+Compare l'écriture ligne par ligne (un commit par séance) et l'écriture groupée
+(executemany dans une seule transaction).
+
+    python -m benchmarks.bench_writes --count 100000
+"""
+import argparse
+import os
+import tempfile
+import time as timer
+from datetime import timedelta
+
+from benchmarks.synthetic import generate_trainings
+from db.repository import TrainingRepository
+
+
+def timed(label, func, count):
+    t0 = timer.perf_counter()
+    func()
+    elapsed = timer.perf_counter() - t0
+    print(f"{label:<38} {elapsed * 1000:>10.1f} ms  ({count / elapsed:>12,.0f} lignes/s)")
+    return elapsed
+
+
+def run(count, single_count):
+    trainings = list(generate_trainings(count))
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = TrainingRepository(os.path.join(tmp, "bench.db"))
+
+        sample = trainings[:single_count]
+        def one_by_one():
+            for t in sample:
+                repo.add(t)
+        per_row = timed(f"add() x {single_count} (1 commit/ligne)", one_by_one, single_count)
+        print(f"{'  -> extrapolé à ' + str(count):<38} {per_row / single_count * count * 1000:>10.1f} ms")
+
+        timed(f"add_many() x {count}", lambda: repo.add_many(trainings), count)
+
+        ids = [row[0] for row in repo.connection().execute("SELECT id FROM trainings ORDER BY id")]
+        for t, training_id in zip(trainings, ids[single_count:]):
+            t.id = training_id
+        timed(f"update_many() x {count} (inchangées)", lambda: repo.update_many(trainings), count)
+        moved = [t.model_copy(update={"date": t.date + timedelta(days=7)}) for t in trainings]
+        timed(f"update_many() x {count} (décalées)", lambda: repo.update_many(moved), count)
+        renamed = [t.model_copy(update={"description": "séance décalée"}) for t in moved]
+        timed(f"update_many() x {count} (renommées)", lambda: repo.update_many(renamed), count)
+        timed(f"delete_many() x {len(ids)}", lambda: repo.delete_many(ids), len(ids))
+
+        def with_batch():
+            with repo.batch():
+                for t in sample:
+                    repo.add(t)
+        timed(f"add() x {single_count} dans batch()", with_batch, single_count)
+        repo.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--single-count", type=int, default=1_000,
+                        help="nombre de séances écrites une par une (le résultat est extrapolé)")
+    args = parser.parse_args()
+    run(args.count, args.single_count)
@@ -0,0 +1,160 @@
+# benchmarks/headless.py
+"""
+Affichage sans écran pour les benchmarks.
+
+StubCanvas imite les méthodes du canvas Tk utilisées par WeekRenderer, OverviewRenderer et
+FadeAnimator (création, coords, move, itemconfig, tags...) sans rien dessiner : on mesure
+le travail Python du rendu et le nombre d'appels au canvas. headless_planner construit un WeeklyPlanner
+sur ce canvas, sans fenêtre Tk.
+
+Avec un serveur X virtuel, la suite peut aussi utiliser un vrai Tk :
+
+    xvfb-run python -m benchmarks.suite --tk
+"""
+import itertools
+from collections import Counter
+
+from ui.animation import FadeAnimator
+from ui.perf_overlay import PerfOverlay
+from ui.week_loader import WeekLoader
+from ui.week_renderer import WeekRenderer
+from ui.weekly_view import WeeklyPlanner
+
+
+class StubCanvas:
+    def __init__(self, width=980, height=880):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.calls = Counter()
+        self._ids = itertools.count(1)
+
+    def _create(self, kind, *args, **kwargs):
+        self.calls["create"] += 1
+        item = next(self._ids)
+        self.items[item] = {"kind": kind, "coords": args, "options": kwargs, "tags": set(_tags(kwargs))}
+        return item
+
+    def create_rectangle(self, *args, **kwargs):
+        return self._create("rectangle", *args, **kwargs)
+
+    def create_text(self, *args, **kwargs):
+        return self._create("text", *args, **kwargs)
+
+    def create_line(self, *args, **kwargs):
+        return self._create("line", *args, **kwargs)
+
+    def coords(self, item, *args):
+        self.calls["coords"] += 1
+        if args:
+            self.items[item]["coords"] = args
+
+    def itemconfig(self, item, **kwargs):
+        self.calls["itemconfig"] += 1
+        for target in self._find(item):
+            self.items[target]["options"].update(kwargs)
+
+    def delete(self, *items):
+        self.calls["delete"] += 1
+        for item in items:
+            for target in self._find(item):
+                del self.items[target]
+
+    def tag_bind(self, item, sequence=None, func=None, add=None):
+        self.calls["tag_bind"] += 1
+
+    def addtag_withtag(self, tag, item):
+        for target in self._find(item):
+            self.items[target]["tags"].add(tag)
+
+    def dtag(self, item, tag=None):
+        for target in self._find(item):
+            self.items[target]["tags"].discard(tag if tag is not None else item)
+
+    def find_withtag(self, item):
+        return tuple(self._find(item))
+
+    def _find(self, item):
+        if isinstance(item, int):
+            return [item] if item in self.items else []
+        return [i for i, data in self.items.items() if item in data["tags"]]
+
+    def move(self, item, dx, dy):
+        self.calls["move"] += 1
+        for target in self._find(item):
+            coords = self.items[target]["coords"]
+            self.items[target]["coords"] = tuple(c + (dx if i % 2 == 0 else dy) for i, c in enumerate(coords))
+
+    def tag_raise(self, item, above=None):
+        pass
+
+    def bbox(self, item):
+        xs, ys = [], []
+        for target in self._find(item):
+            coords = self.items[target]["coords"]
+            xs += coords[0::2]
+            ys += coords[1::2]
+        return (min(xs), min(ys), max(xs), max(ys)) if xs else None
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def config(self, **kwargs):
+        pass
+
+    configure = config
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    # FadeAnimator : pas de boucle d'événements, les étapes ne sont jamais exécutées
+    def after(self, delay, func=None, *args):
+        return "after#stub"
+
+    def after_cancel(self, job):
+        pass
+
+
+def _tags(options):
+    tags = options.get("tags", ())
+    return (tags,) if isinstance(tags, str) else tags
+
+
+class StubLabel:
+    def config(self, **kwargs):
+        self.options = kwargs
+
+
+class StubVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def headless_planner(current_date, canvas=None):
+    """WeeklyPlanner dont draw_table / draw_trainings travaillent sur un StubCanvas (aucune fenêtre)."""
+    planner = WeeklyPlanner.__new__(WeeklyPlanner)  # sans tk.Frame.__init__ : pas d'interpréteur Tcl
+    planner.current_date = current_date
+    planner.category_colors = {}
+    planner.canvas = canvas or StubCanvas()
+    planner.month_year_label = StubLabel()
+    planner.search_var = StubVar()
+    planner.renderer = WeekRenderer(planner.canvas, lambda col, row: None, lambda training: None)
+    planner.animator = FadeAnimator(planner.canvas)
+    planner.perf_overlay = PerfOverlay(planner.canvas)
+    # Chargement direct dans le thread appelant : pas de boucle Tk pour relever les résultats
+    planner.loader = WeekLoader(planner.canvas, planner.on_month_loaded, threaded=False)
+    planner._month_batch = None
+    planner._batch_month = None
+    planner._week_trainings = []
+    planner._trainings_week = None
+    planner._fade_events = False
+    return planner
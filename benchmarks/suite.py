@@ -0,0 +1,266 @@
+# benchmarks/suite.py
+"""
+Suite de benchmarks des chemins critiques, sans écran, résultats en JSON.
+
+Sur une base synthétique (benchmarks/synthetic.py) de --rows séances :
+requêtes semaine / mois (cache froid et chaud), contrôle de chevauchement, draw_table (premier dessin, changement
+de taille, changement de semaine), création des éléments par draw_trainings, vue d'ensemble d'une
+saison (chargement, défilement, zoom), découpage du texte, statistiques d'une saison et export PDF d'un mois.
+
+    python -m benchmarks.suite --rows 100000 --output bench.json
+    python -m benchmarks.suite --rows 100000 --compare bench.json   # écart avec un résultat précédent
+
+Avec --compare, le code de sortie vaut 1 si une mesure est plus lente que
+--threshold fois la référence.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+import db.database as database
+from benchmarks.headless import StubCanvas, headless_planner
+from benchmarks.synthetic import REFERENCE_DAY, build_database
+from models.training import Training
+from ui.redraw_scheduler import DATA, LAYOUT
+
+# En dessous, une mesure est dominée par le bruit : elle n'est pas comparée à la référence
+MIN_COMPARABLE_MS = 0.05
+
+
+def measure(func, repeat, setup=None):
+    """Durées (ms) de repeat appels à func ; setup() est appelé avant chacun, hors mesure."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = timer.perf_counter()
+        result = func()
+        times.append((timer.perf_counter() - t0) * 1000)
+    return times, result
+
+
+def summarize(times, **extra):
+    return dict({"median_ms": statistics.median(times), "min_ms": min(times), "max_ms": max(times),
+                 "runs": len(times)}, **extra)
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def bench_queries(results, repeat):
+    day = REFERENCE_DAY
+    cold = database.cache.clear
+    times, week = measure(lambda: database.get_trainings_for_week(day), repeat, setup=cold)
+    results["db.week.cold"] = summarize(times, rows=len(week))
+    times, _ = measure(lambda: database.get_trainings_for_week(day), repeat)
+    results["db.week.warm"] = summarize(times, rows=len(week))
+    times, month = measure(lambda: database.get_trainings_for_month(day.year, day.month, "toutes"), repeat, setup=cold)
+    results["db.month.cold"] = summarize(times, rows=len(month))
+    times, batch = measure(lambda: database.get_batch_for_month(day.year, day.month), repeat, setup=cold)
+    results["db.month_batch.cold"] = summarize(times, rows=len(batch))
+    # Contrôle de chevauchement d'une nouvelle séance (toutes catégories, même jour)
+    candidate = Training(category="U15", description="", date=day, start_time=time(18), end_time=time(19, 30))
+    times, conflicts = measure(lambda: database.find_conflicts(candidate), repeat)
+    results["db.find_conflicts"] = summarize(times, rows=len(conflicts))
+
+
+def make_canvas(use_tk):
+    if not use_tk:
+        return StubCanvas()
+    import tkinter as tk
+    root = tk.Tk()
+    root.geometry("980x960")
+    canvas = tk.Canvas(root, width=980, height=880)
+    canvas.pack()
+    root.update()
+    return canvas
+
+
+def bench_rendering(results, repeat, use_tk):
+    day = REFERENCE_DAY
+
+    # Premier dessin : grille + événements, sur un canvas neuf
+    planners = []
+    def fresh():
+        database.cache.clear()
+        planners.append(headless_planner(day, make_canvas(use_tk)))
+    times, _ = measure(lambda: planners[-1].draw_table(), repeat, setup=fresh)
+    planner = planners[-1]
+    results["ui.draw_table.first"] = summarize(times, **planner.renderer.last_stats)
+
+    def resize():
+        planner.canvas.width = getattr(planner.canvas, "width", 980) + 7
+    times, _ = measure(lambda: planner.draw_table(frozenset((LAYOUT,))), repeat,
+                       setup=resize if not use_tk else None)
+    results["ui.draw_table.resize"] = summarize(times, **planner.renderer.last_stats)
+
+    weeks = [day - timedelta(days=7 * i) for i in range(1, repeat + 1)]
+    def next_week():
+        planner.current_date = weeks.pop()
+    times, _ = measure(lambda: planner.draw_table(frozenset((DATA,))), repeat, setup=next_week)
+    # Liaisons Tcl enregistrées depuis la création du canvas (constant : liaisons posées sur les tags)
+    tag_binds = {} if use_tk else {"tag_bind": planner.canvas.calls["tag_bind"]}
+    results["ui.draw_table.week_change"] = summarize(times, **planner.renderer.last_stats, **tag_binds)
+
+    # draw_trainings seul : affichage des événements de la semaine (grille déjà en place ;
+    # les éléments viennent du pool du renderer, remplis par la frame précédente)
+    def empty():
+        planner.renderer.render_events([])
+        planner.current_date = day
+        planner.load_trainings()
+    times, _ = measure(lambda: planner.draw_trainings(slot_width=131, slot_height=41), repeat, setup=empty)
+    results["ui.draw_trainings.create"] = summarize(times, events=len(planner._week_trainings),
+                                                    created=planner.renderer.stats["created"],
+                                                    recycled=planner.renderer.stats["recycled"])
+
+
+def bench_wrap_text(results, repeat):
+    from ui import text_layout
+    start, end = REFERENCE_DAY - timedelta(days=90), REFERENCE_DAY
+    descriptions = list(database.get_batch_for_range(start, end).descriptions)
+    font = ("Segoe UI", 9)
+    def wrap_all():
+        for description in descriptions:
+            for width in (50, 90, 120):
+                text_layout.wrap(description, font, width)
+    # Froid : découpages recalculés (largeurs de caractères déjà connues) ; chaud : LRU
+    times, _ = measure(wrap_all, repeat, setup=text_layout.wrap.cache_clear)
+    results["ui.wrap_text"] = summarize(times, calls=3 * len(descriptions))
+    times, _ = measure(wrap_all, repeat)
+    results["ui.wrap_text.warm"] = summarize(times, calls=3 * len(descriptions))
+
+
+def bench_overview(results, repeat, use_tk):
+    from stats import training_stats
+    from ui.overview_view import OverviewRenderer, load_overview
+    start, end = training_stats.season_period(REFERENCE_DAY)
+    times, per_day = measure(lambda: load_overview(start, end), repeat)
+    results["ui.overview.load_season"] = summarize(times, days=len(per_day))
+
+    renderer = OverviewRenderer(make_canvas(use_tk))
+    renderer.set_period(start, end, per_day)
+    renderer.layout(760, 600, 40)
+    times, _ = measure(renderer.render, 1)
+    results["ui.overview.first"] = summarize(times, **renderer.last_stats)
+
+    # Défilement d'une demi-ligne : un déplacement global, au plus une ligne recyclée
+    def scroll():
+        renderer.scroll_to(renderer.offset + 20)
+    times, _ = measure(renderer.render, repeat, setup=scroll)
+    results["ui.overview.scroll"] = summarize(times, **renderer.last_stats)
+
+    # Zoom arrière jusqu'à la saison entière : le pool grandit une fois, borné par la hauteur visible
+    renderer.scroll_to(0)
+    def zoom_out():
+        renderer.layout(760, 600, 14)
+    times, _ = measure(renderer.render, 1, setup=zoom_out)
+    canvas = renderer.canvas
+    items = len(canvas.items) if hasattr(canvas, "items") else len(canvas.find_all())
+    results["ui.overview.zoom_season"] = summarize(times, weeks=len(renderer.weeks), items=items, **renderer.last_stats)
+
+
+def bench_stats(results, repeat):
+    from stats import training_stats
+    start, end = training_stats.season_period(REFERENCE_DAY)
+    def season():
+        training_stats.summary(start, end)
+        training_stats.by_category(start, end)
+        training_stats.by_month(start, end)
+        training_stats.weekday_hour_heatmap(start, end)
+    times, _ = measure(season, repeat)
+    results["stats.season"] = summarize(times)
+    first = date(2000, 1, 1)
+    times, _ = measure(lambda: training_stats.by_month(first, REFERENCE_DAY), repeat)
+    results["stats.history_by_month"] = summarize(times)
+
+
+def bench_export(results, repeat, tmp):
+    from exporter.pdf_exporter import export_trainings_to_pdf
+    trainings = database.get_trainings_for_month(REFERENCE_DAY.year, REFERENCE_DAY.month, "toutes")
+    filename = os.path.join(tmp, "export.pdf")
+    times, _ = measure(lambda: export_trainings_to_pdf(trainings, filename), repeat)
+    results["export.pdf.month"] = summarize(times, rows=len(trainings), bytes=os.path.getsize(filename))
+
+
+def run(rows, per_day, seed, repeat, use_tk):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Le dépôt partagé est créé au premier accès : il suffit de changer le chemin avant
+        database.DB_PATH = os.path.join(tmp, "bench.db")
+        t0 = timer.perf_counter()
+        build_database(database.get_repository(), rows, per_day, seed)
+        results["setup.build_database"] = summarize([(timer.perf_counter() - t0) * 1000], rows=rows)
+
+        bench_queries(results, repeat)
+        bench_rendering(results, repeat, use_tk)
+        bench_overview(results, repeat, use_tk)
+        bench_wrap_text(results, repeat)
+        bench_stats(results, repeat)
+        bench_export(results, repeat, tmp)
+        database.get_repository().close()
+
+    return {
+        "meta": {
+            "commit": git_commit(), "date": date.today().isoformat(), "python": platform.python_version(),
+            "platform": platform.platform(), "rows": rows, "per_day": per_day, "seed": seed,
+            "repeat": repeat, "canvas": "tk" if use_tk else "stub",
+        },
+        "results": results,
+    }
+
+
+def print_results(report, baseline=None, threshold=1.2):
+    """Affiche les médianes (et le rapport à la référence). Retourne les mesures en régression."""
+    regressions = []
+    print(f"{'mesure':<28} {'médiane':>10} {'min':>10}" + ("   réf.       rapport" if baseline else ""))
+    for name, values in report["results"].items():
+        line = f"{name:<28} {values['median_ms']:>7.2f} ms {values['min_ms']:>7.2f} ms"
+        reference = (baseline or {}).get("results", {}).get(name)
+        if reference:
+            ratio = values["median_ms"] / reference["median_ms"] if reference["median_ms"] else 1.0
+            flag = "  <- plus lent" if ratio > threshold and reference["median_ms"] >= MIN_COMPARABLE_MS else ""
+            line += f" {reference['median_ms']:>7.2f} ms {ratio:>8.2f}x{flag}"
+            if ratio > threshold and reference["median_ms"] >= MIN_COMPARABLE_MS and not name.startswith("setup."):
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000, help="taille de l'historique synthétique")
+    parser.add_argument("--per-day", type=int, default=6, help="séances par jour")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=7, help="mesures par scénario (médiane)")
+    parser.add_argument("--tk", action="store_true", help="vrai canvas Tk (écran ou xvfb-run nécessaire)")
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    parser.add_argument("--compare", help="fichier JSON d'une exécution précédente")
+    parser.add_argument("--threshold", type=float, default=1.2, help="rapport au-delà duquel une mesure régresse")
+    args = parser.parse_args()
+
+    report = run(args.rows, args.per_day, args.seed, args.repeat, args.tk)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = print_results(report, baseline, args.threshold)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) : {', '.join(regressions)}")
+        sys.exit(1)
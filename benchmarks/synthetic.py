@@ -0,0 +1,48 @@
+# benchmarks/synthetic.py
+"""
+Historiques d'entraînements synthétiques, reproductibles (graine fixe).
+
+Les séances sont réparties sur des jours consécutifs qui se terminent le 30 juin 2025 :
+plus l'historique est grand, plus il remonte loin, et la semaine / le mois mesurés
+(mars 2025) ont toujours la même densité.
+"""
+import random
+from datetime import date, time, timedelta
+
+from models.training import Training
+
+CATEGORIES = ["U11", "U13", "U15", "U17", "U20", "Seniors F", "Seniors M", "Loisirs", "Arbitrage", "Gardiens"]
+DESCRIPTION_WORDS = [
+    "échauffement", "tirs", "dribbles", "passes", "défense", "zone", "homme à homme", "contre-attaque",
+    "rebond", "physique", "récupération", "match amical", "tactique", "lancers francs", "vidéo", "étirements",
+]
+LAST_DAY = date(2025, 6, 30)
+REFERENCE_DAY = date(2025, 3, 12)  # semaine et mois mesurés
+
+
+def first_day(count, per_day=6):
+    """Premier jour d'un historique de count séances."""
+    return LAST_DAY - timedelta(days=(count - 1) // per_day)
+
+
+def generate_rows(count, per_day=6, seed=42):
+    """Lignes (id, catégorie, description, jour ordinal, début, fin en minutes) : mêmes séances que generate_trainings."""
+    rng = random.Random(seed)
+    first = first_day(count, per_day).toordinal()
+    for i in range(count):
+        start = rng.randrange(12 * 60, 21 * 60, 30)
+        end = min(start + rng.choice((30, 60, 90, 120)), 22 * 60)
+        words = rng.choices(DESCRIPTION_WORDS, k=rng.choice((1, 2, 4, 8, 25)))
+        yield (i + 1, rng.choice(CATEGORIES), " ".join(words), first + i // per_day, start, end)
+
+
+def generate_trainings(count, per_day=6, seed=42):
+    """count séances (per_day par jour, créneaux de 30 min entre 12:00 et 22:00), descriptions de 1 à 25 mots."""
+    for _, category, description, day, start, end in generate_rows(count, per_day, seed):
+        yield Training(category=category, description=description, date=date.fromordinal(day),
+                       start_time=time(start // 60, start % 60), end_time=time(end // 60, end % 60))
+
+
+def build_database(repository, count, per_day=6, seed=42):
+    """Remplit la base du dépôt (en une transaction). Retourne le nombre de séances insérées."""
+    return repository.add_many(generate_trainings(count, per_day, seed))
@@ -0,0 +1,123 @@
+# db/cache.py
+import sys
+import threading
+from collections import OrderedDict
+from models.training_batch import TrainingBatch
+from utils.instrumentation import count
+
+# Taille moyenne mesurée d'un Training en mémoire (voir benchmarks/bench_batch_memory.py)
+TRAINING_SIZE_ESTIMATE = 1000
+
+
+def week_key(reference_date):
+    iso = reference_date.isocalendar()
+    return ("week", iso[0], iso[1])
+
+
+def month_key(kind, year, month, category):
+    # "Toutes" / "toutes" / None désignent la même requête
+    if category is None or category.lower() == "toutes":
+        category = "toutes"
+    return (kind, year, month, category)
+
+
+def estimate_size(value):
+    if isinstance(value, TrainingBatch):
+        return value.nbytes() + 64 * len(value)
+    if isinstance(value, list):
+        return sys.getsizeof(value) + TRAINING_SIZE_ESTIMATE * len(value)
+    return sys.getsizeof(value)
+
+
+class QueryCache:
+    """
+    Cache LRU des résultats de requêtes, borné par un budget mémoire (estimé).
+
+    Clés : ("week", année ISO, semaine ISO), ("month" | "month_batch", année, mois, catégorie)
+    ("categories",) et ("occurrences", premier jour, dernier jour) pour les séances récurrentes.
+    Les écritures appellent invalidate() avec les (date, catégorie) touchées : seules les entrées
+    qui contiennent ces jours sont retirées (les occurrences ne dépendent que des règles).
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._generation = 0           # incrémenté à chaque invalidation
+        self._entries = OrderedDict()  # clé -> (valeur, taille estimée)
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, load):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                count("cache.hits")
+                return entry[0]
+            self.misses += 1
+            generation = self._generation
+        count("cache.misses")
+        # La requête s'exécute hors du verrou : deux threads peuvent charger la même clé, sans conséquence
+        value = load()
+        self.put(key, value, generation)
+        return value
+
+    def peek(self, key):
+        """Valeur en cache pour key, ou None (sans rien charger)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        count("cache.hits")
+        return entry[0]
+
+    def put(self, key, value, generation=None):
+        size = estimate_size(value)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                # Une écriture a eu lieu pendant le chargement : le résultat est peut-être périmé
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, days_and_categories):
+        """Retire les entrées couvrant l'un des couples (date, catégorie) modifiés."""
+        weeks, months = set(), set()
+        for day, category in days_and_categories:
+            iso = day.isocalendar()
+            weeks.add((iso[0], iso[1]))
+            months.add((day.year, day.month, category))
+            months.add((day.year, day.month, "toutes"))
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                kind = key[0]
+                if (kind == "categories"
+                        or (kind == "week" and key[1:] in weeks)
+                        or (kind in ("month", "month_batch") and key[1:] in months)):
+                    self.size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "entries": len(self._entries), "bytes": self.size}
@@ -1,60 +1,223 @@
-import sqlite3
-from datetime import datetime, date, timedelta
+import heapq
+import threading
+from datetime import date
 from models.training import Training
+from models.training_batch import TrainingBatch
+from models.training_rule import TrainingRule, split_occurrence_id
+from db.repository import TrainingRepository, week_bounds, month_bounds, _row_order
+from db.cache import QueryCache, week_key, month_key
+from utils.date_utils import time_to_minutes
+from utils.intervals import index_by_day
+from utils.instrumentation import timed
 
-conn = sqlite3.connect("trainings.db", check_same_thread=False)
-cursor = conn.cursor()
-cursor.execute('''CREATE TABLE IF NOT EXISTS trainings (
-    id INTEGER PRIMARY KEY,
-    category TEXT,
-    description TEXT,
-    date TEXT,
-    start_time TEXT,
-    end_time TEXT
-)''')
-conn.commit()
+DB_PATH = "trainings.db"
 
+# Dépôt partagé par toute l'application (une connexion SQLite par thread),
+# créé au premier accès : importer ce module n'ouvre pas la base
+_repository = None
+_repository_lock = threading.Lock()
+# Résultats des requêtes semaine / mois, invalidés par les écritures ci-dessous
+cache = QueryCache()
+
+
+def get_repository():
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = TrainingRepository(DB_PATH)
+    return _repository
+
+
+def _invalidate(days_and_categories):
+    # Dans un batch(), l'invalidation attend le commit du bloc le plus externe : un chargement
+    # lancé entre-temps par un autre thread (WeekLoader) lirait encore les anciennes données
+    days_and_categories = list(days_and_categories)
+    get_repository().after_commit(lambda: cache.invalidate(days_and_categories))
+
+
+def _clear_cache():
+    get_repository().after_commit(cache.clear)
+
+
+@timed("db.add_training")
 def add_training(t: Training):
-    cursor.execute("INSERT INTO trainings (category, description, date, start_time, end_time) VALUES (?, ?, ?, ?, ?)",
-                   (t.category, t.description, t.date.isoformat(), t.start_time.strftime("%H:%M"), t.end_time.strftime("%H:%M")))
-    conn.commit()
+    training_id = get_repository().add(t)
+    _invalidate([(t.date, t.category)])
+    return training_id
+
+def _occurrence_rows(start, end, category=None):
+    """
+    Occurrences des séances récurrentes entre start et end, en lignes triées par jour et heure.
+    Seules les règles actives sur la période sont lues et développées ; le résultat est mémorisé
+    par période (vidé à chaque modification des règles).
+    """
+    rows = cache.get_or_load(("occurrences", start.toordinal(), end.toordinal()),
+                             lambda: get_repository().occurrence_rows(start, end))
+    if category is None or category.lower() == "toutes":
+        return rows
+    return [row for row in rows if row[1] == category]
 
+
+def _with_occurrences(trainings, start, end, category=None):
+    rows = _occurrence_rows(start, end, category)
+    if not rows:
+        return trainings
+    return list(heapq.merge(trainings, map(Training.from_db_row, rows), key=lambda t: (t.date, t.start_time)))
+
+
+def _batch_with_occurrences(batch, start, end, category=None):
+    rows = _occurrence_rows(start, end, category)
+    if not rows:
+        return batch
+    return TrainingBatch.from_rows(heapq.merge(batch.rows(), rows, key=_row_order))
+
+
+@timed("db.get_trainings_for_week")
 def get_trainings_for_week(reference_date):
-    start = reference_date - timedelta(days=reference_date.weekday())
-    end = start + timedelta(days=6)
-    cursor.execute("SELECT * FROM trainings WHERE date BETWEEN ? AND ?", (start.isoformat(), end.isoformat()))
-    rows = cursor.fetchall()
-    result = []
-    for row in rows:
-        result.append(Training(id=row[0], category=row[1], description=row[2],
-                               date=date.fromisoformat(row[3]),
-                               start_time=datetime.strptime(row[4], "%H:%M").time(),
-                               end_time=datetime.strptime(row[5], "%H:%M").time()))
-    return result
+    def load():
+        return _with_occurrences(get_repository().get_week(reference_date), *week_bounds(reference_date))
+    return list(cache.get_or_load(week_key(reference_date), load))
 
+@timed("db.get_trainings_for_month")
 def get_trainings_for_month(year, month, category):
-    start = date(year, month, 1)
-    end = (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
-    if category.lower() == "toutes":
-        cursor.execute("SELECT * FROM trainings WHERE date BETWEEN ? AND ? ORDER BY date, start_time", (start.isoformat(), end.isoformat()))
-    else:
-        cursor.execute("SELECT * FROM trainings WHERE category=? AND date BETWEEN ? AND ? ORDER BY date, start_time", (category, start.isoformat(), end.isoformat()))
-    rows = cursor.fetchall()
-    return [Training(id=row[0], category=row[1], description=row[2],
-                     date=date.fromisoformat(row[3]),
-                     start_time=datetime.strptime(row[4], "%H:%M").time(),
-                     end_time=datetime.strptime(row[5], "%H:%M").time()) for row in rows]
+    def load():
+        return _with_occurrences(get_repository().get_month(year, month, category), *month_bounds(year, month), category)
+    return list(cache.get_or_load(month_key("month", year, month, category), load))
+
+@timed("db.get_batch_for_month")
+def get_batch_for_month(year, month, category="toutes"):
+    # Un TrainingBatch construit un nouveau Training à chaque accès : il peut être partagé tel quel
+    def load():
+        batch = get_repository().get_month_batch(year, month, category)
+        return _batch_with_occurrences(batch, *month_bounds(year, month), category)
+    return cache.get_or_load(month_key("month_batch", year, month, category), load)
+
+def peek_batch_for_month(year, month, category="toutes"):
+    """Batch du mois s'il est déjà en cache, sinon None (aucune requête : utilisable dans le thread Tk)."""
+    return cache.peek(month_key("month_batch", year, month, category))
+
+@timed("db.get_batch_for_range")
+def get_batch_for_range(start, end, category=None):
+    return _batch_with_occurrences(get_repository().get_batch(start, end, category), start, end, category)
 
+@timed("db.iter_trainings")
+def iter_trainings(start, end, categories=None):
+    """Séances d'une période, récurrentes comprises, lues au fil de l'eau (export de longues périodes)."""
+    return get_repository().iter_schedule(start, end, categories)
+
+@timed("db.count_trainings")
+def count_trainings(start, end, categories=None):
+    return get_repository().count_schedule(start, end, categories)
+
+def release_connection():
+    """Libère la connexion SQLite du thread courant (threads de travail)."""
+    get_repository().release()
+
+@timed("db.search_trainings")
+def search_trainings(query, date_range=None, limit=50):
+    """Recherche plein texte sur tout l'historique, séances récurrentes comprises (préfixes, sans accents)."""
+    return get_repository().search(query, date_range, limit)
+
+@timed("db.find_conflicts")
+def find_conflicts(t: Training):
+    """Séances (enregistrées ou récurrentes) qui chevauchent t le même jour (toutes catégories : même salle)."""
+    conflicts = get_repository().overlapping(t.date, t.start_time, t.end_time, exclude_id=t.id)
+    start_min, end_min = time_to_minutes(t.start_time), time_to_minutes(t.end_time)
+    occurrences = [Training.from_db_row(row) for row in _occurrence_rows(t.date, t.date)
+                   if row[4] < end_min and row[5] > start_min and row[0] != t.id]
+    return sorted(conflicts + occurrences, key=lambda c: c.start_time) if occurrences else conflicts
+
+@timed("db.find_rule_conflicts")
+def find_rule_conflicts(rule: TrainingRule):
+    """
+    Séances (enregistrées ou récurrentes) qui chevauchent l'une des occurrences de rule, par date puis heure.
+    Une seule requête sur toute la durée de la règle, puis un index d'intervalles par jour.
+    """
+    days = rule.occurrence_days(rule.first_day, rule.last_day)
+    if not days:
+        return []
+    batch = get_batch_for_range(date.fromordinal(days[0]), date.fromordinal(days[-1]))
+    per_day = index_by_day(batch.days, batch.start_minutes, batch.end_minutes, range(len(batch)))
+    start_min, end_min = time_to_minutes(rule.start_time), time_to_minutes(rule.end_time)
+    return [batch[i] for day in days if day in per_day for i in per_day[day].overlapping(start_min, end_min)]
+
+@timed("db.add_trainings")
+def add_trainings(trainings):
+    trainings = list(trainings)
+    count = get_repository().add_many(trainings)
+    _invalidate((t.date, t.category) for t in trainings)
+    return count
+
+@timed("db.update_trainings")
+def update_trainings(trainings):
+    trainings = list(trainings)
+    # Anciennes et nouvelles positions : une séance déplacée invalide les deux périodes
+    previous = get_repository().locate(t.id for t in trainings)
+    count = get_repository().update_many(trainings)
+    _invalidate(previous + [(t.date, t.category) for t in trainings])
+    return count
+
+@timed("db.delete_trainings")
+def delete_trainings(training_ids):
+    training_ids = list(training_ids)
+    previous = get_repository().locate(training_ids)
+    count = get_repository().delete_many(training_ids)
+    _invalidate(previous)
+    return count
+
+def batch():
+    return get_repository().batch()
+
+@timed("db.delete_training")
 def delete_training(training_id):
-    cursor.execute("DELETE FROM trainings WHERE id = ?", (training_id,))
-    conn.commit()
+    previous = get_repository().locate([training_id])
+    get_repository().delete(training_id)
+    _invalidate(previous)
 
+@timed("db.update_training")
 def update_training(t: Training):
-    cursor.execute("UPDATE trainings SET category=?, description=?, date=?, start_time=?, end_time=? WHERE id = ?",
-                   (t.category, t.description, t.date.isoformat(), t.start_time.strftime("%H:%M"), t.end_time.strftime("%H:%M"), t.id))
-    conn.commit()
+    previous = get_repository().locate([t.id])
+    get_repository().update(t)
+    _invalidate(previous + [(t.date, t.category)])
 
+@timed("db.get_all_categories")
 def get_all_categories():
-    cursor.execute("SELECT DISTINCT category FROM trainings ORDER BY category ASC")
-    rows = cursor.fetchall()
-    return [row[0] for row in rows]
+    return list(cache.get_or_load(("categories",), lambda: get_repository().get_categories()))
+
+# --- Séances récurrentes ---
+# Une écriture sur les règles peut toucher toute une saison : le cache est vidé entièrement
+# (ces écritures sont rares, quelques-unes par saison).
+
+@timed("db.add_rule")
+def add_rule(rule: TrainingRule):
+    rule_id = get_repository().add_rule(rule)
+    _clear_cache()
+    return rule_id
+
+@timed("db.get_rule")
+def get_rule(rule_id):
+    return get_repository().get_rule(rule_id)
+
+@timed("db.delete_rule")
+def delete_rule(rule_id):
+    get_repository().delete_rule(rule_id)
+    _clear_cache()
+
+@timed("db.skip_occurrence")
+def skip_occurrence(occurrence_id):
+    """Retire une seule occurrence de sa règle (date exclue)."""
+    rule_id, day = split_occurrence_id(occurrence_id)
+    get_repository().add_rule_exception(rule_id, day)
+    _clear_cache()
+
+@timed("db.detach_occurrence")
+def detach_occurrence(occurrence_id, t: Training):
+    """Remplace une occurrence par la séance t, enregistrée à part (modification de cette date seulement)."""
+    rule_id, day = split_occurrence_id(occurrence_id)
+    repository = get_repository()
+    with repository.batch():
+        repository.add_rule_exception(rule_id, day)
+        training_id = repository.add(t.model_copy(update={"id": None}))
+    _clear_cache()
+    return training_id
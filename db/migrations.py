@@ -0,0 +1,225 @@
+# db/migrations.py
+"""
+Migrations du schéma SQLite.
+
+Chaque étape est une fonction qui reçoit la connexion et fait évoluer le schéma
+d'une version à la suivante. La version courante est stockée dans la table
+schema_version ; au démarrage, seules les étapes manquantes sont appliquées.
+"""
+
+# Conversion ISO 'YYYY-MM-DD' -> ordinal (date.toordinal()) : julianday('0001-01-01') = 1721425.5
+ISO_TO_ORDINAL_SQL = "CAST(julianday({col}) - 1721424.5 AS INTEGER)"
+# Conversion 'HH:MM' -> minutes depuis minuit
+HHMM_TO_MINUTES_SQL = "(CAST(substr({col}, 1, 2) AS INTEGER) * 60 + CAST(substr({col}, 4, 2) AS INTEGER))"
+
+
+def _migration_1_initial(conn):
+    # Schéma d'origine (dates et heures en texte)
+    conn.execute('''CREATE TABLE IF NOT EXISTS trainings (
+        id INTEGER PRIMARY KEY,
+        category TEXT,
+        description TEXT,
+        date TEXT,
+        start_time TEXT,
+        end_time TEXT
+    )''')
+
+
+def _migration_2_integer_columns(conn):
+    # Dates en jours (ordinal) et heures en minutes + index composites pour les requêtes par plage
+    conn.execute('''CREATE TABLE trainings_v2 (
+        id INTEGER PRIMARY KEY,
+        category TEXT NOT NULL,
+        description TEXT NOT NULL,
+        day INTEGER NOT NULL,
+        start_min INTEGER NOT NULL,
+        end_min INTEGER NOT NULL
+    )''')
+    conn.execute(f'''INSERT INTO trainings_v2 (id, category, description, day, start_min, end_min)
+        SELECT id, COALESCE(category, ''), COALESCE(description, ''),
+               {ISO_TO_ORDINAL_SQL.format(col="date")},
+               {HHMM_TO_MINUTES_SQL.format(col="start_time")},
+               {HHMM_TO_MINUTES_SQL.format(col="end_time")}
+        FROM trainings''')
+    conn.execute("DROP TABLE trainings")
+    conn.execute("ALTER TABLE trainings_v2 RENAME TO trainings")
+    conn.execute("CREATE INDEX idx_trainings_day_start ON trainings (day, start_min)")
+    conn.execute("CREATE INDEX idx_trainings_category_day ON trainings (category, day)")
+
+
+def _migration_3_full_text_search(conn):
+    # Index plein texte (FTS5) des descriptions et catégories, tenu à jour par triggers.
+    # remove_diacritics : "entraînement" et "entrainement" donnent le même terme ;
+    # prefix : index des préfixes de 2 et 3 caractères pour les recherches "entr*"
+    conn.execute('''CREATE VIRTUAL TABLE trainings_fts USING fts5(
+        description, category,
+        content='trainings', content_rowid='id',
+        tokenize="unicode61 remove_diacritics 2",
+        prefix='2 3'
+    )''')
+    conn.execute('''CREATE TRIGGER trainings_fts_insert AFTER INSERT ON trainings BEGIN
+        INSERT INTO trainings_fts (rowid, description, category) VALUES (new.id, new.description, new.category);
+    END''')
+    conn.execute('''CREATE TRIGGER trainings_fts_delete AFTER DELETE ON trainings BEGIN
+        INSERT INTO trainings_fts (trainings_fts, rowid, description, category)
+        VALUES ('delete', old.id, old.description, old.category);
+    END''')
+    conn.execute('''CREATE TRIGGER trainings_fts_update AFTER UPDATE OF description, category ON trainings BEGIN
+        INSERT INTO trainings_fts (trainings_fts, rowid, description, category)
+        VALUES ('delete', old.id, old.description, old.category);
+        INSERT INTO trainings_fts (rowid, description, category) VALUES (new.id, new.description, new.category);
+    END''')
+    conn.execute("INSERT INTO trainings_fts (trainings_fts) VALUES ('rebuild')")
+
+
+def _migration_4_stats_index(conn):
+    # Index couvrant pour les statistiques : les agrégats par période (GROUP BY jour, catégorie, heure)
+    # se calculent sur l'index seul, sans relire les lignes de la table
+    conn.execute("CREATE INDEX idx_trainings_day_stats ON trainings (day, category, start_min, end_min)")
+
+
+# Ajout / retrait d'une séance dans les agrégats journaliers ({row} = new ou old)
+DAILY_STATS_ADD_SQL = """INSERT INTO daily_stats (day, category, sessions, minutes)
+        VALUES ({row}.day, {row}.category, 1, {row}.end_min - {row}.start_min)
+        ON CONFLICT (day, category) DO UPDATE
+        SET sessions = sessions + 1, minutes = minutes + excluded.minutes;"""
+DAILY_STATS_REMOVE_SQL = """UPDATE daily_stats
+        SET sessions = sessions - 1, minutes = minutes - ({row}.end_min - {row}.start_min)
+        WHERE day = {row}.day AND category = {row}.category;
+        DELETE FROM daily_stats WHERE day = {row}.day AND category = {row}.category AND sessions <= 0;"""
+DAILY_STATS_REBUILD_SQL = """INSERT INTO daily_stats (day, category, sessions, minutes)
+    SELECT day, category, COUNT(*), SUM(end_min - start_min) FROM trainings GROUP BY day, category"""
+
+
+# Écritures groupées (add_many / update_many / delete_many) : les triggers ligne à ligne de trainings_fts
+# et daily_stats sont suspendus pendant le lot, ces deux tables sont mises à jour en une requête chacune.
+# {rows} : condition qui sélectionne dans trainings les lignes du lot
+ROW_SYNC_TRIGGERS = ("trainings_fts_insert", "trainings_fts_delete", "trainings_fts_update",
+                     "daily_stats_insert", "daily_stats_delete", "daily_stats_update")
+FTS_ADD_ROWS_SQL = """INSERT INTO trainings_fts (rowid, description, category)
+    SELECT id, description, category FROM trainings WHERE {rows}"""
+FTS_REMOVE_ROWS_SQL = """INSERT INTO trainings_fts (trainings_fts, rowid, description, category)
+    SELECT 'delete', id, description, category FROM trainings WHERE {rows}"""
+DAILY_STATS_ADD_ROWS_SQL = """INSERT INTO daily_stats (day, category, sessions, minutes)
+    SELECT day, category, COUNT(*), SUM(end_min - start_min) FROM trainings WHERE {rows} GROUP BY day, category
+    ON CONFLICT (day, category) DO UPDATE
+    SET sessions = sessions + excluded.sessions, minutes = minutes + excluded.minutes"""
+DAILY_STATS_REMOVE_ROWS_SQL = """UPDATE daily_stats
+    SET sessions = daily_stats.sessions - removed.sessions, minutes = daily_stats.minutes - removed.minutes
+    FROM (SELECT day, category, COUNT(*) AS sessions, SUM(end_min - start_min) AS minutes
+          FROM trainings WHERE {rows} GROUP BY day, category) AS removed
+    WHERE daily_stats.day = removed.day AND daily_stats.category = removed.category"""
+DAILY_STATS_PURGE_SQL = "DELETE FROM daily_stats WHERE sessions <= 0"
+
+
+def _migration_5_daily_stats(conn):
+    # Agrégats par jour et par catégorie (séances, minutes), tenus à jour par triggers :
+    # les statistiques sur plusieurs années lisent au plus une ligne par jour et par catégorie
+    conn.execute('''CREATE TABLE daily_stats (
+        day INTEGER NOT NULL,
+        category TEXT NOT NULL,
+        sessions INTEGER NOT NULL,
+        minutes INTEGER NOT NULL,
+        PRIMARY KEY (day, category)
+    ) WITHOUT ROWID''')
+    conn.execute(f'''CREATE TRIGGER daily_stats_insert AFTER INSERT ON trainings BEGIN
+        {DAILY_STATS_ADD_SQL.format(row="new")}
+    END''')
+    conn.execute(f'''CREATE TRIGGER daily_stats_delete AFTER DELETE ON trainings BEGIN
+        {DAILY_STATS_REMOVE_SQL.format(row="old")}
+    END''')
+    conn.execute(f'''CREATE TRIGGER daily_stats_update AFTER UPDATE OF day, category, start_min, end_min ON trainings BEGIN
+        {DAILY_STATS_REMOVE_SQL.format(row="old")}
+        {DAILY_STATS_ADD_SQL.format(row="new")}
+    END''')
+    conn.execute(DAILY_STATS_REBUILD_SQL)
+
+
+def _migration_6_training_rules(conn):
+    # Séances récurrentes : une ligne par règle (jours de semaine en masque de bits, lundi = bit 0)
+    # et une ligne par date exclue ; les occurrences ne sont jamais stockées
+    conn.execute('''CREATE TABLE training_rules (
+        id INTEGER PRIMARY KEY,
+        category TEXT NOT NULL,
+        description TEXT NOT NULL,
+        start_min INTEGER NOT NULL,
+        end_min INTEGER NOT NULL,
+        weekdays INTEGER NOT NULL,
+        first_day INTEGER NOT NULL,
+        last_day INTEGER NOT NULL
+    )''')
+    conn.execute("CREATE INDEX idx_training_rules_days ON training_rules (first_day, last_day)")
+    conn.execute('''CREATE TABLE training_rule_exceptions (
+        rule_id INTEGER NOT NULL REFERENCES training_rules (id) ON DELETE CASCADE,
+        day INTEGER NOT NULL,
+        PRIMARY KEY (rule_id, day)
+    ) WITHOUT ROWID''')
+
+
+def _migration_7_rules_full_text_search(conn):
+    # Index plein texte des séances récurrentes (mêmes réglages que trainings_fts) : leurs occurrences
+    # ne sont pas stockées, la recherche trouve la règle puis calcule ses dates
+    conn.execute('''CREATE VIRTUAL TABLE training_rules_fts USING fts5(
+        description, category,
+        content='training_rules', content_rowid='id',
+        tokenize="unicode61 remove_diacritics 2",
+        prefix='2 3'
+    )''')
+    conn.execute('''CREATE TRIGGER training_rules_fts_insert AFTER INSERT ON training_rules BEGIN
+        INSERT INTO training_rules_fts (rowid, description, category) VALUES (new.id, new.description, new.category);
+    END''')
+    conn.execute('''CREATE TRIGGER training_rules_fts_delete AFTER DELETE ON training_rules BEGIN
+        INSERT INTO training_rules_fts (training_rules_fts, rowid, description, category)
+        VALUES ('delete', old.id, old.description, old.category);
+    END''')
+    conn.execute('''CREATE TRIGGER training_rules_fts_update AFTER UPDATE OF description, category ON training_rules BEGIN
+        INSERT INTO training_rules_fts (training_rules_fts, rowid, description, category)
+        VALUES ('delete', old.id, old.description, old.category);
+        INSERT INTO training_rules_fts (rowid, description, category) VALUES (new.id, new.description, new.category);
+    END''')
+    conn.execute("INSERT INTO training_rules_fts (training_rules_fts) VALUES ('rebuild')")
+
+
+# Ordre d'application : l'index + 1 correspond au numéro de version
+MIGRATIONS = [
+    _migration_1_initial,
+    _migration_2_integer_columns,
+    _migration_3_full_text_search,
+    _migration_4_stats_index,
+    _migration_5_daily_stats,
+    _migration_6_training_rules,
+    _migration_7_rules_full_text_search,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)")
+    row = conn.execute("SELECT version FROM schema_version").fetchone()
+    return row[0] if row else 0
+
+
+def apply_migrations(conn):
+    """
+    Applique dans l'ordre les migrations qui manquent à la base.
+    Chaque étape est exécutée dans sa propre transaction, avec la mise à jour de schema_version.
+    Retourne la version finale du schéma.
+    """
+    version = get_schema_version(conn)
+    if version == 0 and conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='trainings'").fetchone():
+        # Base créée avant le système de migrations : elle est déjà en version 1
+        version = 1
+    for number in range(version + 1, len(MIGRATIONS) + 1):
+        # BEGIN explicite : sinon sqlite3 exécute les CREATE/DROP hors transaction
+        conn.execute("BEGIN")
+        try:
+            MIGRATIONS[number - 1](conn)
+            conn.execute("DELETE FROM schema_version")
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (number,))
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+    return max(version, SCHEMA_VERSION)
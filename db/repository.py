@@ -0,0 +1,510 @@
+# db/repository.py
+import heapq
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from models.training import Training
+from models.training_batch import TrainingBatch
+from models.training_rule import TrainingRule
+from db.migrations import apply_migrations, ROW_SYNC_TRIGGERS, FTS_ADD_ROWS_SQL, FTS_REMOVE_ROWS_SQL
+from db.migrations import DAILY_STATS_ADD_ROWS_SQL, DAILY_STATS_REMOVE_ROWS_SQL, DAILY_STATS_PURGE_SQL
+from utils.date_utils import time_to_minutes
+from utils.instrumentation import timed, count
+
+# Colonnes lues par toutes les requêtes (dates en jours ordinaux, heures en minutes)
+SELECT_COLUMNS = "SELECT id, category, description, day, start_min, end_min FROM trainings"
+# Les deux requêtes par plage s'appuient sur idx_trainings_day_start et idx_trainings_category_day
+RANGE_QUERY = SELECT_COLUMNS + " WHERE day BETWEEN ? AND ? ORDER BY day, start_min"
+CATEGORY_RANGE_QUERY = SELECT_COLUMNS + " WHERE category = ? AND day BETWEEN ? AND ? ORDER BY day, start_min"
+INSERT_QUERY = "INSERT INTO trainings (category, description, day, start_min, end_min) VALUES (?, ?, ?, ?, ?)"
+UPDATE_QUERY = "UPDATE trainings SET category=?, description=?, day=?, start_min=?, end_min=? WHERE id = ?"
+DELETE_QUERY = "DELETE FROM trainings WHERE id = ?"
+CATEGORIES_RANGE_QUERY = SELECT_COLUMNS + " WHERE day BETWEEN ? AND ? AND category IN ({placeholders}) ORDER BY day, start_min"
+COUNT_QUERY = "SELECT COUNT(*) FROM trainings WHERE day BETWEEN ? AND ?"
+LOCATE_QUERY = "SELECT day, category FROM trainings WHERE id IN ({placeholders})"
+# Recherche plein texte : jointure sur l'index FTS5, triée par pertinence (bm25)
+SEARCH_QUERY = ("SELECT t.id, t.category, t.description, t.day, t.start_min, t.end_min, rank "
+                "FROM trainings_fts JOIN trainings t ON t.id = trainings_fts.rowid "
+                "WHERE trainings_fts MATCH ?{range_filter} ORDER BY rank LIMIT ?")
+# Même recherche sur les séances récurrentes actives pendant la période
+SEARCH_RULES_QUERY = ("SELECT r.id, r.category, r.description, r.start_min, r.end_min, r.weekdays, r.first_day, r.last_day, rank "
+                      "FROM training_rules_fts JOIN training_rules r ON r.id = training_rules_fts.rowid "
+                      "WHERE training_rules_fts MATCH ? AND r.first_day <= ? AND r.last_day >= ? ORDER BY rank")
+CATEGORIES_QUERY = "SELECT DISTINCT category FROM trainings ORDER BY category ASC"
+# Séances qui chevauchent [start_min, end_min) un jour donné : recherche sur idx_trainings_day_start
+# (jour fixé, début < fin demandée), seules les séances du jour commencées avant la fin sont lues
+OVERLAP_QUERY = SELECT_COLUMNS + " WHERE day = ? AND start_min < ? AND end_min > ? AND id IS NOT ? ORDER BY start_min"
+# Règles récurrentes actives sur une période (idx_training_rules_days) et leurs dates exclues de la période
+RULES_RANGE_QUERY = ("SELECT id, category, description, start_min, end_min, weekdays, first_day, last_day "
+                     "FROM training_rules WHERE first_day <= ? AND last_day >= ? ORDER BY id")
+RULE_QUERY = ("SELECT id, category, description, start_min, end_min, weekdays, first_day, last_day "
+              "FROM training_rules WHERE id = ?")
+RULE_EXCEPTIONS_QUERY = "SELECT rule_id, day FROM training_rule_exceptions WHERE rule_id IN ({placeholders}) AND day BETWEEN ? AND ?"
+INSERT_RULE_QUERY = ("INSERT INTO training_rules (category, description, start_min, end_min, weekdays, first_day, last_day) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?)")
+DELETE_RULE_QUERY = "DELETE FROM training_rules WHERE id = ?"
+INSERT_RULE_EXCEPTION_QUERY = "INSERT OR IGNORE INTO training_rule_exceptions (rule_id, day) VALUES (?, ?)"
+# Écritures groupées : id du lot dans une table temporaire (une par connexion), jointe aux requêtes du lot
+BULK_IDS_TABLE = "CREATE TEMP TABLE IF NOT EXISTS bulk_ids (id INTEGER PRIMARY KEY)"
+BULK_ROWS = "id IN (SELECT id FROM temp.bulk_ids)"
+# update_many : nouvelles valeurs du lot, appliquées par une seule requête UPDATE ... FROM.
+# text_changed / stats_changed indiquent ce que la mise à jour change réellement (NULL : id inexistant)
+BULK_UPDATES_TABLE = ("CREATE TEMP TABLE IF NOT EXISTS bulk_updates (id INTEGER PRIMARY KEY, category TEXT, "
+                      "description TEXT, day INTEGER, start_min INTEGER, end_min INTEGER, "
+                      "text_changed INTEGER, stats_changed INTEGER)")
+BULK_UPDATES_FLAGS = ("UPDATE temp.bulk_updates SET "
+                      "text_changed = (t.category <> bulk_updates.category OR t.description <> bulk_updates.description), "
+                      "stats_changed = (t.category <> bulk_updates.category OR t.day <> bulk_updates.day "
+                      "OR t.start_min <> bulk_updates.start_min OR t.end_min <> bulk_updates.end_min) "
+                      "FROM trainings AS t WHERE t.id = bulk_updates.id")
+# Lignes qui ne changent rien (ou inexistantes) : ni réécriture, ni index à recalculer
+BULK_UPDATES_PRUNE = "DELETE FROM temp.bulk_updates WHERE NOT COALESCE(text_changed OR stats_changed, 0)"
+TEXT_CHANGED_ROWS = "id IN (SELECT id FROM temp.bulk_updates WHERE text_changed)"
+STATS_CHANGED_ROWS = "id IN (SELECT id FROM temp.bulk_updates WHERE stats_changed)"
+BULK_UPDATE_QUERY = ("UPDATE trainings SET category = b.category, description = b.description, day = b.day, "
+                     "start_min = b.start_min, end_min = b.end_min FROM temp.bulk_updates AS b WHERE trainings.id = b.id")
+# En dessous, les triggers ligne à ligne coûtent moins que leur suppression / recréation (et une écriture
+# courte ne change pas le schéma, ce qui forcerait les autres connexions à repréparer leurs requêtes)
+BULK_SYNC_MIN_ROWS = 100  # mesuré : 1,7 ms fixes pour le chemin groupé, gagnant dès ~100 lignes
+TRIGGERS_SQL_QUERY = "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({placeholders})"
+
+# Réglages appliqués à chaque nouvelle connexion
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",    # lecteurs et écrivain ne se bloquent plus
+    "PRAGMA synchronous=NORMAL",  # suffisant en WAL, évite un fsync par commit
+    "PRAGMA cache_size=-8000",    # 8 Mo de cache de pages par connexion
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _row_order(row):
+    # Lignes (id, category, description, day, start_min, end_min) : ordre jour puis heure de début
+    return row[3], row[4]
+
+
+def _training_order(t: Training):
+    return t.date, t.start_time
+
+
+def _to_row(t: Training):
+    return (t.category, t.description, t.date.toordinal(), time_to_minutes(t.start_time), time_to_minutes(t.end_time))
+
+
+def _sync_added(conn, text_rows, stats_rows, params=()):
+    # Lignes du lot ajoutées (ou dans leur nouvel état) : index plein texte et agrégats journaliers
+    conn.execute(FTS_ADD_ROWS_SQL.format(rows=text_rows), params)
+    conn.execute(DAILY_STATS_ADD_ROWS_SQL.format(rows=stats_rows), params)
+
+
+def _sync_removed(conn, text_rows, stats_rows, params=()):
+    # Lignes du lot retirées (ou dans leur ancien état), à appeler avant l'écriture
+    conn.execute(FTS_REMOVE_ROWS_SQL.format(rows=text_rows), params)
+    conn.execute(DAILY_STATS_REMOVE_ROWS_SQL.format(rows=stats_rows), params)
+    conn.execute(DAILY_STATS_PURGE_SQL)
+
+
+def _fill_bulk_ids(conn, training_ids):
+    conn.execute(BULK_IDS_TABLE)
+    conn.execute("DELETE FROM temp.bulk_ids")
+    conn.executemany("INSERT OR IGNORE INTO temp.bulk_ids (id) VALUES (?)", ((training_id,) for training_id in training_ids))
+
+
+def training_row_factory(cursor, row):
+    # Hydratation directe des lignes de SELECT_COLUMNS, sans revalidation
+    return Training.from_db_row(row)
+
+
+def to_fts_query(text):
+    """
+    Transforme une saisie libre en requête FTS5 : chaque mot devient un préfixe ("entra" -> "entra"*),
+    tous les mots doivent être présents. Les guillemets et opérateurs saisis sont neutralisés.
+    """
+    words = [w.replace('"', "") for w in text.split()]
+    return " ".join(f'"{w}"*' for w in words if w)
+
+
+def month_bounds(year, month):
+    start = date(year, month, 1)
+    end = (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return start, end
+
+
+def week_bounds(reference_date):
+    start = reference_date - timedelta(days=reference_date.weekday())
+    return start, start + timedelta(days=6)
+
+
+class TrainingRepository:
+    """
+    Accès aux entraînements stockés dans SQLite.
+
+    Chaque thread reçoit sa propre connexion (créée au premier appel puis réutilisée),
+    ce qui permet de lancer des requêtes hors du thread Tk sans partager de curseur.
+    Les requêtes sont des constantes : sqlite3 réutilise leurs instructions préparées
+    grâce à son cache (cached_statements).
+    """
+
+    def __init__(self, path, cached_statements=128):
+        self.path = path
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        # Le schéma est migré une seule fois, avant que les threads ne s'en servent
+        apply_migrations(self.connection())
+
+    def connection(self):
+        """Retourne la connexion du thread courant (en la créant si besoin)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False uniquement pour que close() puisse fermer toutes les connexions ;
+            # en dehors de close(), une connexion n'est utilisée que par le thread qui l'a créée
+            conn = sqlite3.connect(self.path, cached_statements=self.cached_statements, check_same_thread=False)
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def release(self):
+        """Ferme la connexion du thread courant (à appeler en fin de thread de travail)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+
+    def close(self):
+        """Ferme toutes les connexions ouvertes par le pool."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    # --- Lecture ---
+
+    def _training_cursor(self):
+        cur = self.connection().cursor()
+        cur.row_factory = training_row_factory
+        return cur
+
+    @timed("sqlite.get_range")
+    def get_range(self, start, end, category=None):
+        cur = self._training_cursor()
+        if category is None or category.lower() == "toutes":
+            cur.execute(RANGE_QUERY, (start.toordinal(), end.toordinal()))
+        else:
+            cur.execute(CATEGORY_RANGE_QUERY, (category, start.toordinal(), end.toordinal()))
+        trainings = cur.fetchall()
+        count("sqlite.rows", len(trainings))
+        return trainings
+
+    @timed("sqlite.get_batch")
+    def get_batch(self, start, end, category=None):
+        """Même résultat que get_range, en colonnes (TrainingBatch) : adapté aux longues périodes."""
+        conn = self.connection()
+        if category is None or category.lower() == "toutes":
+            rows = conn.execute(RANGE_QUERY, (start.toordinal(), end.toordinal()))
+        else:
+            rows = conn.execute(CATEGORY_RANGE_QUERY, (category, start.toordinal(), end.toordinal()))
+        # Les lignes sont consommées au fil du curseur, sans liste intermédiaire
+        batch = TrainingBatch.from_rows(rows)
+        count("sqlite.rows", len(batch))
+        return batch
+
+    def _range_cursor(self, start, end, categories, select=None):
+        cur = self._training_cursor() if select is None else self.connection().cursor()
+        params = [start.toordinal(), end.toordinal()]
+        if not categories:
+            sql = RANGE_QUERY if select is None else select
+        else:
+            categories = list(categories)
+            sql = CATEGORIES_RANGE_QUERY if select is None else select + " AND category IN ({placeholders})"
+            sql = sql.format(placeholders=", ".join("?" * len(categories)))
+            params += categories
+        return cur.execute(sql, params)
+
+    def iter_range(self, start, end, categories=None, chunk_size=500):
+        """
+        Parcourt les séances d'une période (toutes catégories si categories est vide) par paquets,
+        sans charger toute la période en mémoire. À consommer dans le thread qui l'a créé.
+        """
+        cur = self._range_cursor(start, end, categories)
+        while True:
+            chunk = cur.fetchmany(chunk_size)
+            if not chunk:
+                return
+            yield from chunk
+
+    @timed("sqlite.count_range")
+    def count_range(self, start, end, categories=None):
+        return self._range_cursor(start, end, categories, select=COUNT_QUERY).fetchone()[0]
+
+    def iter_schedule(self, start, end, categories=None):
+        """iter_range complété des occurrences des séances récurrentes, dans le même ordre (jour, heure)."""
+        occurrences = map(Training.from_db_row, self.occurrence_rows(start, end, categories))
+        return heapq.merge(self.iter_range(start, end, categories), occurrences, key=_training_order)
+
+    def count_schedule(self, start, end, categories=None):
+        """Nombre de séances de iter_schedule : enregistrées et récurrentes."""
+        return self.count_range(start, end, categories) + len(self.occurrence_rows(start, end, categories))
+
+    def get_month_batch(self, year, month, category="toutes"):
+        return self.get_batch(*month_bounds(year, month), category)
+
+    def get_week(self, reference_date):
+        return self.get_range(*week_bounds(reference_date))
+
+    def get_month(self, year, month, category="toutes"):
+        return self.get_range(*month_bounds(year, month), category)
+
+    @timed("sqlite.search")
+    def search(self, text, date_range=None, limit=50):
+        """
+        Séances dont la description ou la catégorie correspond à text, les plus pertinentes d'abord.
+        Les séances récurrentes trouvées prennent place à leur rang, avec leurs occurrences par date.
+        """
+        query = to_fts_query(text)
+        if not query:
+            return []
+        params = [query]
+        range_filter = ""
+        if date_range is not None:
+            range_filter = " AND t.day BETWEEN ? AND ?"
+            params += [date_range[0].toordinal(), date_range[1].toordinal()]
+        params.append(-1 if limit is None else limit)
+        conn = self.connection()
+        results = [(row[6], Training.from_db_row(row[:6]))
+                   for row in conn.execute(SEARCH_QUERY.format(range_filter=range_filter), params)]
+        start, end = date_range if date_range is not None else (date.min, date.max)
+        rule_rows = conn.execute(SEARCH_RULES_QUERY, (query, end.toordinal(), start.toordinal())).fetchall()
+        if not rule_rows:
+            return [t for _, t in results]
+        for rank, rule in zip((row[8] for row in rule_rows), self._load_rules([row[:8] for row in rule_rows], start, end)):
+            results.extend((rank, t) for t in rule.occurrences(start, end)[:limit])
+        # Tri stable : à pertinence égale, les séances enregistrées restent devant
+        results.sort(key=lambda result: result[0])
+        return [t for _, t in results[:limit]]
+
+    @timed("sqlite.locate")
+    def locate(self, training_ids, chunk_size=500):
+        """Couples (date, catégorie) actuellement enregistrés pour ces ids (pour invalider les caches)."""
+        training_ids = list(training_ids)
+        conn = self.connection()
+        result = []
+        for i in range(0, len(training_ids), chunk_size):
+            chunk = training_ids[i:i + chunk_size]
+            sql = LOCATE_QUERY.format(placeholders=", ".join("?" * len(chunk)))
+            result.extend((date.fromordinal(day), category) for day, category in conn.execute(sql, chunk))
+        return result
+
+    @timed("sqlite.overlapping")
+    def overlapping(self, day, start_time, end_time, exclude_id=None):
+        """Séances du jour day qui chevauchent [start_time, end_time), sauf exclude_id (séance modifiée)."""
+        cur = self._training_cursor()
+        return cur.execute(OVERLAP_QUERY, (day.toordinal(), time_to_minutes(end_time),
+                                           time_to_minutes(start_time), exclude_id)).fetchall()
+
+    @timed("sqlite.get_rules")
+    def get_rules(self, start, end):
+        """Règles récurrentes actives entre start et end, avec leurs dates exclues de cette période."""
+        rows = self.connection().execute(RULES_RANGE_QUERY, (end.toordinal(), start.toordinal())).fetchall()
+        return self._load_rules(rows, start, end)
+
+    def _load_rules(self, rows, start, end):
+        # Règles depuis leurs lignes, avec les dates exclues comprises entre start et end
+        if not rows:
+            return []
+        exceptions = {}
+        sql = RULE_EXCEPTIONS_QUERY.format(placeholders=", ".join("?" * len(rows)))
+        for rule_id, day in self.connection().execute(sql, [row[0] for row in rows] + [start.toordinal(), end.toordinal()]):
+            exceptions.setdefault(rule_id, []).append(date.fromordinal(day))
+        return [TrainingRule.from_db_row(row, exceptions.get(row[0], ())) for row in rows]
+
+    @timed("sqlite.occurrence_rows")
+    def occurrence_rows(self, start, end, categories=None):
+        """
+        Occurrences des séances récurrentes entre start et end (toutes catégories si categories est vide),
+        en lignes (id, category, description, day, start_min, end_min) triées par jour et heure.
+        """
+        rows = [row for rule in self.get_rules(start, end) if not categories or rule.category in categories
+                for row in rule.occurrence_rows(start, end)]
+        rows.sort(key=_row_order)
+        return rows
+
+    @timed("sqlite.get_rule")
+    def get_rule(self, rule_id):
+        row = self.connection().execute(RULE_QUERY, (rule_id,)).fetchone()
+        return None if row is None else TrainingRule.from_db_row(row)
+
+    @timed("sqlite.get_categories")
+    def get_categories(self):
+        return [row[0] for row in self.connection().execute(CATEGORIES_QUERY)]
+
+    # --- Écriture ---
+
+    @contextmanager
+    def batch(self):
+        """
+        Regroupe toutes les écritures du bloc dans une seule transaction (un seul commit).
+
+            with repository.batch():
+                repository.add(t1)
+                repository.delete(t2.id)
+
+        Les blocs imbriqués rejoignent la transaction du bloc le plus externe.
+        En cas d'exception, toutes les écritures du bloc sont annulées.
+        """
+        conn = self.connection()
+        depth = getattr(self._local, "batch_depth", 0)
+        if depth == 0:
+            self._local.after_commit = []
+        self._local.batch_depth = depth + 1
+        try:
+            yield self
+        except BaseException:
+            self._local.batch_depth = depth
+            if depth == 0:
+                conn.rollback()
+                self._run_after_commit()
+            raise
+        self._local.batch_depth = depth
+        if depth == 0:
+            conn.commit()
+            self._run_after_commit()
+
+    def after_commit(self, callback):
+        """
+        Appelle callback quand les écritures en cours sont terminées : tout de suite hors d'un batch(),
+        sinon à la sortie du bloc le plus externe (après le commit, ou le rollback). Sert à invalider
+        les caches : avant le commit, les autres connexions liraient encore les anciennes données.
+        """
+        if getattr(self._local, "batch_depth", 0):
+            self._local.after_commit.append(callback)
+        else:
+            callback()
+
+    def _run_after_commit(self):
+        callbacks, self._local.after_commit = self._local.after_commit, []
+        for callback in callbacks:
+            callback()
+
+    @contextmanager
+    def _transaction(self):
+        # Dans un batch(), le commit est différé jusqu'à la fin du bloc
+        conn = self.connection()
+        if getattr(self._local, "batch_depth", 0):
+            yield conn
+        else:
+            with conn:
+                yield conn
+
+    @contextmanager
+    def _bulk_transaction(self):
+        """
+        Transaction d'une écriture groupée d'au moins BULK_SYNC_MIN_ROWS lignes. Les triggers qui tiennent
+        trainings_fts et daily_stats à jour ligne par ligne sont supprimés le temps du lot puis recréés
+        à l'identique, dans la même transaction (les autres connexions ne voient jamais la base sans eux) :
+        l'appelant met ces tables à jour avec _sync_added / _sync_removed, une requête par lot.
+        """
+        with self._transaction() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")  # sinon sqlite3 validerait chaque DROP TRIGGER immédiatement
+            placeholders = ", ".join("?" * len(ROW_SYNC_TRIGGERS))
+            triggers = conn.execute(TRIGGERS_SQL_QUERY.format(placeholders=placeholders), ROW_SYNC_TRIGGERS).fetchall()
+            for name in ROW_SYNC_TRIGGERS:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            try:
+                yield conn
+            finally:
+                for (sql,) in triggers:
+                    conn.execute(sql)
+
+    @timed("sqlite.add")
+    def add(self, t: Training):
+        with self._transaction() as conn:
+            cur = conn.execute(INSERT_QUERY, _to_row(t))
+        return cur.lastrowid
+
+    @timed("sqlite.update")
+    def update(self, t: Training):
+        with self._transaction() as conn:
+            conn.execute(UPDATE_QUERY, _to_row(t) + (t.id,))
+
+    @timed("sqlite.delete")
+    def delete(self, training_id):
+        with self._transaction() as conn:
+            conn.execute(DELETE_QUERY, (training_id,))
+
+    @timed("sqlite.add_many")
+    def add_many(self, trainings):
+        """Insère un itérable d'entraînements en une seule transaction. Retourne le nombre de lignes."""
+        rows = [_to_row(t) for t in trainings]
+        if len(rows) < BULK_SYNC_MIN_ROWS:
+            with self._transaction() as conn:
+                return conn.executemany(INSERT_QUERY, rows).rowcount
+        with self._bulk_transaction() as conn:
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM trainings").fetchone()[0]
+            cur = conn.executemany(INSERT_QUERY, rows)
+            # Sans AUTOINCREMENT, les lignes insérées reçoivent des id supérieurs au plus grand existant
+            _sync_added(conn, "id > ?", "id > ?", (last_id,))
+        return cur.rowcount
+
+    @timed("sqlite.update_many")
+    def update_many(self, trainings):
+        """Met à jour des entraînements existants en une seule transaction. Retourne le nombre de lignes trouvées."""
+        rows = [_to_row(t) + (t.id,) for t in trainings]
+        if len(rows) < BULK_SYNC_MIN_ROWS:
+            with self._transaction() as conn:
+                return conn.executemany(UPDATE_QUERY, rows).rowcount
+        with self._bulk_transaction() as conn:
+            conn.execute(BULK_UPDATES_TABLE)
+            conn.execute("DELETE FROM temp.bulk_updates")
+            # INSERT OR REPLACE : un id présent deux fois garde sa dernière version, comme des UPDATE successifs
+            conn.executemany("INSERT OR REPLACE INTO temp.bulk_updates (id, category, description, day, start_min, end_min) "
+                             "VALUES (?, ?, ?, ?, ?, ?)",
+                             (row[-1:] + row[:-1] for row in rows))
+            conn.execute(BULK_UPDATES_FLAGS)
+            found = conn.execute("SELECT COUNT(*) FROM temp.bulk_updates WHERE text_changed IS NOT NULL").fetchone()[0]
+            conn.execute(BULK_UPDATES_PRUNE)
+            _sync_removed(conn, TEXT_CHANGED_ROWS, STATS_CHANGED_ROWS)
+            conn.execute(BULK_UPDATE_QUERY)
+            _sync_added(conn, TEXT_CHANGED_ROWS, STATS_CHANGED_ROWS)
+        return found
+
+    @timed("sqlite.delete_many")
+    def delete_many(self, training_ids):
+        training_ids = list(training_ids)
+        if len(training_ids) < BULK_SYNC_MIN_ROWS:
+            with self._transaction() as conn:
+                return conn.executemany(DELETE_QUERY, ((training_id,) for training_id in training_ids)).rowcount
+        with self._bulk_transaction() as conn:
+            _fill_bulk_ids(conn, training_ids)
+            _sync_removed(conn, BULK_ROWS, BULK_ROWS)
+            cur = conn.execute(f"DELETE FROM trainings WHERE {BULK_ROWS}")
+        return cur.rowcount
+
+    @timed("sqlite.add_rule")
+    def add_rule(self, rule: TrainingRule):
+        with self._transaction() as conn:
+            rule_id = conn.execute(INSERT_RULE_QUERY, rule.to_db_row()).lastrowid
+            conn.executemany(INSERT_RULE_EXCEPTION_QUERY, ((rule_id, day.toordinal()) for day in rule.exceptions))
+        return rule_id
+
+    @timed("sqlite.delete_rule")
+    def delete_rule(self, rule_id):
+        # Les dates exclues sont supprimées en cascade (foreign_keys=ON)
+        with self._transaction() as conn:
+            conn.execute(DELETE_RULE_QUERY, (rule_id,))
+
+    @timed("sqlite.add_rule_exception")
+    def add_rule_exception(self, rule_id, day):
+        with self._transaction() as conn:
+            conn.execute(INSERT_RULE_EXCEPTION_QUERY, (rule_id, day.toordinal()))
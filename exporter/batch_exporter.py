@@ -0,0 +1,90 @@
+# exporter/batch_exporter.py
+import multiprocessing
+import os
+import re
+import time as timer
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from db.repository import month_bounds
+from exporter.pdf_exporter import render_trainings_pdf, period_label
+from utils.instrumentation import timed
+
+
+def category_slugs(categories):
+    """
+    Nom de fichier de chaque catégorie. Deux catégories qui donneraient le même nom
+    (« U15/F » et « U15 F », ou une simple différence de casse) reçoivent un suffixe numérique.
+    """
+    slugs, taken = {}, set()
+    for category in categories:
+        base = re.sub(r"[^\w-]+", "_", category).strip("_") or "categorie"
+        slug, suffix = base, 2
+        while slug.lower() in taken:
+            slug = f"{base}_{suffix}"
+            suffix += 1
+        taken.add(slug.lower())
+        slugs[category] = slug
+    return slugs
+
+
+def batch_filename(slug, year, month):
+    return f"planning_{slug}_{year}-{month:02}.pdf"
+
+
+def export_job(db_path, category, year, month, filename):
+    """
+    Un PDF (une catégorie, un mois), exécuté dans un processus du pool.
+    Chaque processus ouvre sa propre connexion SQLite : rien n'est partagé avec l'application.
+    """
+    from db.repository import TrainingRepository
+    t0 = timer.perf_counter()
+    repository = TrainingRepository(db_path)
+    try:
+        start, end = month_bounds(year, month)
+        total = repository.count_schedule(start, end, [category])
+        count = render_trainings_pdf(repository.iter_schedule(start, end, [category]), filename,
+                                     f"{period_label(start, end)} – {category}", total)
+    finally:
+        repository.close()
+    return {"category": category, "year": year, "month": month, "filename": filename,
+            "count": count, "seconds": timer.perf_counter() - t0}
+
+
+@timed("export.batch")
+def batch_export(db_path, categories, months, directory, max_workers=None, progress=None, cancelled=None):
+    """
+    Exporte un PDF par couple (catégorie, mois) dans directory, en parallèle sur plusieurs processus
+    (le rendu reportlab est limité par le CPU et le GIL, des threads n'apporteraient rien).
+
+    months : couples (année, mois). progress(done, total, résultat) est appelé à chaque fichier terminé ;
+    si cancelled() devient vrai, les exports pas encore commencés sont abandonnés.
+    Retourne la liste des résultats (un dict par fichier, avec sa durée) triée par catégorie puis mois.
+    """
+    db_path = os.path.abspath(db_path)
+    slugs = category_slugs(categories)
+    jobs = [(category, year, month, os.path.join(directory, batch_filename(slugs[category], year, month)))
+            for category in categories for (year, month) in months]
+    results = []
+    # "spawn" : pas de fork d'un processus qui contient Tk et des threads
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures = [executor.submit(export_job, db_path, *job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if progress is not None:
+                progress(len(results), len(jobs), result)
+            if cancelled is not None and cancelled():
+                break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    results.sort(key=lambda r: (r["category"], r["year"], r["month"]))
+    return results
+
+
+def format_summary(results, wall_seconds):
+    """Récapitulatif texte : durée par fichier, somme des durées et temps réel écoulé."""
+    lines = [f"{os.path.basename(r['filename'])} : {r['count']} séances, {r['seconds']:.2f} s" for r in results]
+    cpu_seconds = sum(r["seconds"] for r in results)
+    lines.append("")
+    lines.append(f"{len(results)} fichiers – cumul {cpu_seconds:.2f} s, temps réel {wall_seconds:.2f} s")
+    return "\n".join(lines)
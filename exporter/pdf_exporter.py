@@ -1,82 +1,259 @@
+from datetime import timedelta
+from functools import lru_cache
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
+from utils.instrumentation import timed
 
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 40
+ROW_HEIGHT = 14
+FONT = "Helvetica"
+FONT_SIZE = 10
+# Colonnes du tableau (abscisses) et largeurs disponibles pour le texte
+DATE_X = MARGIN
+HOUR_X = MARGIN + 80
+CATEGORY_X = MARGIN + 170
+DESCRIPTION_X = MARGIN + 300
+CATEGORY_WIDTH = DESCRIPTION_X - CATEGORY_X - 8
+DESCRIPTION_WIDTH = PAGE_WIDTH - MARGIN - DESCRIPTION_X
+
+
+class ExportCancelled(Exception):
+    """Levée quand l'utilisateur annule un export en cours (aucun fichier n'est écrit)."""
+
+
+@timed("export.trainings_pdf")
 def export_trainings_to_pdf(trainings, filename):
-    c = canvas.Canvas(filename, pagesize=A4)
-    width, height = A4
-    margin = 40
-    y = height - margin
+    # trainings : liste de Training ou TrainingBatch (lignes construites au fil du parcours)
+    if trainings:
+        mois = trainings[0].date.strftime("%B %Y").capitalize()
+    else:
+        mois = ""
+    render_trainings_pdf(trainings, filename, f"Mois : {mois}", len(trainings))
+
+
+@timed("export.period_pdf")
+def export_period_to_pdf(start, end, categories, filename, progress=None, cancelled=None):
+    """
+    Exporte une période quelconque (mois, trimestre, saison...) pour un ensemble de catégories
+    (toutes si categories est vide). Les séances sont lues en flux depuis la base ;
+    prévu pour tourner dans un thread de travail. Retourne le nombre de séances exportées.
+    """
+    from db.database import count_trainings, iter_trainings, release_connection
+    try:
+        total = count_trainings(start, end, categories)
+        trainings = iter_trainings(start, end, categories)
+        return render_trainings_pdf(trainings, filename, period_label(start, end), total,
+                                    progress=progress, cancelled=cancelled)
+    finally:
+        release_connection()
+
+
+def period_label(start, end):
+    """Libellé de l'encadré d'infos : un mois entier ou une période quelconque."""
+    next_month = start.replace(year=start.year + (start.month == 12), month=start.month % 12 + 1, day=1)
+    if start.day == 1 and end == next_month - timedelta(days=1):
+        return f"Mois : {start.strftime('%B %Y').capitalize()}"
+    return f"Période : {start.strftime('%d/%m/%Y')} – {end.strftime('%d/%m/%Y')}"
+
 
-    # Bandeau titre coloré
+@lru_cache(maxsize=16384)
+def text_width(text, font=FONT, size=FONT_SIZE):
+    """stringWidth mémorisé : les mots et catégories reviennent sans cesse d'une séance à l'autre."""
+    return stringWidth(text, font, size)
+
+
+@lru_cache(maxsize=8192)
+def wrap_pdf_text(text, max_width, font=FONT, size=FONT_SIZE):
+    """
+    Découpe text en lignes d'au plus max_width points (largeur réelle des glyphes),
+    en conservant les retours à la ligne saisis. Un mot trop long est coupé.
+    Retourne un tuple de lignes (au moins une).
+    """
+    space = text_width(" ", font, size)
+    lines = []
+    for paragraph in (text.splitlines() or [""]):
+        current, current_width = "", 0.0
+        for word in paragraph.split():
+            word_width = text_width(word, font, size)
+            while word_width > max_width:
+                # Mot plus large que la colonne : on le coupe au dernier caractère qui tient
+                if current:
+                    lines.append(current)
+                    current, current_width = "", 0.0
+                cut = len(word) - 1
+                while cut > 1 and text_width(word[:cut], font, size) > max_width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+                word_width = text_width(word, font, size)
+            if not current:
+                current, current_width = word, word_width
+            elif current_width + space + word_width <= max_width:
+                current, current_width = current + " " + word, current_width + space + word_width
+            else:
+                lines.append(current)
+                current, current_width = word, word_width
+        lines.append(current)
+    return tuple(lines)
+
+
+@lru_cache(maxsize=1024)
+def fit_pdf_text(text, max_width, font=FONT, size=FONT_SIZE):
+    """Texte sur une seule ligne, tronqué avec « … » s'il dépasse max_width."""
+    if text_width(text, font, size) <= max_width:
+        return text
+    while text and text_width(text + "…", font, size) > max_width:
+        text = text[:-1]
+    return text + "…"
+
+
+def _define_templates(c):
+    """
+    Éléments fixes dessinés une seule fois sous forme de XObjects (formulaires PDF),
+    puis réutilisés par référence sur chaque page.
+    """
+    # Bandeau titre coloré (première page)
+    c.beginForm("title_band")
+    y = PAGE_HEIGHT - MARGIN
     c.setFillColorRGB(0.18, 0.32, 0.52)  # Bleu basket pro
-    c.roundRect(margin-10, y-20, width-2*margin+20, 40, 10, fill=1, stroke=0)
+    c.roundRect(MARGIN-10, y-20, PAGE_WIDTH-2*MARGIN+20, 40, 10, fill=1, stroke=0)
     c.setFillColor(colors.white)
     c.setFont("Helvetica-Bold", 18)
-    c.drawCentredString(width / 2, y, "Planning des Entraînements")
-    y -= 40
+    c.drawCentredString(PAGE_WIDTH / 2, y, "Planning des Entraînements")
+    c.endForm()
+
+    # En-tête de tableau stylisé, dessiné autour de y = 0 (positionné par translation)
+    # (la BBox du formulaire doit englober ces coordonnées négatives, sinon le contenu est rogné)
+    c.beginForm("table_header", lowerx=0, lowery=-20, upperx=PAGE_WIDTH, uppery=10)
+    c.setFillColorRGB(0.85, 0.89, 0.98)
+    c.roundRect(MARGIN-2, -18, PAGE_WIDTH-2*MARGIN+4, 22, 5, fill=1, stroke=0)
+    c.setFillColor(colors.HexColor("#2d3a4a"))
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(DATE_X, -5, "Date")
+    c.drawString(HOUR_X, -5, "Heure")
+    c.drawString(CATEGORY_X, -5, "Catégorie")
+    c.drawString(DESCRIPTION_X, -5, "Description")
+    c.endForm()
+
+    # Pied de page (le numéro de page, variable, est ajouté à part)
+    c.beginForm("footer")
+    c.setStrokeColor(colors.HexColor("#d0d4dc"))
+    c.setLineWidth(0.5)
+    c.line(MARGIN, MARGIN - 10, PAGE_WIDTH - MARGIN, MARGIN - 10)
+    c.setFillColor(colors.HexColor("#888888"))
+    c.setFont(FONT, 8)
+    c.drawString(MARGIN, MARGIN - 22, "PlanningBasket")
+    c.endForm()
+
 
-    # Encadré d'infos (mois, nombre de séances)
+def _row_background(c, defined, nb_lines, y):
+    # Fond arrondi d'une séance : un XObject par nombre de lignes, partagé par toutes les séances
+    name = f"row_bg_{nb_lines}"
+    if name not in defined:
+        total_height = nb_lines * ROW_HEIGHT + 2
+        c.beginForm(name, lowerx=0, lowery=-total_height, upperx=PAGE_WIDTH, uppery=ROW_HEIGHT + 2)
+        c.setFillColor(colors.HexColor("#f7f7f9"))
+        c.roundRect(MARGIN-2, -total_height+ROW_HEIGHT, PAGE_WIDTH-2*MARGIN+4, total_height, 3, fill=1, stroke=0)
+        c.endForm()
+        defined.add(name)
+    _place_form(c, name, y)
+
+
+def _place_form(c, name, y):
+    c.saveState()
+    c.translate(0, y)
+    c.doForm(name)
+    c.restoreState()
+
+
+def _body_style(c):
+    # Police et couleur du corps, posées une fois par page (les formulaires restaurent l'état graphique)
+    c.setFillColor(colors.black)
+    c.setFont(FONT, FONT_SIZE)
+
+
+def _finish_page(c, page_number):
+    c.doForm("footer")
+    c.setFillColor(colors.HexColor("#888888"))
+    c.setFont(FONT, 8)
+    c.drawRightString(PAGE_WIDTH - MARGIN, MARGIN - 22, f"Page {page_number}")
+
+
+@timed("export.render_pdf")
+def render_trainings_pdf(trainings, filename, info_label, total, progress=None, cancelled=None, progress_every=200):
+    """
+    Écrit le PDF en parcourant trainings une seule fois : un itérable (générateur de la base
+    par exemple) suffit, les séances ne sont jamais toutes en mémoire.
+
+    total : nombre de séances annoncé dans l'encadré (connu à l'avance, par un COUNT).
+    progress(done, total) est appelé toutes les progress_every séances ;
+    si cancelled() devient vrai, l'export s'arrête avec ExportCancelled sans écrire le fichier.
+    """
+    c = canvas.Canvas(filename, pagesize=A4)
+    _define_templates(c)
+    defined_rows = set()
+    page_number = 1
+
+    c.doForm("title_band")
+    y = PAGE_HEIGHT - MARGIN - 40
+
+    # Encadré d'infos (mois ou période, nombre de séances) : seul élément variable de l'en-tête
     c.setFillColorRGB(0.95, 0.95, 0.98)
-    c.roundRect(margin-5, y-35, width-2*margin+10, 32, 8, fill=1, stroke=0)
+    c.roundRect(MARGIN-5, y-35, PAGE_WIDTH-2*MARGIN+10, 32, 8, fill=1, stroke=0)
     c.setFillColor(colors.black)
     c.setFont("Helvetica", 11)
-    if trainings:
-        mois = trainings[0].date.strftime("%B %Y").capitalize()
-    else:
-        mois = ""
-    c.drawString(margin, y-18, f"Mois : {mois}")
-    c.drawRightString(width-margin, y-18, f"Nombre de séances : {len(trainings)}")
+    c.drawString(MARGIN, y-18, info_label)
+    c.drawRightString(PAGE_WIDTH-MARGIN, y-18, f"Nombre de séances : {total}")
     y -= 45
 
-    # En-tête de tableau stylisé
-    c.setFillColorRGB(0.85, 0.89, 0.98)
-    c.roundRect(margin-2, y-18, width-2*margin+4, 22, 5, fill=1, stroke=0)
-    c.setFillColor(colors.HexColor("#2d3a4a"))
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(margin, y-5, "Date")
-    c.drawString(margin + 80, y-5, "Heure")
-    c.drawString(margin + 170, y-5, "Catégorie")
-    c.drawString(margin + 300, y-5, "Description")
+    _place_form(c, "table_header", y)
     y -= 25
+    _body_style(c)
 
     # Corps du tableau
-    c.setFont("Helvetica", 10)
-    c.setFillColor(colors.black)
-    row_height = 14
+    done = 0
     for t in trainings:
-        date_str = t.date.strftime('%d/%m/%Y')
-        hour_str = f"{t.start_time.strftime('%H:%M')} – {t.end_time.strftime('%H:%M')}"
-        desc_lines = t.description.splitlines() if t.description else [""]
-        nb_lines = max(1, len(desc_lines))
-        total_height = nb_lines * row_height + 2 + (nb_lines-1)*0  # +2 pour marge haute, pas d'espacement entre lignes
-
-        # Saut de page si besoin
-        if y - total_height < margin + 40:
+        desc_lines = wrap_pdf_text(t.description, DESCRIPTION_WIDTH)
+        nb_lines = len(desc_lines)
+        total_height = nb_lines * ROW_HEIGHT + 2  # +2 pour marge haute, pas d'espacement entre lignes
+
+        # Saut de page si besoin (l'en-tête de tableau est répété en haut de la nouvelle page)
+        if y - total_height < MARGIN + 40:
+            _finish_page(c, page_number)
             c.showPage()
-            y = height - margin - 60
+            page_number += 1
+            y = PAGE_HEIGHT - MARGIN
+            _place_form(c, "table_header", y)
+            y -= 25
+            _body_style(c)
 
-        # Encadrement sur toute la hauteur de l'événement
-        c.setFillColor(colors.HexColor("#f7f7f9"))
-        c.roundRect(margin-2, y-total_height+row_height, width-2*margin+4, total_height, 3, fill=1, stroke=0)
-        c.setFillColor(colors.black)
+        _row_background(c, defined_rows, nb_lines, y)
 
         # Texte
         y_line = y + 2
-        c.drawString(margin, y_line, date_str)
-        c.drawString(margin + 80, y_line, hour_str)
-        c.drawString(margin + 170, y_line, t.category)
-        first = True
+        c.drawString(DATE_X, y_line, t.date.strftime('%d/%m/%Y'))
+        c.drawString(HOUR_X, y_line, f"{t.start_time.strftime('%H:%M')} – {t.end_time.strftime('%H:%M')}")
+        c.drawString(CATEGORY_X, y_line, fit_pdf_text(t.category, CATEGORY_WIDTH))
         for line in desc_lines:
-            c.drawString(margin + 300, y_line, line)
-            if first:
-                first = False
-            else:
-                c.drawString(margin, y_line, "")
-                c.drawString(margin + 80, y_line, "")
-                c.drawString(margin + 170, y_line, "")
-            y_line -= row_height
+            c.drawString(DESCRIPTION_X, y_line, line)
+            y_line -= ROW_HEIGHT
 
         y -= total_height + 2  # Espace entre les séances
 
-    c.save()
\ No newline at end of file
+        done += 1
+        if done % progress_every == 0:
+            if cancelled is not None and cancelled():
+                raise ExportCancelled()
+            if progress is not None:
+                progress(done, total)
+
+    if cancelled is not None and cancelled():
+        raise ExportCancelled()
+    _finish_page(c, page_number)
+    c.save()
+    if progress is not None:
+        progress(done, total)
+    return done
@@ -1,24 +1,54 @@
-from ui.weekly_view import WeeklyPlanner
+import argparse
 import tkinter as tk
+from utils.startup_profile import startup_profile
 
-def main():
-    root = tk.Tk()
-    root.title("PlanningBasket")  # Nom de l'application changé ici
-    # --- Définir l'icône de la fenêtre ---
-    try:
-        import sys
-        if sys.platform.startswith("win"):
-            root.iconbitmap("assets/basket.ico")
-        else:
-            # Pour Mac/Linux, il faut un .png (transparence gérée)
-            icon = tk.PhotoImage(file="assets/basket.png")
-            root.iconphoto(True, icon)
-    except Exception as e:
-        print("Impossible de charger l'icône personnalisée :", e)
-    # --- Fin icône ---
-    app = WeeklyPlanner(root)
-    app.pack(fill="both", expand=True)
-    root.mainloop()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PlanningBasket")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="affiche la durée de chaque phase du démarrage")
+    parser.add_argument("--quit-after-startup", action="store_true",
+                        help="quitte après le premier affichage (mesures automatiques)")
+    args = parser.parse_args(argv)
+    startup_profile.enabled = args.profile_startup
+
+    with startup_profile.phase("imports"):
+        from ui.weekly_view import WeeklyPlanner
+        from ui.charts import release_charts
+        from db.database import get_repository
+    with startup_profile.phase("base de données (ouverture, schéma)"):
+        get_repository()
+
+    with startup_profile.phase("fenêtre Tk"):
+        root = tk.Tk()
+        root.title("PlanningBasket")  # Nom de l'application changé ici
+        # --- Définir l'icône de la fenêtre ---
+        try:
+            import sys
+            if sys.platform.startswith("win"):
+                root.iconbitmap("assets/basket.ico")
+            else:
+                # Pour Mac/Linux, il faut un .png (transparence gérée)
+                icon = tk.PhotoImage(file="assets/basket.png")
+                root.iconphoto(True, icon)
+        except Exception as e:
+            print("Impossible de charger l'icône personnalisée :", e)
+        # --- Fin icône ---
+    with startup_profile.phase("interface"):
+        app = WeeklyPlanner(root)
+        app.pack(fill="both", expand=True)
+    with startup_profile.phase("premier affichage"):
+        root.update()
+
+    if args.profile_startup:
+        print(startup_profile.report(), flush=True)
+    if args.quit_after_startup:
+        root.destroy()
+    else:
+        root.mainloop()
+    release_charts()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Nécessaire pour les processus d'export en lot dans l'exécutable PyInstaller
+    import multiprocessing
+    multiprocessing.freeze_support()
+    main()
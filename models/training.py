@@ -1,7 +1,12 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, validator
 from datetime import datetime, time, date
+from utils.date_utils import MINUTE_TIMES
 
 class Training(BaseModel):
+    # Schéma de validation construit à la première saisie plutôt qu'à l'import :
+    # l'affichage de la semaine passe par from_db_row, qui ne valide pas
+    model_config = ConfigDict(defer_build=True)
+
     id: int | None = None
     category: str
     description: str
@@ -15,3 +20,30 @@ class Training(BaseModel):
             raise ValueError("L’heure de fin doit être après celle de début")
         return v
 
+    @classmethod
+    def from_db_row(cls, row):
+        """
+        Construit un Training à partir d'une ligne (id, category, description, day, start_min, end_min).
+        Les données viennent de la base, déjà validées à l'écriture : on saute la validation pydantic.
+        Les saisies utilisateur doivent toujours passer par Training(...).
+        """
+        # Même état interne que model_construct(), sans son surcoût par champ
+        training_id, category, description, day, start_min, end_min = row
+        t = _new_object(cls)
+        _set_attribute(t, "__dict__", {
+            "id": training_id,
+            "category": category,
+            "description": description,
+            "date": date.fromordinal(day),
+            "start_time": MINUTE_TIMES[start_min],
+            "end_time": MINUTE_TIMES[end_min],
+        })
+        _set_attribute(t, "__pydantic_fields_set__", set(_FIELD_NAMES))
+        _set_attribute(t, "__pydantic_extra__", None)
+        _set_attribute(t, "__pydantic_private__", None)
+        return t
+
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+_FIELD_NAMES = frozenset(Training.model_fields)
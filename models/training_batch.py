@@ -0,0 +1,116 @@
+# models/training_batch.py
+import sys
+from array import array
+from datetime import date
+from models.training import Training
+from utils.text_utils import fold_text
+
+
+class TrainingBatch:
+    """
+    Résultat de requête stocké en colonnes (array) plutôt qu'en liste d'objets Training.
+
+    Colonnes : ids, jours (date.toordinal()), minutes de début / fin et codes de catégorie.
+    Les descriptions sont internées (une seule chaîne en mémoire par texte distinct).
+    Un Training n'est construit qu'à la demande, quand on accède à une ligne
+    (batch[i] ou itération), ce qui garde un historique d'un million de séances
+    dans quelques dizaines de Mo.
+    """
+
+    __slots__ = ("ids", "days", "start_minutes", "end_minutes", "category_codes", "categories", "descriptions")
+
+    def __init__(self, categories=None):
+        self.ids = array("q")
+        self.days = array("l")
+        self.start_minutes = array("H")
+        self.end_minutes = array("H")
+        self.category_codes = array("H")
+        self.categories = list(categories) if categories else []  # code -> nom de catégorie
+        self.descriptions = []
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Construit un batch depuis des lignes (id, category, description, day, start_min, end_min)."""
+        batch = cls()
+        codes = {}
+        intern = sys.intern
+        ids, days, starts, ends = batch.ids, batch.days, batch.start_minutes, batch.end_minutes
+        category_codes, descriptions = batch.category_codes, batch.descriptions
+        for training_id, category, description, day, start_min, end_min in rows:
+            code = codes.get(category)
+            if code is None:
+                code = codes[category] = len(batch.categories)
+                batch.categories.append(category)
+            ids.append(training_id)
+            days.append(day)
+            starts.append(start_min)
+            ends.append(end_min)
+            category_codes.append(code)
+            descriptions.append(intern(description))
+        return batch
+
+    # --- Accès ligne par ligne (vues Training paresseuses) ---
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, index):
+        return (self.ids[index], self.categories[self.category_codes[index]], self.descriptions[index],
+                self.days[index], self.start_minutes[index], self.end_minutes[index])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.select(range(*index.indices(len(self))))
+        return Training.from_db_row(self.row(index))
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield Training.from_db_row(self.row(index))
+
+    def rows(self):
+        for index in range(len(self.ids)):
+            yield self.row(index)
+
+    # --- Sélections ---
+
+    def select(self, indices):
+        """Nouveau batch contenant les lignes d'indices donnés (les catégories sont partagées)."""
+        batch = TrainingBatch(self.categories)
+        for index in indices:
+            batch.ids.append(self.ids[index])
+            batch.days.append(self.days[index])
+            batch.start_minutes.append(self.start_minutes[index])
+            batch.end_minutes.append(self.end_minutes[index])
+            batch.category_codes.append(self.category_codes[index])
+            batch.descriptions.append(self.descriptions[index])
+        return batch
+
+    def between(self, start: date, end: date):
+        """Lignes dont la date est comprise entre start et end (inclus)."""
+        first, last = start.toordinal(), end.toordinal()
+        return self.select([i for i, day in enumerate(self.days) if first <= day <= last])
+
+    def filter_keyword(self, keyword):
+        """Lignes dont la description ou la catégorie contient le mot-clé (sans tenir compte de la casse ni des accents)."""
+        keyword = fold_text(keyword)
+        if not keyword:
+            return self
+        category_match = [keyword in fold_text(category) for category in self.categories]
+        # Chaque description distincte n'est testée qu'une fois
+        description_match = {}
+        indices = []
+        for i, description in enumerate(self.descriptions):
+            if category_match[self.category_codes[i]]:
+                indices.append(i)
+                continue
+            match = description_match.get(description)
+            if match is None:
+                match = description_match[description] = keyword in fold_text(description)
+            if match:
+                indices.append(i)
+        return self.select(indices)
+
+    def nbytes(self):
+        """Taille approximative des colonnes (hors chaînes internées partagées)."""
+        columns = (self.ids, self.days, self.start_minutes, self.end_minutes, self.category_codes)
+        return sum(col.itemsize * len(col) for col in columns) + sys.getsizeof(self.descriptions)
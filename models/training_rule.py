@@ -0,0 +1,93 @@
+# models/training_rule.py
+from datetime import date, time
+from models.training import Training
+from utils.date_utils import time_to_minutes
+
+WEEKDAY_NAMES = ("Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche")
+
+# Identifiant d'une occurrence : négatif (jamais celui d'une séance stockée), il encode la règle et le jour
+OCCURRENCE_ID_BASE = 10_000_000  # > date.max.toordinal()
+
+
+def occurrence_id(rule_id, day):
+    return -(rule_id * OCCURRENCE_ID_BASE + day)
+
+
+def split_occurrence_id(training_id):
+    """(id de la règle, date) si training_id désigne une occurrence, sinon None."""
+    if training_id is None or training_id >= 0:
+        return None
+    rule_id, day = divmod(-training_id, OCCURRENCE_ID_BASE)
+    return rule_id, date.fromordinal(day)
+
+
+class TrainingRule:
+    """
+    Séance récurrente : chaque semaine, aux jours weekdays (0 = lundi), de first_day à last_day
+    inclus, sauf aux dates de exceptions.
+
+    Seule la règle est stockée. Ses occurrences sont calculées pour la période demandée,
+    sous forme de lignes (id, category, description, day, start_min, end_min) identiques
+    à celles de la table trainings.
+    """
+
+    __slots__ = ("id", "category", "description", "start_time", "end_time", "weekdays",
+                 "first_day", "last_day", "exceptions")
+
+    def __init__(self, category, description, start_time: time, end_time: time, weekdays,
+                 first_day: date, last_day: date, exceptions=(), id=None):
+        weekdays = frozenset(weekdays)
+        if end_time <= start_time:
+            raise ValueError("L’heure de fin doit être après celle de début")
+        if not weekdays or not weekdays <= set(range(7)):
+            raise ValueError("Choisissez au moins un jour de la semaine")
+        if last_day < first_day:
+            raise ValueError("La date de fin de la récurrence doit suivre la date de début")
+        self.id = id
+        self.category = category
+        self.description = description
+        self.start_time = start_time
+        self.end_time = end_time
+        self.weekdays = weekdays
+        self.first_day = first_day
+        self.last_day = last_day
+        self.exceptions = set(exceptions)
+
+    @classmethod
+    def from_db_row(cls, row, exceptions=()):
+        """Règle depuis une ligne (id, category, description, start_min, end_min, weekdays, first_day, last_day)."""
+        rule_id, category, description, start_min, end_min, mask, first_day, last_day = row
+        return cls(category, description, time(start_min // 60, start_min % 60), time(end_min // 60, end_min % 60),
+                   (weekday for weekday in range(7) if mask >> weekday & 1),
+                   date.fromordinal(first_day), date.fromordinal(last_day), exceptions, id=rule_id)
+
+    def to_db_row(self):
+        """(category, description, start_min, end_min, weekdays, first_day, last_day) pour l'insertion."""
+        return (self.category, self.description, time_to_minutes(self.start_time), time_to_minutes(self.end_time),
+                sum(1 << weekday for weekday in self.weekdays), self.first_day.toordinal(), self.last_day.toordinal())
+
+    def occurrence_days(self, start: date, end: date):
+        """Dates des occurrences comprises entre start et end (inclus), triées."""
+        first = max(start, self.first_day).toordinal()
+        last = min(end, self.last_day).toordinal()
+        excluded = {day.toordinal() for day in self.exceptions}
+        days = []
+        for weekday in self.weekdays:
+            # date.fromordinal(1) est un lundi : (ordinal - 1) % 7 donne le jour de semaine
+            day = first + (weekday - (first - 1) % 7) % 7
+            days.extend(d for d in range(day, last + 1, 7) if d not in excluded)
+        days.sort()
+        return days
+
+    def occurrence_rows(self, start: date, end: date):
+        start_min, end_min = time_to_minutes(self.start_time), time_to_minutes(self.end_time)
+        return [(occurrence_id(self.id, day), self.category, self.description, day, start_min, end_min)
+                for day in self.occurrence_days(start, end)]
+
+    def occurrences(self, start: date, end: date):
+        return [Training.from_db_row(row) for row in self.occurrence_rows(start, end)]
+
+    def describe(self):
+        days = ", ".join(WEEKDAY_NAMES[weekday].lower() for weekday in sorted(self.weekdays))
+        return (f"Chaque {days}, {self.start_time:%H:%M} – {self.end_time:%H:%M}, "
+                f"du {self.first_day:%d/%m/%Y} au {self.last_day:%d/%m/%Y}")
@@ -0,0 +1,72 @@
+# stats/daily_stats.py
+"""
+Vérification et reconstruction de la table daily_stats (agrégats par jour et par catégorie).
+
+Les triggers la tiennent à jour à chaque écriture ; ces commandes servent après une
+modification de la base hors de l'application, ou en cas de doute :
+
+    python -m stats.daily_stats --check
+    python -m stats.daily_stats --rebuild --db trainings.db
+"""
+import argparse
+from datetime import date
+
+from db.migrations import DAILY_STATS_REBUILD_SQL
+from stats.training_stats import repository_or_default
+
+# Écarts entre les agrégats attendus (recalculés depuis trainings) et ceux de daily_stats
+CHECK_QUERY = '''
+    SELECT expected.day, expected.category, expected.sessions, expected.minutes, stored.sessions, stored.minutes
+    FROM (SELECT day, category, COUNT(*) AS sessions, SUM(end_min - start_min) AS minutes
+          FROM trainings GROUP BY day, category) AS expected
+    LEFT JOIN daily_stats AS stored USING (day, category)
+    WHERE stored.sessions IS NOT expected.sessions OR stored.minutes IS NOT expected.minutes
+    UNION ALL
+    SELECT stored.day, stored.category, 0, 0, stored.sessions, stored.minutes
+    FROM daily_stats AS stored
+    WHERE NOT EXISTS (SELECT 1 FROM trainings WHERE day = stored.day AND category = stored.category)
+    ORDER BY 1, 2
+'''
+
+
+def check_daily_stats(repository=None):
+    """
+    Liste des écarts : tuples (date, catégorie, (séances, minutes) attendues, (séances, minutes) stockées).
+    Une liste vide signifie que daily_stats est cohérente avec trainings.
+    """
+    rows = repository_or_default(repository).connection().execute(CHECK_QUERY).fetchall()
+    return [(date.fromordinal(day), category, (expected_sessions, expected_minutes), (sessions or 0, minutes or 0))
+            for day, category, expected_sessions, expected_minutes, sessions, minutes in rows]
+
+
+def rebuild_daily_stats(repository=None):
+    """Recalcule entièrement daily_stats depuis trainings. Retourne le nombre de lignes d'agrégats."""
+    repository = repository_or_default(repository)
+    with repository.batch():
+        conn = repository.connection()
+        conn.execute("DELETE FROM daily_stats")
+        conn.execute(DAILY_STATS_REBUILD_SQL)
+        return conn.execute("SELECT COUNT(*) FROM daily_stats").fetchone()[0]
+
+
+if __name__ == "__main__":
+    from db.repository import TrainingRepository
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default="trainings.db")
+    parser.add_argument("--rebuild", action="store_true", help="reconstruit la table (sinon : vérification seule)")
+    parser.add_argument("--check", action="store_true", help="vérifie la cohérence (par défaut)")
+    args = parser.parse_args()
+
+    repository = TrainingRepository(args.db)
+    try:
+        if args.rebuild:
+            print(f"daily_stats reconstruite : {rebuild_daily_stats(repository)} lignes")
+        differences = check_daily_stats(repository)
+        for day, category, expected, stored in differences:
+            print(f"{day.isoformat()} {category} : attendu {expected[0]} séances / {expected[1]} min, "
+                  f"trouvé {stored[0]} / {stored[1]}")
+        print("daily_stats cohérente" if not differences else f"{len(differences)} écart(s)")
+    finally:
+        repository.close()
+    raise SystemExit(1 if differences else 0)
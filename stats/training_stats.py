@@ -0,0 +1,163 @@
+# stats/training_stats.py
+"""
+Statistiques des entraînements calculées par SQLite.
+
+Toutes les fonctions prennent une période [start, end] (dates incluses) et, si besoin,
+une liste de catégories (vide ou None = toutes). Les totaux par jour, semaine, mois et catégorie
+sont lus dans daily_stats (agrégats par jour et par catégorie tenus à jour par triggers,
+voir db/migrations.py) : une saison ou dix ans coûtent au plus une ligne par jour et par catégorie.
+Seule la carte de chaleur par heure relit les séances (via l'index couvrant).
+Les séances récurrentes ne sont pas stockées : leurs occurrences sur la période sont calculées
+depuis les règles et ajoutées à chaque total.
+"""
+from datetime import date, timedelta
+
+from db.repository import month_bounds
+
+# date.fromordinal(1) est un lundi : (day - 1) % 7 donne le jour de semaine (0 = lundi)
+WEEKDAY_SQL = "((day - 1) % 7)"
+DURATION_SQL = "(end_min - start_min)"
+
+
+def repository_or_default(repository):
+    """Le dépôt donné, ou celui de l'application (db.database.get_repository) si None."""
+    if repository is None:
+        from db.database import get_repository
+        repository = get_repository()
+    return repository
+
+
+def _where(start, end, categories):
+    sql = "WHERE day BETWEEN ? AND ?"
+    params = [start.toordinal(), end.toordinal()]
+    if categories:
+        sql += f" AND category IN ({', '.join('?' * len(categories))})"
+        params += list(categories)
+    return sql, params
+
+
+def _query(repository, select, start, end, categories, group_by="", table="daily_stats"):
+    where, params = _where(start, end, categories)
+    sql = f"SELECT {select} FROM {table} {where}"
+    if group_by:
+        sql += f" GROUP BY {group_by} ORDER BY {group_by}"
+    return repository_or_default(repository).connection().execute(sql, params).fetchall()
+
+
+def _occurrence_rows(repository, start, end, categories):
+    return repository_or_default(repository).occurrence_rows(start, end, categories)
+
+
+# --- Périodes usuelles ---
+
+def month_period(reference_date):
+    return month_bounds(reference_date.year, reference_date.month)
+
+
+def season_period(reference_date):
+    """Saison sportive : du 1er septembre au 30 juin."""
+    year = reference_date.year if reference_date.month >= 9 else reference_date.year - 1
+    return date(year, 9, 1), date(year + 1, 6, 30)
+
+
+def year_period(reference_date):
+    return date(reference_date.year, 1, 1), date(reference_date.year, 12, 31)
+
+
+# --- Agrégats ---
+
+def summary(start, end, categories=None, repository=None):
+    """{"sessions": nombre de séances, "minutes": durée totale}."""
+    sessions, minutes = _query(repository, "COALESCE(SUM(sessions), 0), COALESCE(SUM(minutes), 0)", start, end, categories)[0]
+    occurrences = _occurrence_rows(repository, start, end, categories)
+    return {"sessions": sessions + len(occurrences), "minutes": minutes + sum(row[5] - row[4] for row in occurrences)}
+
+
+def by_category(start, end, categories=None, repository=None):
+    """{catégorie: {"sessions", "minutes"}}, par nombre de séances décroissant."""
+    totals = {category: [sessions, minutes] for category, sessions, minutes
+              in _query(repository, "category, SUM(sessions), SUM(minutes)", start, end, categories, group_by="category")}
+    for row in _occurrence_rows(repository, start, end, categories):
+        total = totals.setdefault(row[1], [0, 0])
+        total[0] += 1
+        total[1] += row[5] - row[4]
+    rows = sorted(totals.items(), key=lambda item: (-item[1][0], item[0]))
+    return {category: {"sessions": sessions, "minutes": minutes} for category, (sessions, minutes) in rows}
+
+
+def by_day(start, end, categories=None, repository=None):
+    """{date: (séances, minutes)} pour les jours qui ont au moins une séance."""
+    rows = _query(repository, "day, SUM(sessions), SUM(minutes)", start, end, categories, group_by="day")
+    per_day = {date.fromordinal(day): (sessions, minutes) for day, sessions, minutes in rows}
+    occurrences = _occurrence_rows(repository, start, end, categories)
+    for row in occurrences:
+        day = date.fromordinal(row[3])
+        sessions, minutes = per_day.get(day, (0, 0))
+        per_day[day] = (sessions + 1, minutes + row[5] - row[4])
+    return dict(sorted(per_day.items())) if occurrences else per_day
+
+
+def by_iso_week(start, end, categories=None, repository=None):
+    """
+    {(année ISO, semaine ISO): {"sessions", "minutes"}} trié par semaine.
+    SQLite n'a pas de semaine ISO : on lit les totaux par jour (au plus 366 lignes par an)
+    puis on regroupe les jours par semaine.
+    """
+    weeks = {}
+    for day, (sessions, minutes) in by_day(start, end, categories, repository).items():
+        iso = day.isocalendar()
+        week = weeks.setdefault((iso[0], iso[1]), {"sessions": 0, "minutes": 0})
+        week["sessions"] += sessions
+        week["minutes"] += minutes
+    return dict(sorted(weeks.items()))
+
+
+def by_month(start, end, categories=None, repository=None):
+    """{(année, mois): {"sessions", "minutes"}} trié par mois (agrégé depuis by_day)."""
+    months = {}
+    for day, (sessions, minutes) in by_day(start, end, categories, repository).items():
+        month = months.setdefault((day.year, day.month), {"sessions": 0, "minutes": 0})
+        month["sessions"] += sessions
+        month["minutes"] += minutes
+    return dict(sorted(months.items()))
+
+
+def weekday_hour_heatmap(start, end, categories=None, repository=None, value="sessions"):
+    """
+    Matrice 7 x 24 (lundi..dimanche x heure de début) du nombre de séances
+    (value="sessions") ou des minutes d'entraînement (value="minutes").
+    """
+    select = "COUNT(*)" if value == "sessions" else f"SUM({DURATION_SQL})"
+    rows = _query(repository, f"{WEEKDAY_SQL} AS weekday, start_min / 60 AS hour, {select}",
+                  start, end, categories, group_by="weekday, hour", table="trainings")
+    grid = [[0] * 24 for _ in range(7)]
+    for weekday, hour, total in rows:
+        grid[weekday][hour] = total
+    for row in _occurrence_rows(repository, start, end, categories):
+        grid[(row[3] - 1) % 7][row[4] // 60] += 1 if value == "sessions" else row[5] - row[4]
+    return grid
+
+
+def weekly_trend(start, end, categories=None, repository=None, window=4):
+    """
+    Tendance hebdomadaire : pour chaque semaine de la période (y compris les semaines vides),
+    séances et minutes de la semaine et leur moyenne glissante sur `window` semaines.
+    """
+    weeks = by_iso_week(start, end, categories, repository)
+    monday = start - timedelta(days=start.weekday())
+    result = []
+    history = []
+    while monday <= end:
+        iso = monday.isocalendar()
+        week = weeks.get((iso[0], iso[1]), {"sessions": 0, "minutes": 0})
+        history.append(week)
+        recent = history[-window:]
+        result.append({
+            "week_start": monday,
+            "sessions": week["sessions"],
+            "minutes": week["minutes"],
+            "avg_sessions": sum(w["sessions"] for w in recent) / len(recent),
+            "avg_minutes": sum(w["minutes"] for w in recent) / len(recent),
+        })
+        monday += timedelta(days=7)
+    return result
@@ -0,0 +1,16 @@
+# tests/conftest.py
+import pytest
+
+from db import database
+
+
+@pytest.fixture
+def empty_repository(tmp_path, monkeypatch):
+    # Base vide pour chaque test : le dépôt partagé de db.database est recréé sur un fichier temporaire
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "trainings.db"))
+    monkeypatch.setattr(database, "_repository", None)
+    database.cache.clear()
+    repository = database.get_repository()
+    yield repository
+    repository.close()
+    database.cache.clear()
@@ -0,0 +1,117 @@
+# tests/test_bulk_writes.py
+"""
+add_many / update_many / delete_many tiennent trainings_fts et daily_stats à jour soit par les triggers
+ligne à ligne (petits lots), soit par des requêtes groupées (BULK_SYNC_MIN_ROWS lignes et plus) :
+chaque cas est joué sur les deux chemins, puis comparé aux agrégats recalculés et à la recherche.
+"""
+from datetime import date, time, timedelta
+
+import pytest
+
+from db import database, repository as repository_module
+from models.training import Training
+from stats.daily_stats import check_daily_stats
+
+FIRST_DAY = date(2024, 9, 2)
+
+
+def training(category, description, day, start=time(18, 0), end=time(19, 30)):
+    return Training(category=category, description=description, date=day, start_time=start, end_time=end)
+
+
+@pytest.fixture(params=["triggers", "set_based"])
+def repository(request, empty_repository, monkeypatch):
+    monkeypatch.setattr(repository_module, "BULK_SYNC_MIN_ROWS", 10 ** 9 if request.param == "triggers" else 0)
+    empty_repository.add_many([
+        training("U13", "Défense de zone", FIRST_DAY),
+        training("U15", "Match amical", FIRST_DAY + timedelta(days=1)),
+        training("U15", "Tir en course", FIRST_DAY + timedelta(days=2)),
+    ])
+    return empty_repository
+
+
+def stored(repository):
+    return repository.get_range(FIRST_DAY, FIRST_DAY + timedelta(days=30))
+
+
+def assert_consistent(repository):
+    assert check_daily_stats(repository) == []
+    # Contrôle de l'index plein texte contre la table trainings (lève une erreur en cas d'écart)
+    repository.connection().execute("INSERT INTO trainings_fts (trainings_fts, rank) VALUES ('integrity-check', 1)")
+
+
+def descriptions(query):
+    return sorted(t.description for t in database.search_trainings(query))
+
+
+def test_add_many_indexes_new_rows(repository):
+    repository.add_many([training("U17", "Contre-attaque", FIRST_DAY), training("U17", "Contre rapide", FIRST_DAY)])
+    assert_consistent(repository)
+    assert descriptions("contre") == ["Contre rapide", "Contre-attaque"]
+    assert repository.connection().execute(
+        "SELECT sessions, minutes FROM daily_stats WHERE day = ? AND category = 'U17'", (FIRST_DAY.toordinal(),)
+    ).fetchone() == (2, 180)
+
+
+def test_update_many_day_only(repository):
+    moved = [t.model_copy(update={"date": t.date + timedelta(days=7)}) for t in stored(repository)]
+    assert repository.update_many(moved) == 3
+    assert_consistent(repository)
+    assert descriptions("tir") == ["Tir en course"]
+    assert [t.date for t in stored(repository)] == [t.date for t in moved]
+
+
+def test_update_many_category_only(repository):
+    renamed = [t.model_copy(update={"category": "Seniors F"}) for t in stored(repository)]
+    repository.update_many(renamed)
+    assert_consistent(repository)
+    assert descriptions("seniors") == ["Défense de zone", "Match amical", "Tir en course"]
+    assert descriptions("U15") == []
+
+
+def test_update_many_duplicate_ids_keep_last_version(repository):
+    first = stored(repository)[0]
+    repository.update_many([first.model_copy(update={"description": "Passes"}),
+                            first.model_copy(update={"description": "Écran retard", "end_time": time(20, 0)})])
+    assert_consistent(repository)
+    assert stored(repository)[0].description == "Écran retard"
+    assert descriptions("passes") == []
+    assert descriptions("ecran") == ["Écran retard"]
+
+
+def test_update_many_without_changes(repository):
+    trainings = stored(repository)
+    assert repository.update_many(trainings) == 3
+    assert_consistent(repository)
+    assert stored(repository) == trainings
+
+
+def test_delete_many_removes_index_entries(repository):
+    trainings = stored(repository)
+    assert repository.delete_many([trainings[1].id, trainings[2].id, 999]) == 2
+    assert_consistent(repository)
+    assert descriptions("match") == [] and descriptions("tir") == []
+    assert descriptions("defense") == ["Défense de zone"]
+
+
+def test_empty_batches(repository):
+    trainings = stored(repository)
+    repository.add_many([])
+    repository.update_many([])
+    repository.delete_many([])
+    assert_consistent(repository)
+    assert stored(repository) == trainings
+
+
+def test_add_many_rolled_back_with_outer_batch(repository):
+    with pytest.raises(RuntimeError):
+        with repository.batch():
+            repository.add_many([training("U17", "Zone press", FIRST_DAY)])
+            raise RuntimeError
+    assert_consistent(repository)
+    assert len(stored(repository)) == 3
+    assert descriptions("zone") == ["Défense de zone"]
+    # Les triggers ligne à ligne sont toujours en place après l'annulation
+    repository.add(training("U17", "Zone press", FIRST_DAY))
+    assert_consistent(repository)
+    assert descriptions("press") == ["Zone press"]
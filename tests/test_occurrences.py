@@ -0,0 +1,125 @@
+# tests/test_occurrences.py
+"""
+Les séances récurrentes ne sont pas stockées : chaque lecture (export, statistiques, recherche,
+vue d'ensemble) doit ajouter leurs occurrences aux séances enregistrées.
+
+    python -m pytest tests
+"""
+from datetime import date, time
+
+import pytest
+
+from db import database
+from models.training import Training
+from models.training_rule import TrainingRule
+from stats import training_stats
+
+SEPTEMBER = (date(2024, 9, 1), date(2024, 9, 30))
+# Mardis de septembre 2024 hors exception (le 17) : 3, 10 et 24
+OCCURRENCE_DAYS = [date(2024, 9, 3), date(2024, 9, 10), date(2024, 9, 24)]
+
+
+def training(category, description, day, start, end):
+    return Training(category=category, description=description, date=day, start_time=start, end_time=end)
+
+
+@pytest.fixture
+def repository(empty_repository):
+    repository = empty_repository
+    repository.add_many([
+        training("U13", "Défense de zone", date(2024, 9, 3), time(17, 0), time(18, 0)),
+        training("U15", "Match amical", date(2024, 9, 10), time(10, 0), time(11, 30)),
+        training("U15", "Tir en course", date(2024, 9, 12), time(18, 0), time(19, 0)),
+    ])
+    database.add_rule(TrainingRule("U15", "Tir à trois points", time(18, 0), time(19, 30), [1],
+                                   date(2024, 9, 2), date(2024, 9, 30), exceptions=[date(2024, 9, 17)]))
+    return repository
+
+
+def test_iter_trainings_merges_occurrences_in_order(repository):
+    trainings = list(database.iter_trainings(*SEPTEMBER))
+    assert [(t.date, t.start_time) for t in trainings] == [
+        (date(2024, 9, 3), time(17, 0)), (date(2024, 9, 3), time(18, 0)),
+        (date(2024, 9, 10), time(10, 0)), (date(2024, 9, 10), time(18, 0)),
+        (date(2024, 9, 12), time(18, 0)), (date(2024, 9, 24), time(18, 0)),
+    ]
+    assert [t.date for t in trainings if t.id < 0] == OCCURRENCE_DAYS
+
+
+def test_count_trainings_includes_occurrences(repository):
+    assert database.count_trainings(*SEPTEMBER) == 6
+    assert database.count_trainings(*SEPTEMBER, ["U15"]) == 5
+    assert database.count_trainings(*SEPTEMBER, ["U13"]) == 1
+
+
+def test_search_trainings_finds_occurrences(repository):
+    results = database.search_trainings("trois")
+    assert [t.date for t in results] == OCCURRENCE_DAYS
+    assert all(t.id < 0 for t in results)
+
+    results = database.search_trainings("tir", date_range=(date(2024, 9, 9), date(2024, 9, 15)))
+    assert sorted(t.description for t in results) == ["Tir en course", "Tir à trois points"]
+    assert database.search_trainings("tir", limit=2) == database.search_trainings("tir")[:2]
+
+
+def test_summary_includes_occurrences(repository):
+    assert training_stats.summary(*SEPTEMBER, repository=repository) == {"sessions": 6, "minutes": 60 + 90 + 60 + 3 * 90}
+    assert training_stats.summary(*SEPTEMBER, ["U13"], repository=repository) == {"sessions": 1, "minutes": 60}
+
+
+def test_by_category_includes_occurrences(repository):
+    assert training_stats.by_category(*SEPTEMBER, repository=repository) == {
+        "U15": {"sessions": 5, "minutes": 90 + 60 + 3 * 90},
+        "U13": {"sessions": 1, "minutes": 60},
+    }
+
+
+def test_by_day_includes_occurrences(repository):
+    per_day = training_stats.by_day(*SEPTEMBER, repository=repository)
+    assert per_day == {
+        date(2024, 9, 3): (2, 60 + 90),
+        date(2024, 9, 10): (2, 90 + 90),
+        date(2024, 9, 12): (1, 60),
+        date(2024, 9, 24): (1, 90),
+    }
+    assert list(per_day) == sorted(per_day)
+
+
+def test_weekday_hour_heatmap_includes_occurrences(repository):
+    sessions = training_stats.weekday_hour_heatmap(*SEPTEMBER, repository=repository)
+    assert sessions[1][18] == 3   # mardis 18 h : les trois occurrences
+    assert sessions[1][17] == 1 and sessions[1][10] == 1 and sessions[3][18] == 1
+    minutes = training_stats.weekday_hour_heatmap(*SEPTEMBER, repository=repository, value="minutes")
+    assert minutes[1][18] == 3 * 90
+
+
+def test_overview_counts_occurrences_once(repository):
+    from ui.overview_view import load_overview
+    assert load_overview(*SEPTEMBER, repository=repository)[date(2024, 9, 10)] == (2, 180)
+
+
+def test_export_period_to_pdf_includes_occurrences(repository, tmp_path):
+    pytest.importorskip("reportlab")
+    from exporter.pdf_exporter import export_period_to_pdf
+    filename = tmp_path / "septembre.pdf"
+    assert export_period_to_pdf(*SEPTEMBER, ["U15"], str(filename)) == 5
+    assert filename.stat().st_size > 0
+
+
+def test_batch_export_job_includes_occurrences(repository, tmp_path):
+    pytest.importorskip("reportlab")
+    from exporter.batch_exporter import export_job
+    result = export_job(database.DB_PATH, "U15", 2024, 9, str(tmp_path / "u15.pdf"))
+    assert result["count"] == 5
+
+
+def test_find_rule_conflicts_checks_every_occurrence(repository):
+    # Jeudis 18 h 30 – 19 h : seul le 12/09 est occupé (séance enregistrée), pas le premier jeudi
+    thursdays = TrainingRule("U17", "Physique", time(18, 30), time(19, 0), [3], date(2024, 9, 5), date(2024, 9, 30))
+    assert [(t.date, t.description) for t in database.find_rule_conflicts(thursdays)] == [
+        (date(2024, 9, 12), "Tir en course")]
+    # Mardis 17 h 30 – 18 h 30 : la séance du 03/09 et chaque occurrence de la règle existante
+    tuesdays = TrainingRule("U17", "Physique", time(17, 30), time(18, 30), [1], date(2024, 9, 2), date(2024, 9, 30))
+    assert [(t.date, t.start_time) for t in database.find_rule_conflicts(tuesdays)] == [
+        (date(2024, 9, 3), time(17, 0)), (date(2024, 9, 3), time(18, 0)),
+        (date(2024, 9, 10), time(18, 0)), (date(2024, 9, 24), time(18, 0))]
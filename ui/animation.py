@@ -0,0 +1,82 @@
+# ui/animation.py
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def color_ramp(start, end, steps):
+    """
+    Couleurs intermédiaires de start vers end (hex '#rrggbb'), end comprise.
+    Calculé une fois par couple de couleurs (donc par catégorie) au lieu de winfo_rgb à chaque frame.
+    """
+    r1, g1, b1 = (int(start[i:i+2], 16) for i in (1, 3, 5))
+    r2, g2, b2 = (int(end[i:i+2], 16) for i in (1, 3, 5))
+    ramp = []
+    for step in range(1, steps + 1):
+        alpha = step / steps
+        ramp.append("#%02x%02x%02x" % (round(r1 + (r2 - r1) * alpha),
+                                       round(g1 + (g2 - g1) * alpha),
+                                       round(b1 + (b2 - b1) * alpha)))
+    return tuple(ramp)
+
+
+class FadeAnimator:
+    """
+    Fondu d'apparition des événements piloté par la boucle Tk (after), sans bloquer l'interface.
+
+    Les éléments existent déjà sur le canvas : seule leur couleur de remplissage change.
+    Les éléments d'une même couleur cible (une catégorie) partagent un tag, ce qui fait
+    un seul itemconfig par catégorie et par étape. cancel() interrompt le fondu en cours
+    et pose directement les couleurs finales.
+    """
+
+    def __init__(self, canvas, steps=10, delay=20, start_color="#ffffff"):
+        self.canvas = canvas
+        self.steps = steps
+        self.delay = delay
+        self.start_color = start_color
+        self._groups = {}  # tag -> rampe de couleurs
+        self._step = 0
+        self._job = None
+
+    @property
+    def running(self):
+        return self._job is not None
+
+    def fade_in(self, items):
+        """items : couples (id d'élément canvas, couleur finale)."""
+        self.cancel()
+        tags = {}
+        for item, color in items:
+            tag = tags.get(color)
+            if tag is None:
+                tag = tags[color] = f"fade_{len(tags)}"
+                self._groups[tag] = color_ramp(self.start_color, color, self.steps)
+            self.canvas.addtag_withtag(tag, item)
+        if not self._groups:
+            return
+        self._step = 0
+        self._tick()
+
+    def _tick(self):
+        self._step += 1
+        for tag, ramp in self._groups.items():
+            self.canvas.itemconfig(tag, fill=ramp[self._step - 1])
+        if self._step < self.steps:
+            self._job = self.canvas.after(self.delay, self._tick)
+        else:
+            self._job = None
+            self._release()
+
+    def cancel(self):
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+            # Fondu interrompu : les éléments prennent directement leur couleur finale
+            for tag, ramp in self._groups.items():
+                self.canvas.itemconfig(tag, fill=ramp[-1])
+        self._release()
+
+    def _release(self):
+        for tag in self._groups:
+            self.canvas.dtag(tag, tag)
+        self._groups = {}
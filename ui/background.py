@@ -0,0 +1,71 @@
+# ui/background.py
+import queue
+import threading
+
+
+class BackgroundTask:
+    """
+    Exécute une fonction dans un thread de travail sans bloquer la boucle Tk.
+
+    La fonction reçoit report(*args) pour signaler sa progression et cancelled() pour
+    savoir si l'utilisateur a annulé. Les messages passent par une file (queue.Queue)
+    relevée avec after() : les callbacks on_progress / on_done / on_error sont donc
+    toujours appelés dans le thread Tk.
+    """
+
+    def __init__(self, widget, target, on_progress=None, on_done=None, on_error=None, poll_ms=50):
+        self.widget = widget
+        self.target = target
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.poll_ms = poll_ms
+        self._messages = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = None
+        self._job = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._job = self.widget.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        try:
+            result = self.target(lambda *args: self._messages.put(("progress", args)), self.cancelled)
+        except BaseException as e:
+            self._messages.put(("error", e))
+        else:
+            self._messages.put(("done", result))
+
+    def _poll(self):
+        self._job = None
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if self.on_progress is not None:
+                    self.on_progress(*payload)
+            elif kind == "done":
+                if self.on_done is not None:
+                    self.on_done(payload)
+                return
+            else:
+                if self.on_error is not None:
+                    self.on_error(payload)
+                return
+        if self.widget.winfo_exists():
+            self._job = self.widget.after(self.poll_ms, self._poll)
@@ -0,0 +1,59 @@
+# ui/charts.py
+"""
+Graphiques matplotlib des popups.
+
+matplotlib n'est importé qu'au premier graphique affiché (son import coûte plusieurs
+centaines de ms au lancement). On utilise Figure directement plutôt que pyplot :
+pas de registre global de figures, donc rien ne s'accumule d'un popup à l'autre.
+Chaque type de graphique garde une seule Figure / Axes, redessinée sur place.
+"""
+
+CHART_FACE_COLOR = "#f4f6fa"
+TEXT_COLOR = "#222222"
+
+_charts = {}  # nom du graphique -> (Figure, Axes)
+
+
+def _chart(name, figsize, dpi=100):
+    """Figure persistante du graphique name (créée au premier appel)."""
+    chart = _charts.get(name)
+    if chart is None:
+        from matplotlib.figure import Figure
+        figure = Figure(figsize=figsize, dpi=dpi)
+        figure.patch.set_facecolor(CHART_FACE_COLOR)
+        chart = _charts[name] = (figure, figure.add_subplot())
+    return chart
+
+
+def category_pie(counts, title="Répartition par catégorie"):
+    """Met à jour et retourne la Figure du camembert {catégorie: nombre}."""
+    figure, ax = _chart("category_pie", figsize=(3.2, 2.5))
+    ax.clear()
+    ax.pie(list(counts.values()), labels=list(counts), autopct='%1.0f%%', startangle=90,
+           textprops={'fontsize': 9, 'color': TEXT_COLOR})
+    ax.set_title(title, fontsize=11, color=TEXT_COLOR)
+    return figure
+
+
+def attach(figure, master):
+    """Affiche figure dans le widget master ; retourne le widget Tk créé (à placer par l'appelant)."""
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    canvas = FigureCanvasTkAgg(figure, master=master)
+    canvas.draw()
+    return canvas.get_tk_widget()
+
+
+def detach(figure):
+    """
+    Détache figure de son widget Tk (à appeler à la fermeture du popup) :
+    la Figure reste en cache, mais ne garde plus de référence vers le widget détruit.
+    """
+    from matplotlib.backend_bases import FigureCanvasBase
+    FigureCanvasBase(figure)
+
+
+def release_charts():
+    """Libère toutes les figures en cache (fermeture de l'application)."""
+    for figure, _ in _charts.values():
+        figure.clear()
+    _charts.clear()
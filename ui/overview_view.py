@@ -0,0 +1,365 @@
+# ui/overview_view.py
+"""
+Vue d'ensemble d'un mois ou d'une saison : une ligne par semaine, une case par jour colorée
+selon la charge du jour (minutes d'entraînement), avec le nombre de séances.
+
+Les cases ne dessinent pas les séances : elles lisent les totaux par jour de daily_stats
+(plus les séances récurrentes), soit au plus une valeur par jour quelle que soit la période.
+
+Le canvas est virtualisé : seules les semaines visibles ont des éléments. Ces lignes forment
+un pool recyclé au défilement (la semaine N utilise la ligne N % taille du pool) : une semaine
+qui sort d'un côté rend sa ligne à celle qui entre de l'autre, par coords / itemconfig,
+sans rien créer. Le nombre d'éléments dépend de la hauteur de la fenêtre et du zoom,
+jamais du nombre de semaines ou de séances.
+"""
+import calendar
+import logging
+import tkinter as tk
+from datetime import timedelta
+
+from stats import training_stats
+from ui.animation import color_ramp
+from utils.date_utils import format_minutes
+from utils.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+LEFT = 70           # colonne des numéros de semaine
+TOP = 28            # en-tête des jours (fixe, ne défile pas)
+MIN_ROW_HEIGHT = 14
+MAX_ROW_HEIGHT = 96
+TEXT_MIN_HEIGHT = 22     # en dessous, les cases n'ont plus de texte (zoom arrière)
+DETAIL_MIN_HEIGHT = 40   # à partir de là, le nombre de séances et la durée s'ajoutent au jour
+
+ROW_TAG = "overview_row"
+CELL_TAG = "overview_cell"
+
+EMPTY_FILL = "#ffffff"
+OUTSIDE_FILL = "#f0f1f4"   # jours hors de la période (début et fin de semaine)
+DENSITY_FILLS = color_ramp("#e8eff9", "#2f62a8", 8)
+TEXT_COLOR = "#2d3a4a"
+LIGHT_TEXT = "#ffffff"
+DAY_NAMES = ("Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim")
+
+
+def load_overview(start, end, repository=None):
+    """{date: (séances, minutes)} de la période : agrégats journaliers et séances récurrentes."""
+    return training_stats.by_day(start, end, repository=repository)
+
+
+class OverviewRenderer:
+    """
+    Dessin virtualisé des semaines d'une période sur un canvas Tk.
+
+    set_period() fixe les données, layout() la taille et le zoom, scroll_to() la position ;
+    render() met à jour les seules lignes du pool dont la semaine ou la position a changé.
+    Comme WeekRenderer, chaque rendu compte les éléments créés / déplacés / reconfigurés (last_stats).
+    """
+
+    def __init__(self, canvas, on_day_click=None):
+        self.canvas = canvas
+        self.on_day_click = on_day_click  # callback(date) au clic sur un jour de la période
+        self.header_items = []
+        self.slots = []          # pool de lignes : {"label", "cells", "texts", "row", "y", "shape"}
+        self.cell_lookup = {}    # élément du canvas -> (ligne du pool, jour de semaine)
+        self.weeks = []          # lundis des semaines de la période
+        self.per_day = {}
+        self.start = self.end = None
+        self.max_minutes = 1
+        self.width = self.height = 0
+        self.row_height = 40
+        self.offset = 0          # défilement en pixels
+        self._drawn_offset = 0
+        self._content_version = 0
+        self._shape = None       # (largeur de case, hauteur de ligne, version du contenu) du dernier rendu
+        self.stats = self._new_stats()
+        self.last_stats = self._new_stats()
+        # Un seul binding pour toutes les cases : la case cliquée est retrouvée par cell_lookup
+        canvas.tag_bind(CELL_TAG, "<Button-1>", self._on_click)
+
+    @staticmethod
+    def _new_stats():
+        return {"created": 0, "moved": 0, "configured": 0, "deleted": 0}
+
+    def _create(self, kind, *args, **kwargs):
+        self.stats["created"] += 1
+        return getattr(self.canvas, "create_" + kind)(*args, **kwargs)
+
+    # --- Données et géométrie ---
+
+    def set_period(self, start, end, per_day):
+        monday = start - timedelta(days=start.weekday())
+        self.weeks = [monday + timedelta(days=7 * i) for i in range((end - monday).days // 7 + 1)]
+        self.start, self.end = start, end
+        self.per_day = per_day
+        self.max_minutes = max((minutes for _, minutes in per_day.values()), default=0) or 1
+        self.offset = 0
+        self._content_version += 1  # toutes les lignes sont à remplir de nouveau
+
+    def layout(self, width, height, row_height=None):
+        self.width, self.height = width, height
+        if row_height is not None:
+            self.row_height = max(MIN_ROW_HEIGHT, min(MAX_ROW_HEIGHT, int(row_height)))
+        self.offset = min(self.offset, self.max_offset())
+
+    def content_height(self):
+        return len(self.weeks) * self.row_height
+
+    def viewport_height(self):
+        return max(1, self.height - TOP)
+
+    def max_offset(self):
+        return max(0, self.content_height() - self.viewport_height())
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(self.max_offset(), int(offset)))
+
+    def visible_fraction(self):
+        """(début, fin) de la zone visible, en fractions de la hauteur totale (pour la barre de défilement)."""
+        total = self.content_height()
+        if not total:
+            return 0.0, 1.0
+        return self.offset / total, min(1.0, (self.offset + self.viewport_height()) / total)
+
+    def zoom(self, factor, anchor_y=None):
+        """Change la hauteur des lignes en gardant en place la semaine sous anchor_y (milieu de la vue par défaut)."""
+        anchor = self.viewport_height() / 2 if anchor_y is None else max(0, anchor_y - TOP)
+        row = (self.offset + anchor) / self.row_height
+        self.layout(self.width, self.height, self.row_height * factor)
+        self.scroll_to(row * self.row_height - anchor)
+
+    # --- Rendu ---
+
+    @timed("ui.overview.render")
+    def render(self):
+        self.stats = self._new_stats()
+        if not self.header_items:
+            self._build_header()
+        cell_width = (self.width - LEFT - 8) / 7
+        shape = (cell_width, self.row_height, self._content_version)
+        for weekday, item in enumerate(self.header_items):
+            self.canvas.coords(item, LEFT + (weekday + 0.5) * cell_width, TOP / 2)
+        self.stats["moved"] += len(self.header_items)
+
+        pool_size = self.viewport_height() // self.row_height + 2
+        if pool_size > len(self.slots):
+            for _ in range(pool_size - len(self.slots)):
+                self.slots.append(self._build_slot())
+            self._content_version += 1
+            shape = (cell_width, self.row_height, self._content_version)
+        # Zoom avant ou fenêtre réduite : les lignes en trop sont masquées (et gardées pour plus tard)
+        for slot in self.slots[pool_size:]:
+            if slot["row"] is not None:
+                self._hide(slot)
+
+        # Défilement seul : un déplacement global des lignes (une commande Tk), puis seules
+        # les lignes qui changent de semaine sont repositionnées et remplies
+        delta = self._drawn_offset - self.offset
+        if delta and shape == self._shape:
+            self.canvas.move(ROW_TAG, 0, delta)
+            for slot in self.slots:
+                if slot["y"] is not None:
+                    slot["y"] += delta
+        self._drawn_offset = self.offset
+        self._shape = shape
+
+        first = self.offset // self.row_height
+        last = min(len(self.weeks), (self.offset + self.viewport_height()) // self.row_height + 1)
+        for row in range(first, last):
+            slot = self.slots[row % pool_size]
+            y = TOP + row * self.row_height - self.offset
+            if slot["row"] != row or slot["shape"] != shape:
+                self._fill(slot, row)
+            if slot["y"] != y or slot["shape"] != shape:
+                self._place(slot, y, cell_width)
+            slot["row"], slot["y"], slot["shape"] = row, y, shape
+        # Lignes du pool restées sur une autre période ou un autre zoom (période plus courte que le pool).
+        # Une ligne qui vient de sortir de la vue reste en place, hors champ : elle sera recyclée telle quelle
+        used = {row % pool_size for row in range(first, last)}
+        for index, slot in enumerate(self.slots[:pool_size]):
+            if index not in used and slot["row"] is not None and slot["shape"] != shape:
+                self._hide(slot)
+        self.canvas.tag_raise("overview_header")
+        self.last_stats = self.stats
+        logger.debug("overview : %(created)d créés, %(moved)d déplacés, %(configured)d reconfigurés", self.stats)
+        return self.last_stats
+
+    def _build_header(self):
+        self._create("rectangle", 0, 0, 4000, TOP, fill="#f7f7f9", outline="", tags="overview_header")
+        for name in DAY_NAMES:
+            self.header_items.append(self._create("text", 0, 0, text=name, font=("Segoe UI", 10, "bold"),
+                                                  fill="#888888", tags="overview_header"))
+
+    def _build_slot(self):
+        tags = (ROW_TAG,)
+        label = self._create("text", 0, 0, anchor="w", font=("Segoe UI", 9), fill="#888888", tags=tags)
+        cells, texts = [], []
+        for weekday in range(7):
+            cell = self._create("rectangle", 0, 0, 0, 0, fill=EMPTY_FILL, outline="#d8dce3", tags=(ROW_TAG, CELL_TAG))
+            text = self._create("text", 0, 0, anchor="nw", font=("Segoe UI", 9), fill=TEXT_COLOR, tags=(ROW_TAG, CELL_TAG))
+            cells.append(cell)
+            texts.append(text)
+            slot_index = len(self.slots)
+            self.cell_lookup[cell] = self.cell_lookup[text] = (slot_index, weekday)
+        return {"label": label, "cells": cells, "texts": texts, "row": None, "y": None, "shape": None}
+
+    def _fill(self, slot, row):
+        monday = self.weeks[row]
+        small = self.row_height < TEXT_MIN_HEIGHT
+        detailed = self.row_height >= DETAIL_MIN_HEIGHT
+        iso = monday.isocalendar()
+        label = f"S{iso[1]:02}" if small or self.row_height < 30 else f"S{iso[1]:02}\n{monday:%d/%m}"
+        self.canvas.itemconfig(slot["label"], text=label, state="normal")
+        for weekday in range(7):
+            day = monday + timedelta(days=weekday)
+            if not self.start <= day <= self.end:
+                fill, text, color = OUTSIDE_FILL, "" if small else str(day.day), "#b0b4bb"
+            else:
+                sessions, minutes = self.per_day.get(day, (0, 0))
+                level = -(-minutes * len(DENSITY_FILLS) // self.max_minutes) if minutes else 0
+                fill = DENSITY_FILLS[level - 1] if level else EMPTY_FILL
+                color = LIGHT_TEXT if level > len(DENSITY_FILLS) // 2 else TEXT_COLOR
+                text = "" if small else str(day.day) if day.day != 1 else f"1 {calendar.month_abbr[day.month]}"
+                if detailed and sessions:
+                    text += f"\n{sessions} séance{'s' if sessions > 1 else ''}\n{format_minutes(minutes)}"
+            self.canvas.itemconfig(slot["cells"][weekday], fill=fill, state="normal")
+            self.canvas.itemconfig(slot["texts"][weekday], text=text, fill=color, state="normal")
+        self.stats["configured"] += 15
+
+    def _place(self, slot, y, cell_width):
+        h = self.row_height
+        self.canvas.coords(slot["label"], 8, y + h / 2)
+        for weekday in range(7):
+            x = LEFT + weekday * cell_width
+            self.canvas.coords(slot["cells"][weekday], x, y, x + cell_width, y + h)
+            self.canvas.coords(slot["texts"][weekday], x + 4, y + 2)
+        self.stats["moved"] += 15
+
+    def _hide(self, slot):
+        for item in [slot["label"], *slot["cells"], *slot["texts"]]:
+            self.canvas.itemconfig(item, state="hidden")
+        slot["row"] = slot["y"] = slot["shape"] = None
+        self.stats["configured"] += 15
+
+    def _on_click(self, event):
+        current = self.canvas.find_withtag("current")
+        if not current or current[0] not in self.cell_lookup:
+            return
+        slot_index, weekday = self.cell_lookup[current[0]]
+        row = self.slots[slot_index]["row"]
+        if row is None:
+            return
+        day = self.weeks[row] + timedelta(days=weekday)
+        if self.on_day_click is not None and self.start <= day <= self.end:
+            self.on_day_click(day)
+
+
+class OverviewWindow(tk.Toplevel):
+    """Fenêtre de la vue d'ensemble (mois ou saison) ; un clic sur un jour ouvre sa semaine."""
+
+    PERIODS = {
+        "Mois": (training_stats.month_period, 1),      # (période, pas des flèches en mois)
+        "Saison": (training_stats.season_period, 12),
+    }
+
+    def __init__(self, master, reference_date, on_open_day):
+        super().__init__(master)
+        self.title("Vue d'ensemble")
+        self.geometry("760x640")
+        self.configure(bg="#f7f7f9")
+        self.reference_date = reference_date
+        self.on_open_day = on_open_day
+
+        header = tk.Frame(self, bg="#f7f7f9")
+        header.pack(fill="x", pady=6)
+        button_style = {"font": ("Segoe UI", 11, "bold"), "bg": "#f7f7f9", "fg": "#4a5a6a", "bd": 0,
+                        "relief": "flat", "cursor": "hand2", "activebackground": "#e0e4ea"}
+        tk.Button(header, text="←", command=lambda: self.shift(-1), **button_style).pack(side="left", padx=8)
+        self.title_label = tk.Label(header, font=("Segoe UI", 14, "bold"), fg="#2d3a4a", bg="#f7f7f9")
+        self.title_label.pack(side="left", padx=6)
+        tk.Button(header, text="→", command=lambda: self.shift(1), **button_style).pack(side="left", padx=8)
+        tk.Button(header, text="−", command=lambda: self.zoom(1 / 1.25), **button_style).pack(side="right", padx=4)
+        tk.Button(header, text="+", command=lambda: self.zoom(1.25), **button_style).pack(side="right", padx=4)
+        self.mode_var = tk.StringVar(self, "Saison")
+        tk.OptionMenu(header, self.mode_var, *self.PERIODS, command=lambda _: self.load()).pack(side="right", padx=8)
+
+        body = tk.Frame(self, bg="#f7f7f9")
+        body.pack(fill="both", expand=True)
+        self.scrollbar = tk.Scrollbar(body, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas = tk.Canvas(body, bg="#f7f7f9", highlightthickness=0)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.renderer = OverviewRenderer(self.canvas, self.open_day)
+
+        self.canvas.bind("<Configure>", self.on_resize)
+        # Molette : défilement ; Ctrl + molette : zoom (Button-4/5 sous Linux)
+        self.canvas.bind("<MouseWheel>", lambda e: self.on_wheel(e, -1 if e.delta > 0 else 1))
+        self.canvas.bind("<Button-4>", lambda e: self.on_wheel(e, -1))
+        self.canvas.bind("<Button-5>", lambda e: self.on_wheel(e, 1))
+        self._job = None
+        self.load()
+
+    def load(self):
+        period, _ = self.PERIODS[self.mode_var.get()]
+        start, end = period(self.reference_date)
+        self.renderer.set_period(start, end, load_overview(start, end))
+        if self.mode_var.get() == "Mois":
+            self.title_label.config(text=f"{calendar.month_name[start.month].capitalize()} {start.year}")
+        else:
+            self.title_label.config(text=f"Saison {start.year}-{end.year}")
+        self.renderer.layout(self.renderer.width, self.renderer.height, self.default_row_height())
+        self.redraw()
+
+    def default_row_height(self):
+        if self.mode_var.get() == "Mois" and self.renderer.height:
+            # Un mois tient dans la fenêtre : lignes à la hauteur disponible
+            return self.renderer.viewport_height() // len(self.renderer.weeks)
+        return 40
+
+    def shift(self, direction):
+        _, months = self.PERIODS[self.mode_var.get()]
+        day = self.reference_date.replace(day=1)
+        month_index = day.year * 12 + day.month - 1 + direction * months
+        self.reference_date = day.replace(year=month_index // 12, month=month_index % 12 + 1)
+        self.load()
+
+    def zoom(self, factor, anchor_y=None):
+        self.renderer.zoom(factor, anchor_y)
+        self.redraw()
+
+    def yview(self, *args):
+        # Protocole de tk.Scrollbar : ("moveto", fraction) ou ("scroll", n, "units" | "pages")
+        if args[0] == "moveto":
+            self.renderer.scroll_to(float(args[1]) * self.renderer.content_height())
+        elif args[0] == "scroll":
+            step = self.renderer.viewport_height() if args[2] == "pages" else max(10, self.renderer.row_height // 2)
+            self.renderer.scroll_to(self.renderer.offset + int(args[1]) * step)
+        self.redraw()
+
+    def on_wheel(self, event, direction):
+        if event.state & 0x4:  # Ctrl
+            self.zoom(1.25 if direction < 0 else 1 / 1.25, event.y)
+        else:
+            self.yview("scroll", direction * 2, "units")
+
+    def on_resize(self, event):
+        fit_month = self.mode_var.get() == "Mois"
+        self.renderer.layout(event.width, event.height)
+        if fit_month:
+            self.renderer.layout(event.width, event.height, self.default_row_height())
+        self.redraw()
+
+    def redraw(self):
+        # Un seul rendu par passage idle, même si la molette envoie beaucoup d'événements
+        if self._job is None:
+            self._job = self.after_idle(self._render)
+
+    def _render(self):
+        self._job = None
+        if not self.renderer.width:
+            return
+        self.renderer.render()
+        self.scrollbar.set(*self.renderer.visible_fraction())
+
+    def open_day(self, day):
+        self.on_open_day(day)
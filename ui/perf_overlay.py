@@ -0,0 +1,57 @@
+# ui/perf_overlay.py
+from utils import instrumentation
+
+OVERLAY_TAG = "perf_overlay"
+OVERLAY_FONT = ("Courier", 9)
+
+
+def format_frame(frame, render_stats=None):
+    """Texte de l'overlay : durée de la frame, mesures par nom, requêtes et éléments du canvas."""
+    spans = frame["spans"]
+    counters = frame["counters"]
+    lines = [f"frame {frame['seconds'] * 1000:7.1f} ms"]
+    for name, (calls, seconds) in sorted(spans.items(), key=lambda item: -item[1][1]):
+        lines.append(f"{name:<26}{'×' + str(calls) if calls > 1 else '':>5} {seconds * 1000:7.2f} ms")
+    queries = sum(calls for name, (calls, _) in spans.items() if name.startswith("sqlite."))
+    lines.append(f"requêtes SQLite : {queries} ({counters.get('sqlite.rows', 0)} lignes)")
+    lines.append(f"cache : {counters.get('cache.hits', 0)} hits / {counters.get('cache.misses', 0)} misses")
+    if render_stats is not None:
+        lines.append("canvas : {created} créés, {moved} déplacés, {configured} reconfigurés, "
+                     "{deleted} supprimés, {recycled} recyclés".format(**render_stats))
+    return "\n".join(lines)
+
+
+class PerfOverlay:
+    """
+    Panneau de mesures affiché en haut à droite du canvas de la semaine (F12).
+    L'afficher active l'instrumentation ; le masquer la désactive.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.visible = False
+        self._background = None
+        self._text = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        instrumentation.enable(self.visible)
+        if self.visible:
+            instrumentation.reset()
+        else:
+            self.canvas.delete(OVERLAY_TAG)
+            self._background = self._text = None
+        return self.visible
+
+    def show(self, frame, render_stats=None):
+        if not self.visible:
+            return
+        if self._text is None:
+            self._background = self.canvas.create_rectangle(0, 0, 0, 0, fill="#1e2530", outline="", tags=OVERLAY_TAG)
+            self._text = self.canvas.create_text(0, 0, anchor="ne", fill="#d8e0ea", font=OVERLAY_FONT, tags=OVERLAY_TAG)
+        x = self.canvas.winfo_width() - 12
+        self.canvas.itemconfig(self._text, text=format_frame(frame, render_stats))
+        self.canvas.coords(self._text, x, 12)
+        x1, y1, x2, y2 = self.canvas.bbox(self._text)
+        self.canvas.coords(self._background, x1 - 6, y1 - 4, x2 + 6, y2 + 4)
+        self.canvas.tag_raise(OVERLAY_TAG)
@@ -0,0 +1,97 @@
+# ui/redraw_scheduler.py
+import time as timer
+
+# Raisons d'invalidation : la taille du canvas, les données en base, le filtre de recherche,
+# l'arrivée d'un mois chargé en arrière-plan
+LAYOUT = "layout"
+DATA = "data"
+FILTER = "filter"
+LOADED = "loaded"
+ALL = frozenset((LAYOUT, DATA, FILTER, LOADED))
+
+# Par raison : (attente après la dernière demande, attente maximale depuis la première), en ms.
+# Un redimensionnement continu redessine au plus toutes les 100 ms, une frappe rapide
+# attend une pause de 150 ms ; un changement de données (ou leur arrivée) est traité au prochain passage idle.
+DEFAULT_DELAYS = {
+    LAYOUT: (40, 100),
+    FILTER: (150, 400),
+    DATA: (0, 0),
+    LOADED: (0, 0),
+}
+
+
+class RedrawScheduler:
+    """
+    Regroupe les demandes de redessin et n'exécute qu'un seul redraw pour toutes.
+
+    invalidate(raison) note la raison et programme (via after / after_idle) un appel
+    unique à redraw(raisons) ; les demandes qui arrivent entre-temps sont fusionnées.
+    Les compteurs requests / redraws permettent de vérifier le regroupement.
+    """
+
+    def __init__(self, widget, redraw, delays=None):
+        self.widget = widget
+        self.redraw = redraw
+        self.delays = dict(DEFAULT_DELAYS, **(delays or {}))
+        self.pending = set()
+        self.requests = 0
+        self.redraws = 0
+        self._first_request = {}  # raison -> instant de la première demande en attente (ms)
+        self._last_request = {}   # raison -> instant de la dernière demande (ms)
+        self._job = None
+        self._due = None
+
+    @staticmethod
+    def _now():
+        return timer.monotonic() * 1000
+
+    def invalidate(self, reason):
+        now = self._now()
+        self.requests += 1
+        self.pending.add(reason)
+        self._first_request.setdefault(reason, now)
+        self._last_request[reason] = now
+        self._schedule(now)
+
+    def _schedule(self, now):
+        # Échéance la plus proche parmi les raisons en attente (attente glissante, bornée par l'attente max)
+        due = min(
+            min(self._last_request[r] + self.delays[r][0], self._first_request[r] + self.delays[r][1])
+            for r in self.pending
+        )
+        if self._job is not None:
+            if self._due == due:
+                return
+            self.widget.after_cancel(self._job)
+        self._due = due
+        delay = int(due - now)
+        if delay <= 0:
+            self._job = self.widget.after_idle(self._on_timer)
+        else:
+            self._job = self.widget.after(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._job = None
+        self.flush()
+
+    def cancel(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+        self._job = None
+        self._due = None
+        self.pending.clear()
+        self._first_request.clear()
+
+    def flush(self):
+        """Exécute immédiatement le redraw en attente (s'il y en a un)."""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        if not self.pending:
+            return
+        reasons = frozenset(self.pending)
+        self.pending.clear()
+        self._first_request.clear()
+        self._due = None
+        self.redraws += 1
+        self.redraw(reasons)
@@ -0,0 +1,133 @@
+# ui/text_layout.py
+"""
+Mise en page du texte des événements du canvas.
+
+Le texte est découpé selon la largeur réellement affichée (tkinter.font.Font.measure),
+et non selon un nombre de caractères : correct pour les polices proportionnelles.
+Chaque mot est mesuré en entier (crénage compris) une seule fois par police ; la somme des largeurs
+de caractères, plus approchée, ne sert qu'à couper un mot trop long et à tronquer avec « … ».
+Les découpages sont mémorisés (LRU) par (texte, police, largeur, max_lines) : redessiner une semaine
+inchangée ne refait aucun calcul.
+"""
+import tkinter.font as tkfont
+from functools import lru_cache
+
+from utils.instrumentation import count
+
+ELLIPSIS = "…"
+
+_fonts = {}          # police (tuple) -> tkinter.font.Font
+_glyph_widths = {}   # police (tuple) -> {caractère: largeur en pixels}
+_word_widths = {}    # police (tuple) -> {mot: largeur en pixels} (les mots reviennent d'une séance à l'autre)
+
+
+def _measure(font, text):
+    tk_font = _fonts.get(font)
+    if tk_font is None:
+        try:
+            tk_font = _fonts[font] = tkfont.Font(font=font)
+        except RuntimeError:
+            # Pas de fenêtre Tk (benchmarks sans écran) : largeur moyenne approchée
+            return round(len(text) * font[1] * 0.55)
+    return tk_font.measure(text)
+
+
+def glyph_width(font, char):
+    widths = _glyph_widths.get(font)
+    if widths is None:
+        widths = _glyph_widths[font] = {}
+    width = widths.get(char)
+    if width is None:
+        width = widths[char] = _measure(font, char)
+    return width
+
+
+def text_width(text, font):
+    """Largeur approchée de text dans font : somme des largeurs de caractères mémorisées (sans crénage)."""
+    widths = _glyph_widths.get(font) or {}
+    total = 0
+    for char in text:
+        width = widths.get(char)
+        total += width if width is not None else glyph_width(font, char)
+    return total
+
+
+def word_width(word, font):
+    """Largeur en pixels de word dans font, mesurée sur le mot entier et mémorisée par police."""
+    widths = _word_widths.get(font)
+    if widths is None:
+        widths = _word_widths[font] = {}
+    width = widths.get(word)
+    if width is None:
+        width = widths[word] = _measure(font, word)
+    return width
+
+
+def _split_word(word, font, width):
+    # Mot plus large que la zone : coupé au dernier caractère qui tient (au moins un par ligne)
+    pieces = []
+    while text_width(word, font) > width and len(word) > 1:
+        cut = len(word) - 1
+        while cut > 1 and text_width(word[:cut], font) > width:
+            cut -= 1
+        pieces.append(word[:cut])
+        word = word[cut:]
+    pieces.append(word)
+    return pieces
+
+
+def fit(text, font, width):
+    """Texte sur une ligne, tronqué avec « … » s'il dépasse width pixels."""
+    if text_width(text, font) <= width:
+        return text
+    while text and text_width(text.rstrip() + ELLIPSIS, font) > width:
+        text = text[:-1]
+    return text.rstrip() + ELLIPSIS
+
+
+@lru_cache(maxsize=4096)
+def wrap(text, font, width, max_lines=None):
+    """
+    Découpe text en lignes d'au plus width pixels dans font (tuple hashable, ex. ("Segoe UI", 9)).
+    Les retours à la ligne saisis sont conservés (avec une ligne vide entre deux paragraphes) ;
+    au-delà de max_lines, la dernière ligne se termine par « … ».
+    """
+    count("ui.text_layout.wrap")
+    space = text_width(" ", font)
+    widths = _word_widths.get(font) or {}
+    paragraphs = text.splitlines() or [""]
+    lines = []
+    for index, paragraph in enumerate(paragraphs):
+        current, current_width = [], 0
+        for word in paragraph.split():
+            word_w = widths.get(word)
+            if word_w is None:
+                word_w = word_width(word, font)
+                widths = _word_widths[font]
+            pieces = ((word, word_w),) if word_w <= width else [
+                (piece, word_width(piece, font)) for piece in _split_word(word, font, width)]
+            for piece, piece_width in pieces:
+                if not current:
+                    current, current_width = [piece], piece_width
+                elif current_width + space + piece_width <= width:
+                    current.append(piece)
+                    current_width += space + piece_width
+                else:
+                    lines.append(" ".join(current))
+                    current, current_width = [piece], piece_width
+        if current:
+            lines.append(" ".join(current))
+        if index < len(paragraphs) - 1:
+            lines.append("")
+    if max_lines is not None and len(lines) > max_lines:
+        lines = lines[:max_lines]
+        lines[-1] = fit(lines[-1] + ELLIPSIS, font, width) if lines[-1] else ELLIPSIS
+    return "\n".join(lines)
+
+
+def clear_cache():
+    """Oublie les mesures (changement de police ou de facteur d'échelle de l'écran)."""
+    _fonts.clear()
+    _glyph_widths.clear()
+    _word_widths.clear()
+    wrap.cache_clear()
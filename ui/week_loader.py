@@ -0,0 +1,114 @@
+# ui/week_loader.py
+import itertools
+import queue
+import threading
+
+from db.database import get_batch_for_month, peek_batch_for_month, release_connection
+from utils.instrumentation import count
+
+# Priorités de la file de requêtes : l'arrêt, puis le mois affiché, puis les préchargements
+STOP, LOAD, PREFETCH = 0, 1, 2
+
+
+class WeekLoader:
+    """
+    Charge hors du thread Tk les mois affichés par la vue semaine.
+
+    get(year, month) répond tout de suite si le mois est déjà en cache ; sinon la requête
+    part au thread de travail et on_loaded(year, month, batch) est appelé ensuite dans le
+    thread Tk (file relevée avec after(), comme BackgroundTask). Seule la dernière demande
+    get() compte : en feuilletant vite les semaines, les mois dépassés ne sont pas chargés
+    et leurs résultats sont ignorés. prefetch() remplit le cache à l'avance, en priorité basse.
+
+    Un seul thread de travail, donc une seule connexion SQLite, gardée d'un chargement à l'autre.
+    Avec threaded=False (benchmarks sans boucle Tk), get() charge directement et prefetch() ne fait rien.
+    """
+
+    def __init__(self, widget, on_loaded, on_error=None, threaded=True, poll_ms=15):
+        self.widget = widget
+        self.on_loaded = on_loaded
+        self.on_error = on_error
+        self.threaded = threaded
+        self.poll_ms = poll_ms
+        self._requests = queue.PriorityQueue()  # (priorité, ticket, (année, mois))
+        self._results = queue.Queue()
+        self._tickets = itertools.count(1)
+        self._wanted = 0   # ticket de la dernière demande get() en attente (0 : aucune)
+        self._wanted_month = None
+        self._thread = None
+        self._job = None
+
+    @property
+    def loading(self):
+        return self._wanted != 0
+
+    def get(self, year, month, force=False):
+        """
+        Batch du mois s'il est en cache, sinon None (on_loaded suivra). force : nouvelle requête
+        même si ce mois est déjà en cours de chargement (données modifiées entre-temps).
+        """
+        batch = peek_batch_for_month(year, month)
+        if batch is not None:
+            self._wanted = 0
+            return batch
+        if not self.threaded:
+            return get_batch_for_month(year, month)
+        if self._wanted and self._wanted_month == (year, month) and not force:
+            return None
+        self._wanted = ticket = next(self._tickets)
+        self._wanted_month = (year, month)
+        self._submit(LOAD, ticket, (year, month))
+        if self._job is None:
+            self._job = self.widget.after(self.poll_ms, self._poll)
+        return None
+
+    def prefetch(self, year, month):
+        if self.threaded:
+            self._submit(PREFETCH, next(self._tickets), (year, month))
+
+    def stop(self):
+        if self._thread is not None:
+            self._requests.put((STOP, 0, None))
+            self._thread = None
+
+    def _submit(self, priority, ticket, month):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="week-loader", daemon=True)
+            self._thread.start()
+        self._requests.put((priority, ticket, month))
+
+    def _run(self):
+        while True:
+            priority, ticket, month = self._requests.get()
+            if priority == STOP:
+                break
+            if priority == LOAD and ticket != self._wanted:
+                count("ui.week_loader.skipped")
+                continue
+            try:
+                batch = get_batch_for_month(*month)
+            except Exception as e:
+                if priority == LOAD:
+                    self._results.put((ticket, month, e))
+                continue
+            if priority == LOAD:
+                self._results.put((ticket, month, batch))
+        release_connection()
+
+    def _poll(self):
+        self._job = None
+        while True:
+            try:
+                ticket, (year, month), result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if ticket != self._wanted:
+                continue  # une demande plus récente a remplacé celle-ci
+            self._wanted = 0
+            if isinstance(result, Exception):
+                if self.on_error is not None:
+                    self.on_error(result)
+            else:
+                self.on_loaded(year, month, result)
+        if self._wanted and self.widget.winfo_exists():
+            self._job = self.widget.after(self.poll_ms, self._poll)
@@ -0,0 +1,297 @@
+# ui/week_renderer.py
+import logging
+from collections import namedtuple
+from datetime import time
+from utils.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+# Lignes de la grille : créneaux de 30 min de 12:00 à 21:30 (fin de journée à 22:00)
+SLOT_TIMES = [time(m // 60, m % 60) for m in range(12 * 60, 21 * 60 + 30, 30)]
+HOUR_LABELS = [t.strftime("%H:%M") for t in SLOT_TIMES] + ["22:00"]
+
+BORDER_COLOR = "#bbbbbb"
+FILL_COLOR = "#ffffff"
+TEXT_GRAY = "#888888"
+
+# Tags partagés : un seul jeu de liaisons par tag, l'élément touché est retrouvé par dictionnaire
+SLOT_TAG = "slot"
+EVENT_TAG = "event"
+# Éléments d'événements masqués gardés pour les prochaines frames (au-delà, ils sont supprimés)
+MAX_POOLED_EVENTS = 64
+
+# Description d'un événement à afficher : le renderer compare ces valeurs d'une frame à l'autre
+EventSpec = namedtuple("EventSpec", "key training x y width height color font_size description")
+
+
+class WeekRenderer:
+    """
+    Dessin de la semaine en mode "retenu" sur un canvas Tk.
+
+    Les éléments de la grille (en-têtes, heures, créneaux) sont créés une seule fois
+    puis simplement repositionnés (canvas.coords) quand la taille change.
+    Les événements sont comparés à ceux de la frame précédente : seuls les ajoutés,
+    supprimés ou modifiés touchent le canvas.
+    Chaque frame compte les éléments créés / déplacés / reconfigurés / supprimés / recyclés
+    (last_stats), pour vérifier qu'un redimensionnement ne recrée rien.
+
+    Les éléments d'un événement retiré sont masqués et réutilisés par le prochain événement
+    ajouté. Les clics et survols passent par des liaisons posées une fois sur les tags
+    "slot" et "event" : aucune commande Tcl n'est enregistrée par élément ni par frame.
+    """
+
+    def __init__(self, canvas, on_slot_release, on_event_click):
+        self.canvas = canvas
+        self.on_slot_release = on_slot_release  # callback(col, row) au clic sur un créneau vide
+        self.on_event_click = on_event_click    # callback(training) au clic sur un événement
+        self.header_items = []   # par jour : (rectangle, nom du jour, date)
+        self.hour_items = []     # par libellé d'heure : (rectangle, texte)
+        self.slot_items = {}     # (col, row) -> (rectangle, ligne)
+        self.events = {}         # clé -> {"items", "geometry", "content", "training"}
+        self.slot_lookup = {}    # rectangle de créneau -> (col, row)
+        self.event_lookup = {}   # élément d'un événement affiché -> clé de l'événement
+        self.event_pool = []     # triplets (rectangle, catégorie, description) masqués, réutilisables
+        self.layout_size = None
+        self.week_dates = None
+        self.stats = self._new_stats()
+        self.last_stats = self._new_stats()
+        self._bind_tags()
+
+    @staticmethod
+    def _new_stats():
+        return {"created": 0, "moved": 0, "configured": 0, "deleted": 0, "recycled": 0}
+
+    # --- Liaisons (une fois par tag) ---
+
+    def _bind_tags(self):
+        self.canvas.tag_bind(SLOT_TAG, "<Enter>", lambda e: self._fill_slot("#e6f7ff"))
+        self.canvas.tag_bind(SLOT_TAG, "<Leave>", lambda e: self._fill_slot("#ffffff"))
+        self.canvas.tag_bind(SLOT_TAG, "<ButtonPress-1>", lambda e: self._fill_slot("#b3e5fc"))
+        self.canvas.tag_bind(SLOT_TAG, "<ButtonRelease-1>", self._on_slot_release)
+        self.canvas.tag_bind(EVENT_TAG, "<Enter>", self._on_event_enter)
+        self.canvas.tag_bind(EVENT_TAG, "<Leave>", self._on_event_leave)
+        self.canvas.tag_bind(EVENT_TAG, "<Button-1>", self._on_event_click)
+
+    def _current(self, lookup):
+        # Élément sous le pointeur (tag "current" de Tk ; pendant un <Leave>, l'élément quitté)
+        current = self.canvas.find_withtag("current")
+        if not current:
+            return None, None
+        return current[0], lookup.get(current[0])
+
+    def _fill_slot(self, color):
+        item, slot = self._current(self.slot_lookup)
+        if slot is not None:
+            self.canvas.itemconfig(item, fill=color)
+
+    def _on_slot_release(self, event):
+        item, slot = self._current(self.slot_lookup)
+        if slot is not None:
+            self.canvas.itemconfig(item, fill="#e6f7ff")
+            self.on_slot_release(*slot)
+
+    def _current_event(self):
+        _, key = self._current(self.event_lookup)
+        return self.events.get(key) if key is not None else None
+
+    def _on_event_enter(self, event):
+        state = self._current_event()
+        if state is not None:
+            self.canvas.itemconfig(state["items"][0], outline="#2d3a4a", width=2.5)
+            self.canvas.config(cursor="hand2")
+
+    def _on_event_leave(self, event):
+        state = self._current_event()
+        if state is not None:
+            self.canvas.itemconfig(state["items"][0], outline="#4a5a6a", width=1.5)
+        self.canvas.config(cursor="")
+
+    def _on_event_click(self, event):
+        state = self._current_event()
+        if state is not None:
+            # Training courant de l'événement (il peut avoir été mis à jour depuis sa création)
+            self.on_event_click(state["training"])
+
+    def begin_frame(self):
+        self.stats = self._new_stats()
+
+    def end_frame(self):
+        self.last_stats = self.stats
+        logger.debug("redraw : %(created)d créés, %(moved)d déplacés, "
+                     "%(configured)d reconfigurés, %(deleted)d supprimés", self.stats)
+        return self.last_stats
+
+    # --- Grille ---
+
+    def _create(self, kind, *args, **kwargs):
+        self.stats["created"] += 1
+        return getattr(self.canvas, "create_" + kind)(*args, **kwargs)
+
+    def _build_grid(self):
+        for _ in range(7):
+            rect = self._create("rectangle", 0, 0, 0, 0, fill=FILL_COLOR, outline=BORDER_COLOR, width=2, tags="grid")
+            day_text = self._create("text", 0, 0, font=("Segoe UI", 10, "bold"), fill=TEXT_GRAY, tags="grid")
+            date_text = self._create("text", 0, 0, font=("Segoe UI", 9), fill=TEXT_GRAY, tags="grid")
+            self.header_items.append((rect, day_text, date_text))
+
+        for label in HOUR_LABELS:
+            rect = self._create("rectangle", 0, 0, 0, 0, fill=FILL_COLOR, outline=BORDER_COLOR, width=2, tags="grid")
+            text = self._create("text", 0, 0, text=label, font=("Segoe UI", 10, "bold"), fill=TEXT_GRAY, tags="grid")
+            self.hour_items.append((rect, text))
+
+        for row in range(len(SLOT_TIMES)):
+            for col in range(7):
+                rect = self._create("rectangle", 0, 0, 0, 0, fill="#ffffff", outline="#cccccc", width=1, tags=SLOT_TAG)
+                line = self._create("line", 0, 0, 0, 0, fill="#dddddd", tags="grid")
+                # Le créneau garde sa position (col, row) d'une semaine à l'autre
+                self.slot_lookup[rect] = (col, row)
+                self.slot_items[(col, row)] = (rect, line)
+
+    def _move(self, item, *coords):
+        self.stats["moved"] += 1
+        self.canvas.coords(item, *coords)
+
+    def _configure(self, item, **options):
+        self.stats["configured"] += 1
+        self.canvas.itemconfig(item, **options)
+
+    def layout(self, slot_width, slot_height):
+        """Repositionne la grille pour une nouvelle taille de créneau (rien à faire si elle est inchangée)."""
+        if self.layout_size == (slot_width, slot_height):
+            return False
+        if not self.slot_items:
+            # Première frame : création unique de la grille
+            self._build_grid()
+        self.layout_size = (slot_width, slot_height)
+
+        for i, (rect, day_text, date_text) in enumerate(self.header_items):
+            x_center = 60 + i*slot_width + slot_width//2 - 5
+            self._move(rect, x_center-45, 5, x_center+45, 55)
+            self._move(day_text, x_center, 18)
+            self._move(date_text, x_center, 38)
+
+        for row, (rect, text) in enumerate(self.hour_items):
+            y_center = 60 + row*slot_height
+            self._move(rect, 5, y_center-15, 55, y_center+15)
+            self._move(text, 30, y_center)
+
+        for (col, row), (rect, line) in self.slot_items.items():
+            x, y = 60 + col*slot_width, 60 + row*slot_height
+            self._move(rect, x, y, x+slot_width-10, y+slot_height)
+            self._move(line, x, y, x+slot_width-10, y)
+        return True
+
+    def set_week(self, week_dates):
+        """Met à jour les libellés des jours quand la semaine affichée change."""
+        if self.week_dates == week_dates:
+            return False
+        self.week_dates = list(week_dates)
+        for (rect, day_text, date_text), d in zip(self.header_items, week_dates):
+            self._configure(day_text, text=d.strftime("%A"))
+            self._configure(date_text, text=d.strftime("%d/%m"))
+        return True
+
+    def slot_at(self, col, row):
+        """(date, heure) du créneau (col, row) pour la semaine affichée."""
+        return self.week_dates[col], SLOT_TIMES[row]
+
+    # --- Événements ---
+
+    @timed("ui.render_events")
+    def render_events(self, specs):
+        """Synchronise le canvas avec la liste d'EventSpec (ajouts, suppressions, modifications)."""
+        wanted = {spec.key: spec for spec in specs}
+
+        for key in [k for k in self.events if k not in wanted]:
+            self._release_event(self.events.pop(key)["items"])
+
+        for key, spec in wanted.items():
+            geometry = (spec.x, spec.y, spec.width, spec.height, spec.font_size)
+            content = (spec.training.category, spec.description, spec.color, spec.font_size)
+            state = self.events.get(key)
+            if state is None:
+                self.events[key] = self._create_event(spec, geometry, content)
+                continue
+            state["training"] = spec.training
+            rect, cat_text_id, desc_text_id = state["items"]
+            if state["geometry"] != geometry:
+                state["geometry"] = geometry
+                self._place_event(state["items"], geometry)
+            if state["content"] != content:
+                state["content"] = content
+                self._configure(rect, fill=spec.color)
+                self._configure(cat_text_id, text=spec.training.category, font=("Segoe UI", spec.font_size, "bold"))
+                self._configure(desc_text_id, text=spec.description, font=("Segoe UI", spec.font_size))
+
+    def event_fills(self):
+        """Couples (rectangle, couleur de catégorie) des événements affichés."""
+        return [(state["items"][0], state["content"][2]) for state in self.events.values()]
+
+    def _place_event(self, items, geometry):
+        rect, cat_text_id, desc_text_id = items
+        x, y, w, h, font_size = geometry
+        self._move(rect, x, y, x+w, y+h)
+        self._move(cat_text_id, x + w//2, y + 8)
+        self._move(desc_text_id, x+8, y + font_size + 16)
+
+    def _release_event(self, items):
+        # Événement retiré : ses éléments sont masqués et gardés pour le prochain ajout
+        for item in items:
+            self.event_lookup.pop(item, None)
+        if len(self.event_pool) < MAX_POOLED_EVENTS:
+            for item in items:
+                self._configure(item, state="hidden")
+            self.event_pool.append(items)
+        else:
+            for item in items:
+                self.canvas.delete(item)
+                self.stats["deleted"] += 1
+
+    def _create_event(self, spec, geometry, content):
+        if self.event_pool:
+            items = self._reuse_event(spec, geometry)
+        else:
+            items = self._new_event(spec, geometry)
+        for item in items:
+            self.event_lookup[item] = spec.key
+        return {"items": items, "geometry": geometry, "content": content, "training": spec.training}
+
+    def _reuse_event(self, spec, geometry):
+        items = self.event_pool.pop()
+        rect, cat_text_id, desc_text_id = items
+        font_size = geometry[4]
+        self.stats["recycled"] += 1
+        self._configure(rect, fill=spec.color, outline="#4a5a6a", width=1.5, state="normal")
+        self._configure(cat_text_id, text=spec.training.category, font=("Segoe UI", font_size, "bold"), state="normal")
+        self._configure(desc_text_id, text=spec.description, font=("Segoe UI", font_size), state="normal")
+        self._place_event(items, geometry)
+        return items
+
+    def _new_event(self, spec, geometry):
+        x, y, w, h, font_size = geometry
+        rect = self._create(
+            "rectangle", x, y, x+w, y+h,
+            fill=spec.color,
+            outline="#4a5a6a",
+            width=1.5,
+            tags=EVENT_TAG
+        )
+        # Catégorie centrée, en gras
+        cat_text_id = self._create(
+            "text", x + w//2, y + 8,
+            text=spec.training.category,
+            font=("Segoe UI", font_size, "bold"),
+            fill="#2d3a4a",
+            anchor="n",
+            tags=EVENT_TAG
+        )
+        # Description alignée à gauche sous la catégorie
+        desc_text_id = self._create(
+            "text", x+8, y + font_size + 16,
+            text=spec.description,
+            font=("Segoe UI", font_size),
+            fill="#222222",
+            anchor="nw",
+            tags=EVENT_TAG
+        )
+        return rect, cat_text_id, desc_text_id
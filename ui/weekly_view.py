@@ -1,45 +1,31 @@
 # ui/weekly_view.py
 import tkinter as tk
-from tkinter import simpledialog, messagebox, filedialog
-from datetime import datetime, timedelta, time
-from db.database import get_trainings_for_week, add_training, delete_training, update_training, get_trainings_for_month
+from tkinter import simpledialog, messagebox, filedialog, ttk
+from datetime import datetime, date, timedelta, time
+from db.database import add_training, delete_training, update_training, search_trainings, find_conflicts, DB_PATH
+from db.database import find_rule_conflicts
+from db.database import get_all_categories
+from db.database import add_rule, get_rule, delete_rule, skip_occurrence, detach_occurrence
 from models.training import Training
-from utils.date_utils import get_week_dates
-from exporter.pdf_exporter import export_trainings_to_pdf
+from models.training_rule import TrainingRule, WEEKDAY_NAMES, split_occurrence_id
+from utils.date_utils import get_week_dates, time_to_minutes, format_minutes
+from utils.intervals import index_by_day
+from utils.startup_profile import startup_profile
+from utils import instrumentation
+from utils.instrumentation import timed
+from ui.week_renderer import WeekRenderer, EventSpec
+from ui.animation import FadeAnimator, color_ramp
+from ui.redraw_scheduler import RedrawScheduler, LAYOUT, DATA, FILTER, LOADED, ALL
+from ui.week_loader import WeekLoader
+from ui.background import BackgroundTask
+from ui.perf_overlay import PerfOverlay
+from ui import text_layout
+from ui import charts
+from stats import training_stats
 import hashlib
 import colorsys
 import calendar
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-def wrap_text(text, width=22, max_lines=None, force_single_line=False):
-    """
-    Coupe le texte en lignes de longueur maximale 'width', en conservant les retours à la ligne utilisateur
-    sauf si force_single_line=True (dans ce cas, tout est sur une seule ligne).
-    Si max_lines est défini, coupe à ce nombre de lignes et ajoute '...' si besoin.
-    """
-    if force_single_line:
-        # Remplace tous les retours à la ligne par des espaces
-        text = text.replace('\n', ' ')
-    lines = []
-    for paragraph in text.splitlines():
-        words = paragraph.split()
-        current = ""
-        for word in words:
-            if len(current + " " + word) <= width:
-                current = (current + " " + word).strip()
-            else:
-                lines.append(current)
-                current = word
-        if current:
-            lines.append(current)
-        if not force_single_line and paragraph != text.splitlines()[-1]:
-            lines.append("")
-    if max_lines is not None and len(lines) > max_lines:
-        lines = lines[:max_lines]
-        if lines:
-            lines[-1] = lines[-1].rstrip() + "..."
-    return "\n".join(lines)
+import time as timer
 
 class WeeklyPlanner(tk.Frame):
     def __init__(self, master):
@@ -118,6 +104,24 @@ class WeeklyPlanner(tk.Frame):
             command=self.export_pdf
         )
         self.export_btn.pack(side="left", padx=5)
+        self.overview_btn = tk.Button(
+            right_btns,
+            text="Vue d'ensemble",
+            font=("Segoe UI", 11, "bold"),
+            bg="#f7f7f9",
+            fg="#4a5a6a",
+            activebackground="#e0e4ea",
+            activeforeground="#2d3a4a",
+            bd=0,
+            relief="flat",
+            padx=10,
+            pady=2,
+            cursor="hand2",
+            highlightthickness=0,
+            highlightbackground="#f7f7f9",
+            command=self.show_overview
+        )
+        self.overview_btn.pack(side="left", padx=5)
         self.next_btn = tk.Button(right_btns, text="→", command=self.next_week, **nav_btn_style)
         self.next_btn.pack(side="left", padx=5)
         right_btns.grid(row=0, column=2, sticky="e", padx=10)
@@ -156,7 +160,9 @@ class WeeklyPlanner(tk.Frame):
             insertbackground="#222222"
         )
         search_entry.pack(side="left", padx=2)
-        search_entry.bind("<KeyRelease>", lambda e: self.draw_table())
+        search_entry.bind("<KeyRelease>", lambda e: self.scheduler.invalidate(FILTER))
+        # Entrée : recherche dans tout l'historique, avec saut vers la séance choisie
+        search_entry.bind("<Return>", lambda e: self.show_search_results())
 
         self.canvas_frame = tk.Frame(self, bg="#f7f7f9")
         self.canvas_frame.pack(fill="both", expand=True)
@@ -164,19 +170,42 @@ class WeeklyPlanner(tk.Frame):
         self.canvas = tk.Canvas(self.canvas_frame, bg="#f7f7f9", highlightthickness=0)
         self.canvas.pack(side="left", fill="both", expand=True)
         self.canvas.bind("<Configure>", self.on_canvas_resize)
+        self.renderer = WeekRenderer(self.canvas, self.on_slot_release, self.open_edit_popup)
+        # Les redimensionnements, frappes et modifications sont regroupés en un seul redraw
+        self.scheduler = RedrawScheduler(self, self.draw_table)
+        self.animator = FadeAnimator(self.canvas)
+        # F12 : mesures du dernier redessin ; Ctrl+F12 : export des traces
+        self.perf_overlay = PerfOverlay(self.canvas)
+        self.master.bind("<F12>", lambda e: self.toggle_perf_overlay())
+        self.master.bind("<Control-F12>", lambda e: self.dump_perf_trace())
+        # Mois affiché chargé hors du thread Tk ; la semaine s'affiche à son arrivée
+        self.loader = WeekLoader(self, self.on_month_loaded,
+                                 on_error=lambda e: messagebox.showerror("Erreur", str(e)))
+        self.bind("<Destroy>", lambda e: self.loader.stop() if e.widget is self else None)
+        self._month_batch = None
+        self._batch_month = None   # (année, mois) de _month_batch
+        self._week_trainings = []
+        self._trainings_week = None  # lundi de la semaine de _week_trainings
 
         self.master.geometry("980x960")
         self.master.minsize(800, 600)
         self.master.lift()
         self.master.attributes("-topmost", True)
         self.master.after(0, lambda: self.master.attributes("-topmost", False))
-        self.draw_table()
+        with startup_profile.phase("premier draw_table"):
+            self.draw_table()
 
     def on_canvas_resize(self, event):
-        self.draw_table()
+        self.scheduler.invalidate(LAYOUT)
+
+    def draw_table(self, reasons=ALL):
+        """Redessine la semaine ; reasons limite le travail (LAYOUT : positions, FILTER : recherche, DATA : requête)."""
+        instrumentation.begin_frame()
+        self._draw_week(reasons)
+        self.perf_overlay.show(instrumentation.end_frame(), self.renderer.last_stats)
 
-    def draw_table(self):
-        self.canvas.delete("all")
+    @timed("ui.draw_table")
+    def _draw_week(self, reasons):
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         slot_width = max(60, (canvas_width - 60) // 7)
@@ -187,177 +216,90 @@ class WeeklyPlanner(tk.Frame):
         week_number = self.current_date.isocalendar()[1]
         self.month_year_label.config(text=f"{month_name} {year} – Semaine {week_number}")
 
-        self.slots = {}
-        week_dates = get_week_dates(self.current_date)
-
-        border_color = "#bbbbbb"
-        fill_color = "#ffffff"
-        text_gray = "#888888"
-
-        for i, date in enumerate(week_dates):
-            x_center = 60 + i*slot_width + slot_width//2 - 5
-            self.canvas.create_rectangle(
-                x_center-45, 5, x_center+45, 55,
-                fill=fill_color, outline=border_color, width=2
-            )
-            self.canvas.create_text(
-                x_center, 18,
-                text=date.strftime("%A"),
-                font=("Segoe UI", 10, "bold"),
-                fill=text_gray
-            )
-            self.canvas.create_text(
-                x_center, 38,
-                text=date.strftime("%d/%m"),
-                font=("Segoe UI", 9),
-                fill=text_gray
-            )
-
-        def make_bindings(r, d, t):
-            def on_enter(event): self.canvas.itemconfig(r, fill="#e6f7ff")
-            def on_leave(event): self.canvas.itemconfig(r, fill="#ffffff")
-            def on_press(event): self.canvas.itemconfig(r, fill="#b3e5fc")
-            def on_release(event): self.canvas.itemconfig(r, fill="#e6f7ff"); self.add_popup(d, t)
-            self.canvas.tag_bind(r, "<Enter>", on_enter)
-            self.canvas.tag_bind(r, "<Leave>", on_leave)
-            self.canvas.tag_bind(r, "<ButtonPress-1>", on_press)
-            self.canvas.tag_bind(r, "<ButtonRelease-1>", on_release)
-
-        for row, minutes in enumerate(range(12*60, 21*60 + 30, 30)):
-            t = time(minutes//60, minutes%60)
-            y_center = 60 + row*slot_height
-            self.canvas.create_rectangle(
-                5, y_center-15, 55, y_center+15,
-                fill=fill_color, outline=border_color, width=2
-            )
-            self.canvas.create_text(
-                30, y_center,
-                text=t.strftime("%H:%M"),
-                font=("Segoe UI", 10, "bold"),
-                fill=text_gray
-            )
-            for col, date in enumerate(week_dates):
-                x, y = 60 + col*slot_width, 60 + row*slot_height
-                rect = self.canvas.create_rectangle(x, y, x+slot_width-10, y+slot_height, fill="#ffffff", outline="#cccccc", width=1)
-                self.canvas.create_line(x, y, x+slot_width-10, y, fill="#dddddd")
-                make_bindings(rect, date, t)
-                self.slots[(date, t)] = rect
-        self.canvas.create_rectangle(
-            5, 60 + (row + 1)*slot_height - 15, 55, 60 + (row + 1)*slot_height + 15,
-            fill=fill_color, outline=border_color, width=2
-        )
-        self.canvas.create_text(
-            30, 60 + (row + 1)*slot_height,
-            text="22:00",
-            font=("Segoe UI", 10, "bold"),
-            fill=text_gray
-        )
+        # La grille est créée une fois par le renderer puis seulement repositionnée / renommée
+        self.renderer.begin_frame()
+        self.renderer.layout(slot_width, slot_height)
+        self.renderer.set_week(get_week_dates(self.current_date))
 
+        if reasons & {DATA, FILTER, LOADED} or self._batch_month != (self.current_date.year, self.current_date.month):
+            self.load_trainings(reload=DATA in reasons)
+        # Pendant un chargement, le fondu attend l'arrivée des séances
+        fade = getattr(self, "_fade_events", False) and not self.loader.loading
         self.draw_trainings(
-            fade=getattr(self, "_fade_events", False),
+            fade=fade,
             slot_width=slot_width,
             slot_height=slot_height
         )
-        self._fade_events = False
-
-    def fade_in_events(self, events_data, slot_width, slot_height, steps=10, delay=20):
-        # --- Ajout du wrapping dynamique ---
-        if slot_width < 80:
-            wrap_chars = 10
-            force_single_line = True
-            max_lines = 1
-        elif slot_width < 120:
-            wrap_chars = 15
-            force_single_line = False
-            max_lines = 2
-        else:
-            wrap_chars = 22
-            force_single_line = False
-            max_lines = 4
-
-        min_font = 7
-        max_font = 11
-        font_size = max(min_font, min(max_font, int((slot_width-10) / 10)))
-        event_font = ("Segoe UI", font_size)
-        # --- Fin ajout wrapping dynamique ---
-
-        for step in range(1, steps + 1):
-            alpha = step / steps
-            for event in events_data:
-                x, y, h, color, outline, text, t = event
-                # Wrapping dynamique pour affichage
-                text = f"{t.category}\n{wrap_text(t.description, width=wrap_chars, max_lines=max_lines, force_single_line=force_single_line)}"
-                r1, g1, b1 = self.winfo_rgb("#ffffff")
-                r2, g2, b2 = self.winfo_rgb(color)
-                r = int(r1 + (r2 - r1) * alpha) // 256
-                g = int(g1 + (g2 - g1) * alpha) // 256
-                b = int(b1 + (b2 - b1) * alpha) // 256
-                fade_color = f"#{r:02x}{g:02x}{b:02x}"
-                rect = self.canvas.create_rectangle(
-                    x, y, x+slot_width-10, y+h,
-                    fill=fade_color,
-                    outline=outline,
-                    width=1.5,
-                    tags="event_fade"
-                )
-                txt = self.canvas.create_text(
-                    x+5, y+5, anchor="nw", text=text, font=event_font, fill="#000000", tags="event_fade"
-                )
-                def on_enter(event, item=rect, txt=txt):
-                    self.canvas.itemconfig(item, outline="#2d3a4a", width=2.5)
-                    self.canvas.tag_raise(item)
-                    self.canvas.tag_raise(txt)
-                    self.canvas.config(cursor="hand2")
-                def on_leave(event, item=rect):
-                    self.canvas.itemconfig(item, outline="#4a5a6a", width=1.5)
-                    self.canvas.config(cursor="")
-                def on_click(event, t=t):
-                    self.open_edit_popup(t)
-                self.canvas.tag_bind(rect, "<Enter>", on_enter)
-                self.canvas.tag_bind(rect, "<Leave>", on_leave)
-                self.canvas.tag_bind(rect, "<Button-1>", on_click)
-                self.canvas.tag_bind(txt, "<Enter>", on_enter)
-                self.canvas.tag_bind(txt, "<Leave>", on_leave)
-                self.canvas.tag_bind(txt, "<Button-1>", on_click)
-            self.canvas.update()
-            self.after(delay)
-            if step != steps:
-                self.canvas.delete("event_fade")
-
-    def draw_trainings(self, fade=False, slot_width=120, slot_height=40):
+        if not self.loader.loading:
+            self._fade_events = False
+        self.renderer.end_frame()
+
+    def on_slot_release(self, col, row):
+        self.add_popup(*self.renderer.slot_at(col, row))
+
+    @timed("ui.load_trainings")
+    def load_trainings(self, reload=True):
+        """
+        Prend le mois affiché (si reload ou si le mois a changé) puis applique la recherche
+        et garde la semaine courante. Un mois absent du cache est chargé par self.loader hors
+        du thread Tk : la grille s'affiche tout de suite, les séances à l'arrivée du mois
+        (on_month_loaded). Les mois des semaines voisines sont ensuite préchargés.
+        """
+        month = (self.current_date.year, self.current_date.month)
+        week_dates = get_week_dates(self.current_date)
+        if reload or self._batch_month != month:
+            batch = self.loader.get(*month, force=reload)
+            if batch is None:
+                # Les séances d'une autre semaine ne restent pas affichées pendant le chargement
+                if self._trainings_week != week_dates[0]:
+                    self._week_trainings = []
+                return
+            self._month_batch, self._batch_month = batch, month
+            self.prefetch_neighbours()
         keyword = self.search_var.get().strip().lower() if hasattr(self, "search_var") else ""
-        year = self.current_date.year
-        month = self.current_date.month
-
-        trainings_month = get_trainings_for_month(year, month, "toutes")
+        trainings_month = self._month_batch
         if keyword:
-            trainings_month = [
-                t for t in trainings_month
-                if keyword in t.description.lower() or keyword in t.category.lower()
-            ]
-        week_dates = get_week_dates(self.current_date)
-        week_dates_set = set(week_dates)
-        trainings = [t for t in trainings_month if t.date in week_dates_set]
+            trainings_month = trainings_month.filter_keyword(keyword)
+        self._week_trainings = trainings_month.between(week_dates[0], week_dates[-1])
+        self._trainings_week = week_dates[0]
+
+    def on_month_loaded(self, year, month, batch):
+        if (year, month) == (self.current_date.year, self.current_date.month):
+            self._month_batch, self._batch_month = batch, (year, month)
+            self.scheduler.invalidate(LOADED)
+            self.prefetch_neighbours()
+
+    def prefetch_neighbours(self):
+        """Précharge les semaines précédente et suivante (leur mois, s'il diffère du mois affiché)."""
+        for neighbour in (self.current_date - timedelta(days=7), self.current_date + timedelta(days=7)):
+            if (neighbour.year, neighbour.month) != self._batch_month:
+                self.loader.prefetch(neighbour.year, neighbour.month)
+
+    @timed("ui.draw_trainings")
+    def draw_trainings(self, fade=False, slot_width=120, slot_height=40):
+        trainings = list(self._week_trainings)
+        # Séances qui se chevauchent le même jour : côte à côte, dans des colonnes de même largeur
+        columns = {}
+        for index in index_by_day(
+                (t.date for t in trainings), (time_to_minutes(t.start_time) for t in trainings),
+                (time_to_minutes(t.end_time) for t in trainings), (t.id for t in trainings)).values():
+            columns.update(index.layout_columns())
 
         # Paramètres de police
         min_font = 7
         max_font = 11
         font_size = max(min_font, min(max_font, int((slot_width-10) / 10)))
-        event_font = ("Segoe UI", font_size)
 
-        # Largeur de texte pour le wrapping
-        if slot_width < 80:
-            wrap_chars = 10
-        elif slot_width < 120:
-            wrap_chars = 15
-        else:
-            wrap_chars = 22
+        font = ("Segoe UI", font_size)
 
+        specs = []
         for t in trainings:
             col = t.date.weekday()
             # Calcule la position y en fonction de l'heure de début
             row = ((t.start_time.hour - 12) * 2) + (1 if t.start_time.minute == 30 else 0)
-            x = 60 + col * slot_width
+            column, nb_columns = columns.get(t.id, (0, 1))
+            width = (slot_width - 10) // nb_columns
+            x = 60 + col * slot_width + column * width
             y = 60 + row * slot_height
 
             # Hauteur "horaire" (durée de l'événement)
@@ -365,65 +307,29 @@ class WeeklyPlanner(tk.Frame):
             h_time = max(1, duration_slots) * slot_height
 
             # Texte complet wrappé (catégorie + description)
-            desc_wrapped = wrap_text(t.description, width=wrap_chars, max_lines=None, force_single_line=False)
+            # (largeur disponible : celle du rectangle, texte décalé de 8 px de chaque côté)
+            desc_wrapped = text_layout.wrap(t.description, font, width - 16)
             nb_desc_lines = desc_wrapped.count('\n') + 1
             h_text = (nb_desc_lines + 1) * (font_size + 2) + 10  # +1 pour la catégorie
             h = max(h_time, h_text)
 
-            color = self.get_category_color(t.category)
-            outline = "#4a5a6a"
-
-            rect = self.canvas.create_rectangle(
-                x, y, x+slot_width-10, y+h,
-                fill=color,
-                outline=outline,
-                width=1.5,
-                tags="event_fade"
-            )
-
-            # Catégorie centrée, en gras
-            cat_text_id = self.canvas.create_text(
-                x + (slot_width-10)//2, y + 8,
-                text=t.category,
-                font=("Segoe UI", font_size, "bold"),
-                fill="#2d3a4a",
-                anchor="n",
-                tags="event_fade"
-            )
-
-            # Description alignée à gauche sous la catégorie
-            desc_text_id = self.canvas.create_text(
-                x+8, y + font_size + 16,
-                text=desc_wrapped,
-                font=("Segoe UI", font_size),
-                fill="#222222",
-                anchor="nw",
-                tags="event_fade"
-            )
-
-            elements = [rect, cat_text_id, desc_text_id]
+            specs.append(EventSpec(
+                key=t.id, training=t, x=x, y=y, width=width - (2 if nb_columns > 1 else 0), height=h,
+                color=self.get_category_color(t.category), font_size=font_size, description=desc_wrapped
+            ))
 
-            def on_enter(event, item=rect):
-                self.canvas.itemconfig(item, outline="#2d3a4a", width=2.5)
-                self.canvas.config(cursor="hand2")
-
-            def on_leave(event, item=rect):
-                self.canvas.itemconfig(item, outline="#4a5a6a", width=1.5)
-                self.canvas.config(cursor="")
-
-            def on_click(event, t=t):
-                self.open_edit_popup(t)
-
-            # Lier les événements à tous les éléments de l'événement
-            for el in elements:
-                self.canvas.tag_bind(el, "<Enter>", on_enter)
-                self.canvas.tag_bind(el, "<Leave>", on_leave)
-                self.canvas.tag_bind(el, "<Button-1>", on_click)
+        # Un fondu en cours se termine d'abord : les éléments retirés peuvent être réutilisés ci-dessous
+        self.animator.cancel()
+        # Seuls les événements ajoutés, supprimés ou modifiés touchent le canvas
+        self.renderer.render_events(specs)
+        if fade:
+            # Fondu non bloquant : seules les couleurs de remplissage changent, étape par étape
+            self.animator.fade_in(self.renderer.event_fills())
 
     def add_popup(self, date, start_time):
         popup = tk.Toplevel(self)
         popup.title("Ajouter un entraînement")
-        popup.geometry("320x320")
+        popup.geometry("320x420")
         popup.grab_set()
 
         tk.Label(popup, text="Catégorie :").pack(pady=(10, 0))
@@ -453,6 +359,23 @@ class WeeklyPlanner(tk.Frame):
         end_time_menu = tk.OptionMenu(popup, end_time_var, *possible_end_times)
         end_time_menu.pack(pady=10)
 
+        # Récurrence : chaque semaine aux jours cochés, jusqu'à la date saisie (fin de saison par défaut)
+        repeat_var = tk.BooleanVar(popup, value=False)
+        tk.Checkbutton(popup, text="Répéter chaque semaine", variable=repeat_var).pack()
+        weekdays_frame = tk.Frame(popup)
+        weekdays_frame.pack()
+        weekday_vars = []
+        for weekday, name in enumerate(WEEKDAY_NAMES):
+            var = tk.BooleanVar(popup, value=weekday == date.weekday())
+            tk.Checkbutton(weekdays_frame, text=name[:2], variable=var).pack(side="left")
+            weekday_vars.append(var)
+        until_frame = tk.Frame(popup)
+        until_frame.pack(pady=(0, 5))
+        tk.Label(until_frame, text="Jusqu'au (JJ/MM/AAAA) :").pack(side="left")
+        until_entry = tk.Entry(until_frame, width=11)
+        until_entry.insert(0, training_stats.season_period(date)[1].strftime("%d/%m/%Y"))
+        until_entry.pack(side="left")
+
         def submit():
             category = category_entry.get()
             description = description_text.get("1.0", "end").strip()
@@ -462,8 +385,18 @@ class WeeklyPlanner(tk.Frame):
                 if end_time <= start_time:
                     raise ValueError("L’heure de fin doit être après l’heure de début.")
                 new_t = Training(category=category, description=description, date=date, start_time=start_time, end_time=end_time)
-                add_training(new_t)
-                self.draw_table()
+                if repeat_var.get():
+                    until = datetime.strptime(until_entry.get().strip(), "%d/%m/%Y").date()
+                    weekdays = [weekday for weekday, var in enumerate(weekday_vars) if var.get()]
+                    rule = TrainingRule(category, description, start_time, end_time, weekdays, date, until)
+                    if not self.confirm_rule_conflicts(rule, popup):
+                        return
+                    add_rule(rule)
+                else:
+                    if not self.confirm_conflicts(new_t, popup):
+                        return
+                    add_training(new_t)
+                self.scheduler.invalidate(DATA)
                 popup.destroy()
             except Exception as e:
                 messagebox.showerror("Erreur", str(e))
@@ -471,6 +404,35 @@ class WeeklyPlanner(tk.Frame):
         add_btn = tk.Button(popup, text="Ajouter", command=submit, relief="raised", bd=3, font=("Segoe UI", 10, "bold"))
         add_btn.pack(pady=(10, 20))
 
+    def confirm_conflicts(self, training, parent):
+        """Prévient si la séance chevauche d'autres séances du même jour ; retourne True pour enregistrer."""
+        conflicts = find_conflicts(training)
+        if not conflicts:
+            return True
+        details = "\n".join(f"• {c.start_time:%H:%M} – {c.end_time:%H:%M}  {c.category}" for c in conflicts[:8])
+        if len(conflicts) > 8:
+            details += f"\n… et {len(conflicts) - 8} autre(s)"
+        return messagebox.askyesno(
+            "Chevauchement",
+            f"Ce créneau chevauche {len(conflicts)} séance(s) du {training.date:%d/%m/%Y} :\n{details}\n\nEnregistrer quand même ?",
+            parent=parent
+        )
+
+    def confirm_rule_conflicts(self, rule, parent):
+        """Comme confirm_conflicts, pour toutes les dates d'une séance récurrente."""
+        conflicts = find_rule_conflicts(rule)
+        if not conflicts:
+            return True
+        details = "\n".join(f"• {c.date:%d/%m/%Y}  {c.start_time:%H:%M} – {c.end_time:%H:%M}  {c.category}" for c in conflicts[:8])
+        if len(conflicts) > 8:
+            details += f"\n… et {len(conflicts) - 8} autre(s)"
+        dates = len({c.date for c in conflicts})
+        return messagebox.askyesno(
+            "Chevauchement",
+            f"Cette récurrence chevauche {len(conflicts)} séance(s) sur {dates} date(s) :\n{details}\n\nEnregistrer quand même ?",
+            parent=parent
+        )
+
     def edit_popup(self, training):
         description = simpledialog.askstring("Description", "", initialvalue=training.description)
         category = simpledialog.askstring("Catégorie", "", initialvalue=training.category)
@@ -481,73 +443,291 @@ class WeeklyPlanner(tk.Frame):
             training.category = category
             training.end_time = time(end_hour, end_min)
             update_training(training)
-            self.draw_table()
+            self.scheduler.invalidate(DATA)
         except Exception as e:
             messagebox.showerror("Erreur", str(e))
 
     def delete_training(self, training_id):
         delete_training(training_id)
-        self.draw_table()
+        self.scheduler.invalidate(DATA)
+
+    def show_search_results(self):
+        query = self.search_var.get().strip()
+        if not query:
+            return
+        results = search_trainings(query, limit=50)
+
+        popup = tk.Toplevel(self)
+        popup.title("Résultats de recherche")
+        popup.geometry("460x360")
+        popup.configure(bg="#f7f7f9")
+
+        tk.Label(
+            popup,
+            text=f"{len(results)} résultat(s) pour « {query} »",
+            font=("Segoe UI", 11, "bold"),
+            bg="#f7f7f9",
+            fg="#2d3a4a"
+        ).pack(pady=(10, 5))
+
+        listbox = tk.Listbox(popup, font=("Segoe UI", 10), activestyle="none", height=14)
+        listbox.pack(fill="both", expand=True, padx=10)
+        for t in results:
+            first_line = t.description.splitlines()[0] if t.description else ""
+            listbox.insert(
+                "end",
+                f"{t.date.strftime('%d/%m/%Y')}  {t.start_time.strftime('%H:%M')}–{t.end_time.strftime('%H:%M')}  "
+                f"{t.category} – {first_line}"
+            )
+
+        def jump(event=None):
+            selection = listbox.curselection()
+            if not selection:
+                return
+            training = results[selection[0]]
+            self.animator.cancel()
+            # Le filtre de recherche est vidé pour afficher la semaine complète autour de la séance
+            self.search_var.set("")
+            self.current_date = training.date
+            self._fade_events = True
+            self.scheduler.invalidate(DATA)
+            popup.destroy()
+
+        listbox.bind("<Double-Button-1>", jump)
+        listbox.bind("<Return>", jump)
+        if results:
+            listbox.selection_set(0)
+            listbox.focus_set()
+        tk.Button(popup, text="Aller à la séance", command=jump, relief="raised", bd=3, font=("Segoe UI", 10, "bold")).pack(pady=10)
+
+    def toggle_perf_overlay(self):
+        self.perf_overlay.toggle()
+        self.scheduler.invalidate(DATA)
+
+    def dump_perf_trace(self):
+        if not instrumentation.is_enabled():
+            messagebox.showinfo("Traces", "Activez d'abord les mesures avec F12.")
+            return
+        filepath = filedialog.asksaveasfilename(defaultextension=".json", initialfile="planning_trace.json",
+                                                filetypes=[("Chrome Trace", "*.json")])
+        if filepath:
+            count = instrumentation.dump_trace(filepath)
+            messagebox.showinfo("Traces", f"{count} mesures écrites dans {filepath}\n(à ouvrir dans chrome://tracing ou ui.perfetto.dev)")
+
+    def show_overview(self):
+        # Vue mois / saison : cases par jour lues dans les agrégats journaliers, canvas virtualisé
+        from ui.overview_view import OverviewWindow
+        OverviewWindow(self, self.current_date, on_open_day=self.go_to_date)
+
+    def go_to_date(self, day):
+        """Affiche la semaine de day (clic sur un jour de la vue d'ensemble)."""
+        self.animator.cancel()
+        self.current_date = day
+        self._fade_events = True
+        self.scheduler.invalidate(DATA)
 
     def prev_week(self):
+        self.animator.cancel()
         self.current_date -= timedelta(days=7)
         self._fade_events = True
-        self.draw_table()
+        self.scheduler.invalidate(DATA)
 
     def next_week(self):
+        self.animator.cancel()
         self.current_date += timedelta(days=7)
         self._fade_events = True
-        self.draw_table()
+        self.scheduler.invalidate(DATA)
 
     def export_pdf(self):
+        # reportlab n'est chargé qu'à la première ouverture de l'export, pas au lancement
+        from exporter.pdf_exporter import export_period_to_pdf, ExportCancelled
+        from exporter.batch_exporter import batch_export, format_summary
+
         popup = tk.Toplevel(self)
         popup.title("Exporter au format PDF")
-        popup.geometry("340x320")
+        popup.geometry("380x600")
         popup.grab_set()
 
-        # Choix de l'année
-        tk.Label(popup, text="Année :").pack(pady=(10, 0))
-        year_var = tk.StringVar(popup)
         year_choices = [str(y) for y in range(2023, 2031)]
-        year_var.set(str(datetime.now().year))
-        year_menu = tk.OptionMenu(popup, year_var, *year_choices)
-        year_menu.pack(pady=5)
-
-        # Choix du mois
-        tk.Label(popup, text="Mois :").pack(pady=(10, 0))
-        month_var = tk.StringVar(popup)
         month_choices = [f"{i:02}" for i in range(1, 13)]
-        month_var.set(f"{datetime.now().month:02}")
-        month_menu = tk.OptionMenu(popup, month_var, *month_choices)
-        month_menu.pack(pady=5)
 
-        # Choix de la catégorie
-        tk.Label(popup, text="Catégorie :").pack(pady=(10, 0))
-        category_var = tk.StringVar(popup)
-        from db.database import get_all_categories
+        # Période : du mois (début) au mois (fin), bornes incluses
+        def month_picker(label):
+            tk.Label(popup, text=label).pack(pady=(10, 0))
+            frame = tk.Frame(popup)
+            frame.pack(pady=5)
+            month_var = tk.StringVar(popup, f"{datetime.now().month:02}")
+            year_var = tk.StringVar(popup, str(datetime.now().year))
+            tk.OptionMenu(frame, month_var, *month_choices).pack(side="left", padx=2)
+            tk.OptionMenu(frame, year_var, *year_choices).pack(side="left", padx=2)
+            return month_var, year_var
+
+        start_month_var, start_year_var = month_picker("Du mois :")
+        end_month_var, end_year_var = month_picker("Au mois (inclus) :")
+
+        def set_period(first, months):
+            last_index = first.year * 12 + first.month - 1 + months - 1
+            start_month_var.set(f"{first.month:02}")
+            start_year_var.set(str(first.year))
+            end_month_var.set(f"{last_index % 12 + 1:02}")
+            end_year_var.set(str(last_index // 12))
+
+        presets = tk.Frame(popup)
+        presets.pack(pady=5)
+        tk.Button(presets, text="Mois affiché",
+                  command=lambda: set_period(self.current_date.replace(day=1), 1)).pack(side="left", padx=2)
+        tk.Button(presets, text="Trimestre",
+                  command=lambda: set_period(self.current_date.replace(day=1, month=(self.current_date.month - 1) // 3 * 3 + 1), 3)).pack(side="left", padx=2)
+        tk.Button(presets, text="Saison",
+                  command=lambda: set_period(training_stats.season_period(self.current_date)[0], 10)).pack(side="left", padx=2)
+
+        # Choix des catégories (aucune sélection = toutes)
+        tk.Label(popup, text="Catégories (aucune = toutes) :").pack(pady=(10, 0))
         categories = get_all_categories()
-        category_choices = ["Toutes"] + categories
-        category_var.set("Toutes")
-        category_menu = tk.OptionMenu(popup, category_var, *category_choices)
-        category_menu.pack(pady=5)
+        category_list = tk.Listbox(popup, selectmode="multiple", height=6, exportselection=False)
+        for category in categories:
+            category_list.insert("end", category)
+        category_list.pack(pady=5, padx=20, fill="x")
+
+        # Progression de l'export (exécuté dans un thread de travail)
+        progress_bar = ttk.Progressbar(popup, mode="determinate", maximum=1)
+        progress_bar.pack(pady=(10, 0), padx=20, fill="x")
+        status_label = tk.Label(popup, text="")
+        status_label.pack(pady=(2, 0))
+        task = None
+        closing = False  # popup fermé pendant l'export : détruit quand le thread a rendu la main
+
+        def on_progress(done, total):
+            if not popup.winfo_exists():
+                return
+            progress_bar.config(maximum=max(1, total), value=done)
+            status_label.config(text=f"{done} / {total} séances")
+
+        def finish():
+            """Fin de l'export : réactive les boutons. False si le popup n'existe plus."""
+            if closing and popup.winfo_exists():
+                popup.destroy()
+            if not popup.winfo_exists():
+                return False
+            export_btn.config(state="normal")
+            cancel_btn.config(text="Fermer")
+            return True
+
+        def on_done(filepath, count):
+            alive = finish()
+            messagebox.showinfo("Exporté", f"PDF généré : {filepath} ({count} séances)")
+            if alive:
+                popup.destroy()
+
+        def on_error(error):
+            if not finish():
+                return
+            if isinstance(error, ExportCancelled):
+                status_label.config(text="Export annulé")
+            else:
+                messagebox.showerror("Erreur", str(error))
 
         # Bouton Exporter
         def do_export():
+            nonlocal task
             try:
-                year = int(year_var.get())
-                month = int(month_var.get())
-                category = category_var.get()
-                trainings = get_trainings_for_month(year, month, category)
+                start = date(int(start_year_var.get()), int(start_month_var.get()), 1)
+                last = date(int(end_year_var.get()), int(end_month_var.get()), 1)
+                end = last.replace(day=calendar.monthrange(last.year, last.month)[1])
+                if end < start:
+                    raise ValueError("La fin de la période doit être après son début.")
+                selected = [categories[i] for i in category_list.curselection()]
                 filepath = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")])
-                if filepath:
-                    export_trainings_to_pdf(trainings, filepath)
-                    messagebox.showinfo("Exporté", f"PDF généré : {filepath}")
-                    popup.destroy()
+                if not filepath:
+                    return
+                export_btn.config(state="disabled")
+                cancel_btn.config(text="Annuler l'export")
+                task = BackgroundTask(
+                    self,
+                    lambda report, cancelled: export_period_to_pdf(start, end, selected, filepath,
+                                                                   progress=report, cancelled=cancelled),
+                    on_progress=on_progress,
+                    on_done=lambda count: on_done(filepath, count),
+                    on_error=on_error,
+                ).start()
             except Exception as e:
                 messagebox.showerror("Erreur", str(e))
 
-        export_btn = tk.Button(popup, text="Exporter", command=do_export, relief="raised", bd=3, font=("Segoe UI", 10, "bold"))
-        export_btn.pack(pady=20)
+        # Export en lot : un PDF par catégorie et par mois, rendus en parallèle (processus)
+        def do_batch_export():
+            nonlocal task
+            try:
+                first_index = int(start_year_var.get()) * 12 + int(start_month_var.get()) - 1
+                last_index = int(end_year_var.get()) * 12 + int(end_month_var.get()) - 1
+                if last_index < first_index:
+                    raise ValueError("La fin de la période doit être après son début.")
+                months = [(i // 12, i % 12 + 1) for i in range(first_index, last_index + 1)]
+                selected = [categories[i] for i in category_list.curselection()] or categories
+                directory = filedialog.askdirectory(title="Dossier de destination")
+                if not directory:
+                    return
+                export_btn.config(state="disabled")
+                batch_btn.config(state="disabled")
+                cancel_btn.config(text="Annuler l'export")
+                started = timer.perf_counter()
+
+                def on_batch_done(results):
+                    alive = finish()
+                    if alive:
+                        batch_btn.config(state="normal")
+                    messagebox.showinfo("Export en lot", format_summary(results, timer.perf_counter() - started))
+                    if alive and not task.cancelled():
+                        popup.destroy()
+
+                def on_batch_progress(done, total):
+                    if popup.winfo_exists():
+                        progress_bar.config(maximum=max(1, total), value=done)
+                        status_label.config(text=f"{done} / {total} fichiers")
+
+                def on_batch_error(error):
+                    if popup.winfo_exists() and not closing:
+                        batch_btn.config(state="normal")
+                    on_error(error)
+
+                task = BackgroundTask(
+                    self,
+                    lambda report, cancelled: batch_export(
+                        DB_PATH, selected, months, directory,
+                        progress=lambda done, total, result: report(done, total),
+                        cancelled=cancelled),
+                    on_progress=on_batch_progress,
+                    on_done=on_batch_done,
+                    on_error=on_batch_error,
+                ).start()
+            except Exception as e:
+                messagebox.showerror("Erreur", str(e))
+
+        def do_cancel():
+            if task is not None and task.running:
+                task.cancel()
+            else:
+                popup.destroy()
+
+        btn_frame = tk.Frame(popup)
+        btn_frame.pack(pady=15)
+        export_btn = tk.Button(btn_frame, text="Exporter", command=do_export, relief="raised", bd=3, font=("Segoe UI", 10, "bold"))
+        export_btn.pack(side="left", padx=5)
+        cancel_btn = tk.Button(btn_frame, text="Fermer", command=do_cancel, relief="raised", bd=3, font=("Segoe UI", 10, "bold"))
+        cancel_btn.pack(side="left", padx=5)
+        batch_btn = tk.Button(popup, text="Un PDF par catégorie et par mois…", command=do_batch_export, relief="raised", bd=2)
+        batch_btn.pack()
+
+        def do_close():
+            # Export en cours : on l'annule, le popup reste ouvert jusqu'à l'arrêt du thread
+            nonlocal closing
+            if task is not None and task.running:
+                closing = True
+                task.cancel()
+                status_label.config(text="Annulation…")
+            else:
+                popup.destroy()
+
+        popup.protocol("WM_DELETE_WINDOW", do_close)
 
     def open_edit_popup(self, training):
         popup = tk.Toplevel(self)
@@ -555,6 +735,12 @@ class WeeklyPlanner(tk.Frame):
         popup.geometry("330x380")
         popup.grab_set()
 
+        # Occurrence d'une séance récurrente : (id de la règle, date), sinon None
+        occurrence = split_occurrence_id(training.id)
+        rule = get_rule(occurrence[0]) if occurrence is not None else None
+        if rule is not None:
+            tk.Label(popup, text=rule.describe(), fg="#555", wraplength=300).pack(pady=(8, 0))
+
         tk.Label(popup, text="Catégorie :").pack(pady=(10, 0))
         category_entry = tk.Entry(popup)
         category_entry.insert(0, training.category)
@@ -615,19 +801,43 @@ class WeeklyPlanner(tk.Frame):
                 end_time_val = time(end_h, end_m)
                 if end_time_val <= start_time_val:
                     raise ValueError("L’heure de fin doit être après celle de début.")
+                candidate = Training(id=training.id, category=category, description=description, date=training.date,
+                                     start_time=start_time_val, end_time=end_time_val)
+                if not self.confirm_conflicts(candidate, popup):
+                    return
+                if occurrence is not None:
+                    # Occurrence d'une séance récurrente : seule cette date est modifiée
+                    detach_occurrence(training.id, candidate)
+                    self.scheduler.invalidate(DATA)
+                    popup.destroy()
+                    return
                 training.category = category
                 training.description = description
                 training.start_time = start_time_val
                 training.end_time = end_time_val
                 update_training(training)
-                self.draw_table()
+                self.scheduler.invalidate(DATA)
                 popup.destroy()
             except Exception as e:
                 messagebox.showerror("Erreur", str(e))
 
         def delete():
-            delete_training(training.id)
-            self.draw_table()
+            if occurrence is not None:
+                answer = messagebox.askyesnocancel(
+                    "Séance récurrente",
+                    f"{rule.describe() if rule else 'Séance récurrente'}\n\n"
+                    "Supprimer toute la série ?\n(Non : supprimer seulement cette date)",
+                    parent=popup
+                )
+                if answer is None:
+                    return
+                if answer:
+                    delete_rule(occurrence[0])
+                else:
+                    skip_occurrence(training.id)
+            else:
+                delete_training(training.id)
+            self.scheduler.invalidate(DATA)
             popup.destroy()
 
         btn_frame = tk.Frame(popup)
@@ -638,134 +848,206 @@ class WeeklyPlanner(tk.Frame):
         tk.Button(btn_frame, text="Annuler", command=popup.destroy, relief="raised", bd=3, font=("Segoe UI", 10, "bold")).pack(side="left", padx=5)
 
     def show_stats_popup(self):
-        # Récupère les trainings du mois affiché
-        year = self.current_date.year
-        month = self.current_date.month
-        trainings = get_trainings_for_month(year, month, "toutes")
-
-        # Statistiques
-        nb_total = len(trainings)
-        weeks_in_month = sorted(set(t.date.isocalendar()[1] for t in trainings))
-        cat_counts = {}
-        for t in trainings:
-            cat_counts[t.category] = cat_counts.get(t.category, 0) + 1
-
         # Création du popup stylisé
         popup = tk.Toplevel(self)
-        popup.title("Statistiques du mois")
-        popup.geometry("420x650")
+        popup.title("Statistiques")
+        popup.geometry("440x800")
         popup.configure(bg="#f7f7f9")
         popup.grab_set()
 
         # Carte principale (effet carte blanche arrondie)
         card = tk.Frame(popup, bg="#ffffff", bd=0, highlightthickness=0)
-        card.place(relx=0.5, rely=0.03, anchor="n", width=380, height=600)
+        card.place(relx=0.5, rely=0.02, anchor="n", width=400, height=770)
 
         # Ombre portée (optionnel, effet simple)
         # (Tkinter ne gère pas l'ombre nativement, mais le fond gris clair autour donne déjà un effet "carte")
 
         # Titre principal
-        tk.Label(
+        title_label = tk.Label(
             card,
-            text=f"Statistiques – {calendar.month_name[month].capitalize()} {year}",
             font=("Segoe UI", 16, "bold"),
             bg="#ffffff",
             fg="#222222"
-        ).pack(pady=(22, 10))
-
-        # Encadré résumé
-        resume_frame = tk.Frame(card, bg="#f4f6fa", bd=1, relief="solid", highlightbackground="#e0e4ea", highlightthickness=1)
-        resume_frame.pack(pady=(0, 18), padx=18, fill="x")
+        )
+        title_label.pack(pady=(18, 6))
 
-        # Nombre total de séances
-        tk.Label(
-            resume_frame,
-            text="Nombre total de séances :",
-            font=("Segoe UI", 11, "bold"),
-            bg="#f4f6fa",
-            fg="#222222",
-            anchor="w"
-        ).pack(anchor="w", pady=(10, 0), padx=12)
-        tk.Label(
-            resume_frame,
-            text=f"{nb_total}",
-            font=("Segoe UI", 12),
-            bg="#f4f6fa",
-            fg="#222222",
-            anchor="w"
-        ).pack(anchor="w", padx=12, pady=(0, 10))
+        # Choix de la période analysée
+        periods = {
+            "Mois": training_stats.month_period,
+            "Saison": training_stats.season_period,
+            "Année": training_stats.year_period,
+        }
+        period_var = tk.StringVar(popup, "Mois")
+        tk.OptionMenu(card, period_var, *periods, command=lambda _: render()).pack(pady=(0, 8))
 
-        # Séparateur
-        tk.Frame(resume_frame, bg="#e0e4ea", height=1).pack(fill="x", padx=8, pady=2)
+        content = tk.Frame(card, bg="#ffffff")
+        content.pack(fill="x")
+        attached = []  # figures affichées dans ce popup, détachées à la fermeture
 
-        # Nombre de séances par semaine (ISO)
-        tk.Label(
-            resume_frame,
-            text="Nombre de séances par semaine (ISO) :",
-            font=("Segoe UI", 11, "bold"),
-            bg="#f4f6fa",
-            fg="#222222",
-            anchor="w"
-        ).pack(anchor="w", padx=12, pady=(6, 0))
-        for week in weeks_in_month:
-            count = sum(1 for t in trainings if t.date.isocalendar()[1] == week)
+        def section_title(parent, text):
             tk.Label(
-                resume_frame,
-                text=f"  Semaine {week} : {count}",
-                font=("Segoe UI", 11),
+                parent,
+                text=text,
+                font=("Segoe UI", 11, "bold"),
                 bg="#f4f6fa",
                 fg="#222222",
                 anchor="w"
-            ).pack(anchor="w", padx=18)
-
-        # Séparateur
-        tk.Frame(resume_frame, bg="#e0e4ea", height=1).pack(fill="x", padx=8, pady=2)
+            ).pack(anchor="w", padx=12, pady=(6, 0))
 
-        # Répartition par catégorie
-        tk.Label(
-            resume_frame,
-            text="Répartition par catégorie :",
-            font=("Segoe UI", 11, "bold"),
-            bg="#f4f6fa",
-            fg="#222222",
-            anchor="w"
-        ).pack(anchor="w", padx=12, pady=(6, 0))
-        for cat, count in cat_counts.items():
+        def line(parent, text):
             tk.Label(
-                resume_frame,
-                text=f"  {cat} : {count}",
+                parent,
+                text=text,
                 font=("Segoe UI", 11),
                 bg="#f4f6fa",
                 fg="#222222",
                 anchor="w"
-            ).pack(anchor="w", padx=18, pady=(0, 2))
-
-        # Carte graphique
-        graph_card = tk.Frame(card, bg="#f4f6fa", bd=1, relief="solid", highlightbackground="#e0e4ea", highlightthickness=1)
-        graph_card.pack(pady=(0, 10), padx=18, fill="x")
-
-        if cat_counts:
-            fig, ax = plt.subplots(figsize=(3.2, 2.5), dpi=100)
-            ax.pie(cat_counts.values(), labels=cat_counts.keys(), autopct='%1.0f%%', startangle=90, textprops={'fontsize': 9, 'color': '#222222'})
-            ax.set_title("Répartition par catégorie", fontsize=11, color="#222222")
-            fig.patch.set_facecolor('#f4f6fa')
-            canvas_fig = FigureCanvasTkAgg(fig, master=graph_card)
-            canvas_fig.draw()
-            canvas_fig.get_tk_widget().pack(pady=10)
-        else:
-            tk.Label(
-                graph_card,
-                text="Aucune donnée pour ce mois.",
-                font=("Segoe UI", 11, "italic"),
-                bg="#f4f6fa",
-                fg="#888888"
-            ).pack(pady=30)
+            ).pack(anchor="w", padx=18)
+
+        def render():
+            for child in content.winfo_children():
+                child.destroy()
+            release()
+
+            # Agrégats calculés par SQLite (GROUP BY), quelle que soit la longueur de la période
+            period = period_var.get()
+            start, end = periods[period](self.current_date)
+            totals = training_stats.summary(start, end)
+            cat_stats = training_stats.by_category(start, end)
+            if period == "Mois":
+                title_label.config(text=f"Statistiques – {calendar.month_name[start.month].capitalize()} {start.year}")
+                breakdown_title = "Séances par semaine (ISO) :"
+                breakdown = {f"Semaine {week}": v for (_, week), v in training_stats.by_iso_week(start, end).items()}
+            else:
+                title_label.config(text=f"Statistiques – {period} {start.strftime('%m/%Y')} – {end.strftime('%m/%Y')}")
+                breakdown_title = "Séances par mois :"
+                breakdown = {f"{calendar.month_name[m].capitalize()} {y}": v
+                             for (y, m), v in training_stats.by_month(start, end).items()}
+
+            # Encadré résumé
+            resume_frame = tk.Frame(content, bg="#f4f6fa", bd=1, relief="solid", highlightbackground="#e0e4ea", highlightthickness=1)
+            resume_frame.pack(pady=(0, 12), padx=18, fill="x")
+
+            section_title(resume_frame, "Total :")
+            line(resume_frame, f"{totals['sessions']} séances – {format_minutes(totals['minutes'])}")
+
+            # Séparateur
+            tk.Frame(resume_frame, bg="#e0e4ea", height=1).pack(fill="x", padx=8, pady=2)
+
+            section_title(resume_frame, breakdown_title)
+            if period == "Mois":
+                for label, values in breakdown.items():
+                    line(resume_frame, f"  {label} : {values['sessions']} ({format_minutes(values['minutes'])})")
+            else:
+                # Mois sur deux colonnes pour laisser la place à la tendance hebdomadaire
+                months = tk.Frame(resume_frame, bg="#f4f6fa")
+                months.pack(anchor="w", padx=18)
+                for i, (label, values) in enumerate(breakdown.items()):
+                    tk.Label(months, text=f"{label} : {values['sessions']} ({format_minutes(values['minutes'])})",
+                             font=("Segoe UI", 10), bg="#f4f6fa", fg="#222222", anchor="w"
+                             ).grid(row=i // 2, column=i % 2, sticky="w", padx=(0, 12))
+
+                # Saison / année : séances par semaine et leur moyenne glissante sur 4 semaines
+                tk.Frame(resume_frame, bg="#e0e4ea", height=1).pack(fill="x", padx=8, pady=2)
+                section_title(resume_frame, "Séances par semaine (moyenne sur 4 semaines) :")
+                draw_trend(resume_frame, training_stats.weekly_trend(start, end))
+
+            # Séparateur
+            tk.Frame(resume_frame, bg="#e0e4ea", height=1).pack(fill="x", padx=8, pady=2)
+
+            # Répartition par catégorie
+            section_title(resume_frame, "Répartition par catégorie :")
+            for cat, values in cat_stats.items():
+                line(resume_frame, f"  {cat} : {values['sessions']} ({format_minutes(values['minutes'])})")
+            tk.Frame(resume_frame, bg="#f4f6fa", height=6).pack()
+
+            # Carte de chaleur jour x heure de début
+            heat_card = tk.Frame(content, bg="#f4f6fa", bd=1, relief="solid", highlightbackground="#e0e4ea", highlightthickness=1)
+            heat_card.pack(pady=(0, 12), padx=18, fill="x")
+            section_title(heat_card, "Séances par jour et heure de début :")
+            draw_heatmap(heat_card, training_stats.weekday_hour_heatmap(start, end))
+
+            # Carte graphique
+            graph_card = tk.Frame(content, bg="#f4f6fa", bd=1, relief="solid", highlightbackground="#e0e4ea", highlightthickness=1)
+            graph_card.pack(pady=(0, 10), padx=18, fill="x")
+
+            cat_counts = {cat: values["sessions"] for cat, values in cat_stats.items()}
+            if cat_counts:
+                # Figure unique réutilisée d'un popup à l'autre (matplotlib chargé au premier affichage)
+                fig = charts.category_pie(cat_counts)
+                attached.append(fig)
+                charts.attach(fig, graph_card).pack(pady=10)
+            else:
+                tk.Label(
+                    graph_card,
+                    text="Aucune donnée pour cette période.",
+                    font=("Segoe UI", 11, "italic"),
+                    bg="#f4f6fa",
+                    fg="#888888"
+                ).pack(pady=30)
+
+        def draw_heatmap(parent, grid):
+            hours = range(12, 22)
+            cell_w, cell_h, left, top = 30, 14, 26, 14
+            heat = tk.Canvas(parent, width=left + cell_w * len(hours) + 4, height=top + cell_h * 7 + 4,
+                             bg="#f4f6fa", highlightthickness=0)
+            heat.pack(pady=(4, 8))
+            peak = max((grid[d][h] for d in range(7) for h in hours), default=0) or 1
+            ramp = color_ramp("#f4f6fa", "#2d5286", 10)
+            for i, h in enumerate(hours):
+                heat.create_text(left + i * cell_w + cell_w // 2, top // 2, text=f"{h}h", font=("Segoe UI", 7), fill="#888888")
+            for d, day_label in enumerate("LMMJVSD"):
+                heat.create_text(left // 2, top + d * cell_h + cell_h // 2, text=day_label, font=("Segoe UI", 8), fill="#888888")
+                for i, h in enumerate(hours):
+                    value = grid[d][h]
+                    color = ramp[min(9, value * 10 // peak)] if value else "#ffffff"
+                    x, y = left + i * cell_w, top + d * cell_h
+                    heat.create_rectangle(x, y, x + cell_w - 2, y + cell_h - 2, fill=color, outline="#e0e4ea")
+
+        def draw_trend(parent, weeks):
+            bar_w, chart_h, left, bottom = 6, 70, 26, 14
+            trend = tk.Canvas(parent, width=left + bar_w * len(weeks) + 4, height=chart_h + bottom + 4,
+                              bg="#f4f6fa", highlightthickness=0)
+            trend.pack(pady=(4, 0))
+            peak = max((w["sessions"] for w in weeks), default=0) or 1
+            scale = (chart_h - 6) / peak
+            trend.create_text(left // 2, 6, text=str(peak), font=("Segoe UI", 7), fill="#888888")
+            trend.create_line(left, chart_h, left + bar_w * len(weeks), chart_h, fill="#e0e4ea")
+            average = []
+            for i, week in enumerate(weeks):
+                x = left + i * bar_w
+                if week["sessions"]:
+                    trend.create_rectangle(x, chart_h - week["sessions"] * scale, x + bar_w - 2, chart_h,
+                                           fill="#9fb3d1", outline="")
+                average += [x + bar_w / 2, chart_h - week["avg_sessions"] * scale]
+                # Abréviation du mois sous sa première semaine
+                monday = week["week_start"]
+                if monday.day <= 7:
+                    trend.create_text(x, chart_h + bottom // 2 + 2, text=calendar.month_name[monday.month][:3],
+                                      font=("Segoe UI", 7), fill="#888888", anchor="w")
+            if len(average) >= 4:
+                trend.create_line(*average, fill="#2d5286", width=2)
+            if weeks:
+                last = weeks[-1]
+                line(parent, f"Dernière semaine : {last['sessions']} séances – "
+                             f"moyenne sur 4 semaines : {last['avg_sessions']:.1f} ({format_minutes(round(last['avg_minutes']))})")
+
+        def release():
+            for fig in attached:
+                charts.detach(fig)
+            attached.clear()
+
+        def close():
+            release()
+            popup.destroy()
+
+        render()
 
         # Bouton fermer
         tk.Button(
             card,
             text="Fermer",
-            command=popup.destroy,
+            command=close,
             font=("Segoe UI", 10, "bold"),
             bg="#e0e4ea",
             fg="#2d3a4a",
@@ -773,4 +1055,5 @@ class WeeklyPlanner(tk.Frame):
             padx=12,
             pady=4,
             cursor="hand2"
-        ).pack(pady=18)
\ No newline at end of file
+        ).pack(pady=12)
+        popup.protocol("WM_DELETE_WINDOW", close)
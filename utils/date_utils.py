@@ -1,5 +1,19 @@
-from datetime import date, timedelta
+from datetime import date, time, timedelta
+
+# Table minute -> time précalculée : un seul objet time par minute de la journée
+MINUTE_TIMES = tuple(time(m // 60, m % 60) for m in range(24 * 60))
 
 def get_week_dates(reference_date):
     monday = reference_date - timedelta(days=reference_date.weekday())
     return [monday + timedelta(days=i) for i in range(7)]
+
+def time_to_minutes(t):
+    return t.hour * 60 + t.minute
+
+def minutes_to_time(minutes):
+    return MINUTE_TIMES[minutes]
+
+def format_minutes(minutes):
+    """Durée lisible : 90 -> "1 h 30"."""
+    hours, rest = divmod(minutes or 0, 60)
+    return f"{hours} h {rest:02}" if rest else f"{hours} h"
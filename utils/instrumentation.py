@@ -0,0 +1,157 @@
+# utils/instrumentation.py
+"""
+Chronomètres et compteurs des chemins critiques (base, rendu, export).
+
+    @timed("db.get_trainings_for_week")
+    def get_trainings_for_week(...): ...
+
+    with span("ui.render_events"):
+        ...
+    count("sqlite.rows", len(rows))
+
+Désactivé par défaut : un appel instrumenté ne coûte alors qu'un test de booléen.
+Une fois activé (F12 dans l'application), chaque mesure est cumulée par nom ;
+begin_frame() / end_frame() isolent ce qui s'est passé pendant un redessin,
+et les dernières mesures peuvent être écrites au format Chrome Trace
+(chrome://tracing ou ui.perfetto.dev) avec dump_trace().
+"""
+import json
+import os
+import threading
+import time as timer
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+MAX_TRACE_EVENTS = 50_000
+
+
+class _State:
+    enabled = False
+
+
+_state = _State()
+_lock = threading.Lock()
+_totals = {}                              # nom -> [appels, secondes]
+_counters = {}                            # nom -> valeur
+_trace = deque(maxlen=MAX_TRACE_EVENTS)   # (nom, début en s, durée en s, thread)
+_frame_start = None                       # copie de _totals / _counters au début de la frame
+last_frame = {"spans": {}, "counters": {}, "seconds": 0.0}
+
+
+def is_enabled():
+    return _state.enabled
+
+
+def enable(flag=True):
+    _state.enabled = flag
+
+
+def reset():
+    global _frame_start
+    with _lock:
+        _totals.clear()
+        _counters.clear()
+        _trace.clear()
+        _frame_start = None
+
+
+def _record(name, start, seconds):
+    with _lock:
+        total = _totals.get(name)
+        if total is None:
+            _totals[name] = [1, seconds]
+        else:
+            total[0] += 1
+            total[1] += seconds
+        _trace.append((name, start, seconds, threading.get_ident()))
+
+
+@contextmanager
+def _measure(name):
+    start = timer.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, start, timer.perf_counter() - start)
+
+
+def span(name):
+    """Context manager qui chronomètre le bloc sous le nom name (sans effet si désactivé)."""
+    if not _state.enabled:
+        return nullcontext()
+    return _measure(name)
+
+
+def timed(name):
+    """Décorateur : chronomètre chaque appel de la fonction sous le nom name."""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            start = timer.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, start, timer.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def count(name, value=1):
+    if not _state.enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+# --- Frames (un redessin de la semaine) ---
+
+def begin_frame():
+    global _frame_start
+    if not _state.enabled:
+        return
+    with _lock:
+        _frame_start = ({name: tuple(total) for name, total in _totals.items()}, dict(_counters), timer.perf_counter())
+
+
+def end_frame():
+    """Mesures et compteurs depuis begin_frame() : {"spans": {nom: (appels, s)}, "counters", "seconds"}."""
+    global _frame_start, last_frame
+    if not _state.enabled or _frame_start is None:
+        return last_frame
+    with _lock:
+        totals, counters, start = _frame_start
+        spans = {}
+        for name, (calls, seconds) in _totals.items():
+            before = totals.get(name, (0, 0.0))
+            if calls > before[0]:
+                spans[name] = (calls - before[0], seconds - before[1])
+        frame_counters = {name: value - counters.get(name, 0)
+                          for name, value in _counters.items() if value != counters.get(name, 0)}
+        _frame_start = None
+    last_frame = {"spans": spans, "counters": frame_counters, "seconds": timer.perf_counter() - start}
+    return last_frame
+
+
+def snapshot():
+    """Cumuls depuis l'activation : {"spans": {nom: (appels, s)}, "counters": {...}}."""
+    with _lock:
+        return {"spans": {name: tuple(total) for name, total in _totals.items()}, "counters": dict(_counters)}
+
+
+def dump_trace(filename):
+    """Écrit les dernières mesures au format Chrome Trace (JSON). Retourne le nombre d'événements."""
+    with _lock:
+        events = list(_trace)
+        counters = dict(_counters)
+    pid = os.getpid()
+    trace_events = [
+        {"name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": pid, "tid": tid,
+         "ts": start * 1e6, "dur": seconds * 1e6}
+        for name, start, seconds, tid in events
+    ]
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace_events, "otherData": {"counters": counters}}, f)
+    return len(trace_events)
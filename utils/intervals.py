@@ -0,0 +1,87 @@
+# utils/intervals.py
+"""
+Index d'intervalles [début, fin) d'une journée (en minutes) : chevauchements et
+disposition en colonnes des séances qui se recouvrent.
+"""
+from bisect import bisect_left, bisect_right
+
+
+class IntervalIndex:
+    """
+    Intervalles d'une journée triés par début, avec la plus grande durée de l'index.
+
+    Un intervalle qui chevauche [start, end) commence avant end et au plus
+    max_length minutes avant start : deux recherches dichotomiques bornent les candidats,
+    soit O(log n + k) tant que les durées restent du même ordre (au plus une soirée).
+    """
+
+    __slots__ = ("_entries", "_starts", "max_length")
+
+    def __init__(self, intervals=()):
+        # Entrées (start, end, clé) triées ; _starts reprend les débuts pour bisect
+        self._entries = sorted(intervals)
+        self._starts = [entry[0] for entry in self._entries]
+        self.max_length = max((end - start for start, end, _ in self._entries), default=0)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def add(self, start, end, key):
+        entry = (start, end, key)
+        index = bisect_right(self._entries, entry)
+        self._entries.insert(index, entry)
+        self._starts.insert(index, start)
+        self.max_length = max(self.max_length, end - start)
+
+    def remove(self, key):
+        # max_length n'est pas recalculé : il reste un majorant, les recherches restent exactes
+        for index, entry in enumerate(self._entries):
+            if entry[2] == key:
+                del self._entries[index]
+                del self._starts[index]
+                return True
+        return False
+
+    def overlapping(self, start, end, exclude=None):
+        """Clés des intervalles qui chevauchent [start, end), par début croissant."""
+        first = bisect_left(self._starts, start - self.max_length + 1)
+        last = bisect_left(self._starts, end)
+        return [key for s, e, key in self._entries[first:last] if e > start and key != exclude]
+
+    def layout_columns(self):
+        """
+        Colonnes d'affichage des intervalles qui se chevauchent : {clé: (colonne, nombre de colonnes)}.
+        Chaque intervalle prend la première colonne libre ; les intervalles d'un même groupe
+        de chevauchements partagent le même nombre de colonnes.
+        """
+        layout = {}
+        group, column_ends, group_end = [], [], None
+        for start, end, key in self._entries:
+            if group and start >= group_end:
+                # Fin du groupe : plus rien ne chevauche ce qui précède
+                for member, column in group:
+                    layout[member] = (column, len(column_ends))
+                group, column_ends = [], []
+            for column, column_end in enumerate(column_ends):
+                if column_end <= start:
+                    column_ends[column] = end
+                    break
+            else:
+                column = len(column_ends)
+                column_ends.append(end)
+            group.append((key, column))
+            group_end = end if len(group) == 1 else max(group_end, end)
+        for member, column in group:
+            layout[member] = (column, len(column_ends))
+        return layout
+
+
+def index_by_day(days, starts, ends, keys):
+    """{jour: IntervalIndex} depuis des colonnes parallèles (par exemple celles d'un TrainingBatch)."""
+    per_day = {}
+    for day, start, end, key in zip(days, starts, ends, keys):
+        per_day.setdefault(day, []).append((start, end, key))
+    return {day: IntervalIndex(intervals) for day, intervals in per_day.items()}
@@ -0,0 +1,52 @@
+# utils/startup_profile.py
+"""
+Mesure du temps de démarrage, phase par phase (python main.py --profile-startup).
+
+Les phases peuvent être imbriquées (le premier draw_table fait partie de la construction
+de l'interface) ; le total ne compte que les phases de premier niveau.
+Désactivé par défaut : phase() ne coûte alors qu'un test.
+"""
+import time as timer
+from contextlib import contextmanager, nullcontext
+
+
+class StartupProfile:
+    def __init__(self):
+        self.enabled = False
+        self.phases = []  # (profondeur, nom, durée en s), dans l'ordre de début
+        self._depth = 0
+
+    def phase(self, name):
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name):
+        index = len(self.phases)
+        self.phases.append((self._depth, name, 0.0))
+        self._depth += 1
+        t0 = timer.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[index] = (self._depth, name, timer.perf_counter() - t0)
+
+    def total(self):
+        return sum(seconds for depth, _, seconds in self.phases if depth == 0)
+
+    def as_dict(self):
+        return {"phases": [{"name": name, "depth": depth, "ms": seconds * 1000} for depth, name, seconds in self.phases],
+                "total_ms": self.total() * 1000}
+
+    def report(self):
+        lines = ["Démarrage :"]
+        for depth, name, seconds in self.phases:
+            lines.append(f"  {'  ' * depth}{name:<{34 - 2 * depth}} {seconds * 1000:>8.1f} ms")
+        lines.append(f"  {'total jusqu’au premier affichage':<34} {self.total() * 1000:>8.1f} ms")
+        return "\n".join(lines)
+
+
+# Profil partagé par main.py et les modules qui y découpent des sous-phases
+startup_profile = StartupProfile()
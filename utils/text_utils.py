@@ -0,0 +1,8 @@
+import unicodedata
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def fold_text(text):
+    """Minuscules sans accents : "Entraînement" -> "entrainement" (même règle que l'index FTS5)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))